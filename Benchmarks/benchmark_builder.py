@@ -0,0 +1,248 @@
+"""
+Benchmark suite of 'PyQT5_GUI_Builder' - builds synthetic layouts headless (Qt 'offscreen' platform) and writes the
+results as JSON. Results can be compared against baseline file - the script exits with code 1 if any measured median
+time is slower than the baseline by more than given threshold and by more than given absolute floor (so the noise of
+very short times is not reported). Only end-to-end times are compared by default, the times of build phases are
+compared with '--compare-phases' option.
+
+Usage:
+    python Benchmarks/benchmark_builder.py --output results.json
+    python Benchmarks/benchmark_builder.py --output new.json --baseline results.json --threshold 0.1
+    python Benchmarks/benchmark_builder.py --baseline results.json --min-delta-ms 0.1 --compare-phases
+"""
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from collections import defaultdict
+import statistics
+import argparse
+import platform
+import tempfile
+import json
+import time
+
+from PyQt5 import QtWidgets, QtCore
+
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder, BuildTraceRecorder
+from synthetic_config import SyntheticConfigGenerator, SyntheticBaseObject
+
+
+class BuilderBenchmark:
+    """
+    Class to run benchmark scenarios - every scenario is a synthetic layout built many times.
+    """
+
+    PHASES = ('parse', 'common_data', 'resolution', 'construction', 'features', 'layout_insertion')
+    # Build phase of every category of instrumentation events.
+    EVENT_PHASES = {'parse': 'parse', 'common_data': 'common_data', 'resolve': 'resolution',
+                    'construct': 'construction', 'component': 'construction', 'feature': 'features',
+                    'layout': 'layout_insertion', 'insert': 'layout_insertion', 'build': 'layout_insertion'}
+
+    # Parameters of 'SyntheticConfigGenerator.generateConfig' for every scenario.
+    SCENARIOS = {
+        'small': dict(components=10, depth=1, features=1),
+        'nested': dict(components=10, depth=6, features=1),
+        'grid': dict(components=2, depth=1, grid_rows=30, grid_columns=10, features=1),
+        'feature_heavy': dict(components=40, depth=2, features=6),
+        'var_dense': dict(components=40, depth=2, features=3, var_density=0.8),
+    }
+
+    def __init__(self, repeats: int = 15, work_dir: str = None):
+        """
+        :param repeats: Number of builds measured for every metric.
+        :param work_dir: Directory for synthetic XML files. If not given, temporary directory is used.
+        """
+        self.repeats = repeats
+        self.work_dir = work_dir or tempfile.mkdtemp(prefix='gui_builder_bench_')
+
+    def runScenarios(self, scenario_names: list = None) -> dict:
+        """
+        Runs given scenarios (or all of them).
+
+        :param scenario_names: List of names of scenarios to be run. If not given, all scenarios are run.
+        :return: Dictionary with the results - ready to be written as JSON.
+        """
+        results = {'meta': {'python': platform.python_version(),
+                            'qt': QtCore.QT_VERSION_STR,
+                            'pyqt': QtCore.PYQT_VERSION_STR,
+                            'platform': platform.platform(),
+                            'repeats': self.repeats,
+                            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')},
+                   'scenarios': dict()}
+
+        for scenario_name in scenario_names or list(self.SCENARIOS):
+            results['scenarios'][scenario_name] = self.runScenario(scenario_name, self.SCENARIOS[scenario_name])
+
+        return results
+
+    def runScenario(self, scenario_name: str, params: dict) -> dict:
+        """
+        Runs single scenario - measures end-to-end time of 'returnGuiLayout' (with cold and warm cache), of compiled
+        plan build and exclusive time of every build phase.
+
+        :param scenario_name: Name of the scenario.
+        :param params: Parameters of synthetic config file.
+        :return: Dictionary with the results of the scenario.
+        """
+        config_filepath = os.path.join(self.work_dir, scenario_name + '.xml')
+        layout_name = SyntheticConfigGenerator.generateConfig(config_filepath, **params)
+        base_object = SyntheticBaseObject()
+
+        end_to_end = {
+            'cold': self.measureCalls(lambda: PyQT5_GUI_Builder.returnGuiLayout(
+                config_filepath, layout_name, base_object, use_cache=False, use_generated=False)),
+            'warm': self.measureCalls(lambda: PyQT5_GUI_Builder.returnGuiLayout(
+                config_filepath, layout_name, base_object, use_generated=False)),
+            'compiled_plan': self.measureCalls(lambda: PyQT5_GUI_Builder.compileLayout(
+                config_filepath, layout_name).build(base_object)),
+        }
+
+        # Exclusive time of phases - measured in separate runs, because the instrumentation adds overhead.
+        phases_ms = defaultdict(list)
+        trace_recorder = BuildTraceRecorder()
+        PyQT5_GUI_Builder.instrumentation = trace_recorder
+        try:
+            for _ in range(self.repeats):
+                trace_recorder.clear()
+                self.releaseLayout(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, layout_name, base_object,
+                                                                     use_cache=False, use_generated=False))
+                phases_ns = defaultdict(int)
+                for category, self_ns in trace_recorder.returnSelfTimesByCategory().items():
+                    phases_ns[self.EVENT_PHASES.get(category)] += self_ns
+                for phase in self.PHASES:
+                    phases_ms[phase].append(phases_ns[phase] / 1e6)
+        finally:
+            PyQT5_GUI_Builder.instrumentation = None
+
+        return {'params': params,
+                'components_count': self.countComponents(config_filepath),
+                'end_to_end_ms': end_to_end,
+                'phases_ms': {phase: statistics.median(times) for phase, times in phases_ms.items()}}
+
+    def measureCalls(self, build_function) -> dict:
+        """
+        Measures the time of given build function - it is called once for warm-up and then 'repeats' times.
+
+        :param build_function: Callable without arguments that returns QLayout object.
+        :return: Dictionary with minimum, median and mean time in milliseconds.
+        """
+        self.releaseLayout(build_function())
+
+        times_ms = list()
+        for _ in range(self.repeats):
+            start_ns = time.perf_counter_ns()
+            gui_layout = build_function()
+            times_ms.append((time.perf_counter_ns() - start_ns) / 1e6)
+            self.releaseLayout(gui_layout)
+
+        return {'min': min(times_ms), 'median': statistics.median(times_ms), 'mean': statistics.mean(times_ms)}
+
+    @staticmethod
+    def releaseLayout(gui_layout: QtWidgets.QLayout):
+        """
+        Deletes built layout with all its widgets - so the measured builds do not accumulate memory.
+
+        :param gui_layout: QLayout object to be deleted.
+        :return: None
+        """
+        host_widget = QtWidgets.QWidget()
+        host_widget.setLayout(gui_layout)
+        host_widget.deleteLater()
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+    @staticmethod
+    def countComponents(config_filepath: str) -> int:
+        """
+        Returns the number of 'component' nodes in given XML file.
+
+        :param config_filepath: String path to XML config file.
+        :return: Number of components.
+        """
+        parsed_config = PyQT5_GUI_Builder.loadParsedConfig(config_filepath)
+        return sum(1 for _ in parsed_config.config_tree.iter('component'))
+
+    @staticmethod
+    def compareResults(results: dict, baseline: dict, threshold: float, min_delta_ms: float = 0.05,
+                       compare_phases: bool = False) -> list:
+        """
+        Compares median times of the results with baseline results. The slowdown is a regression only if it exceeds
+        both the relative threshold and the absolute floor.
+
+        :param results: Dictionary with the current results.
+        :param baseline: Dictionary with the baseline results.
+        :param threshold: Allowed relative slowdown - e.g. 0.1 for 10%.
+        :param min_delta_ms: Allowed absolute slowdown in milliseconds - smaller differences are treated as noise.
+        :param compare_phases: If True, the times of build phases are compared too - not only end-to-end times.
+        :return: List of tuples - ( metric name, baseline ms, current ms, relative change, is regression ).
+        """
+        comparison = list()
+
+        for scenario_name, scenario in results['scenarios'].items():
+            baseline_scenario = baseline.get('scenarios', dict()).get(scenario_name)
+            if baseline_scenario is None:
+                continue
+
+            metrics = [('end_to_end.' + name, scenario['end_to_end_ms'][name]['median'],
+                        baseline_scenario.get('end_to_end_ms', dict()).get(name, dict()).get('median'))
+                       for name in scenario['end_to_end_ms']]
+            if compare_phases:
+                metrics += [('phases.' + name, value, baseline_scenario.get('phases_ms', dict()).get(name))
+                            for name, value in scenario['phases_ms'].items()]
+
+            for metric_name, current_ms, baseline_ms in metrics:
+                if not baseline_ms:
+                    continue
+                change = (current_ms - baseline_ms) / baseline_ms
+                comparison.append((scenario_name + '.' + metric_name, baseline_ms, current_ms, change,
+                                   change > threshold and current_ms - baseline_ms > min_delta_ms))
+
+        return comparison
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark of PyQT5_GUI_Builder on synthetic layouts.')
+    parser.add_argument('--output', help='Path of JSON file for the results (printed to stdout if not given).')
+    parser.add_argument('--baseline', help='Path of JSON file with baseline results to compare against.')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Allowed relative slowdown against baseline (default: 0.1).')
+    parser.add_argument('--min-delta-ms', type=float, default=0.05,
+                        help='Allowed absolute slowdown in ms - smaller differences are noise (default: 0.05).')
+    parser.add_argument('--compare-phases', action='store_true',
+                        help='Compare also the times of build phases - not only end-to-end times.')
+    parser.add_argument('--repeats', type=int, default=15, help='Number of measured builds per metric.')
+    parser.add_argument('--scenario', action='append', choices=list(BuilderBenchmark.SCENARIOS),
+                        help='Scenario to be run - can be given many times (default: all scenarios).')
+    args = parser.parse_args(argv)
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    results = BuilderBenchmark(args.repeats).runScenarios(args.scenario)
+
+    results_json = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(results_json)
+    else:
+        print(results_json)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)
+
+    comparison = BuilderBenchmark.compareResults(results, baseline, args.threshold, args.min_delta_ms,
+                                                 args.compare_phases)
+    for metric_name, baseline_ms, current_ms, change, is_regression in comparison:
+        print('{:<50} {:>10.3f} ms {:>10.3f} ms {:>+8.1%} {}'.format(metric_name, baseline_ms, current_ms, change,
+                                                                     'REGRESSION' if is_regression else ''))
+
+    return 1 if any(entry[4] for entry in comparison) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,189 @@
+import xml.etree.ElementTree as ET
+import random
+
+
+class SyntheticBaseObject:
+    """
+    Base object for synthetic layouts - contains attributes referenced by 'var' arguments with 'parent_type_id' = "2".
+    """
+    tooltip_text = 'Tooltip read from base object'
+
+    def __init__(self):
+        self.clicks_count = 0
+
+    def onClicked(self):
+        """
+        Method connected to QPushButton objects of synthetic layouts.
+
+        :return: None
+        """
+        self.clicks_count += 1
+
+
+class SyntheticConfigGenerator:
+    """
+    Class to generate XML config files in the schema read by 'PyQT5_GUI_Builder' - with configurable number of
+    components, nesting depth, grid size, number of features per component and density of 'var' arguments.
+    """
+
+    LAYOUT_NAME = 'synthetic_layout'
+    # Module whose object is referenced by 'var' arguments with 'parent_type_id' = "1".
+    VAR_MODULE_NAME = 'string'
+    VAR_MODULE_OBJECT = 'ascii_letters'
+
+    MODULES = ('PyQt5.QtWidgets', VAR_MODULE_NAME)
+    CLASSES = ('QVBoxLayout', 'QHBoxLayout', 'QGridLayout', 'QLabel', 'QLineEdit', 'QPushButton')
+    WIDGET_CLASSES = ('QLabel', 'QLineEdit', 'QPushButton')
+
+    @classmethod
+    def generateConfig(cls, config_filepath: str, components: int = 10, depth: int = 1, grid_rows: int = 0,
+                       grid_columns: int = 0, features: int = 1, var_density: float = 0.0, seed: int = 0) -> str:
+        """
+        Writes synthetic XML config file with single layout. The root layout is QVBoxLayout with given number of
+        widgets and one nested QHBoxLayout - which contains the same number of widgets and its own nested layout, and
+        so on, up to given depth. If grid size is given, the innermost layout contains also QGridLayout with one
+        QLabel per cell.
+
+        :param config_filepath: String path of XML file to be written.
+        :param components: Number of widgets in every layout.
+        :param depth: Number of nested layouts levels.
+        :param grid_rows: Number of rows of the innermost QGridLayout (0 - no grid).
+        :param grid_columns: Number of columns of the innermost QGridLayout (0 - no grid).
+        :param features: Number of features of every widget.
+        :param var_density: Fraction (0 - 1) of features' arguments that are 'var' arguments.
+        :param seed: Seed of random generator that chooses 'var' arguments - the same seed gives the same file.
+        :return: Name of the generated layout.
+        """
+        randomizer = random.Random(seed)
+        body_node = ET.Element('body')
+
+        common_node = ET.SubElement(body_node, 'common')
+        modules_node = ET.SubElement(common_node, 'modules')
+        for module_id, module_name in enumerate(cls.MODULES):
+            ET.SubElement(modules_node, 'module', name=module_name, id=str(module_id))
+        classes_node = ET.SubElement(common_node, 'classes')
+        for class_id, class_name in enumerate(cls.CLASSES):
+            ET.SubElement(classes_node, 'class', name=class_name, id=str(class_id))
+        parents_node = ET.SubElement(common_node, 'parent_object_types')
+        for parent_id, parent_desc in enumerate(('current object', 'module', 'base object')):
+            ET.SubElement(parents_node, 'parent', desc=parent_desc, id=str(parent_id))
+
+        layouts_node = ET.SubElement(body_node, 'layouts')
+        layout_node = ET.SubElement(layouts_node, 'layout', name=cls.LAYOUT_NAME, id='0')
+        cls.appendLayoutContent(layout_node, 'QVBoxLayout', components, depth, grid_rows, grid_columns, features,
+                                var_density, randomizer, [0])
+
+        ET.ElementTree(body_node).write(config_filepath, encoding='UTF-8', xml_declaration=True)
+
+        return cls.LAYOUT_NAME
+
+    @classmethod
+    def appendLayoutContent(cls, layout_node: ET.Element, layout_class: str, components: int, depth: int,
+                            grid_rows: int, grid_columns: int, features: int, var_density: float,
+                            randomizer: random.Random, widget_counter: list):
+        """
+        Recursive class method that fills given 'layout' node with components.
+
+        :param layout_node: xml.etree.ElementTree.Element object that represents 'layout' XML node to be filled.
+        :param layout_class: Name of the class of the layout.
+        :param components: Number of widgets in the layout.
+        :param depth: Number of nested layouts levels below this one.
+        :param grid_rows: Number of rows of the innermost QGridLayout.
+        :param grid_columns: Number of columns of the innermost QGridLayout.
+        :param features: Number of features of every widget.
+        :param var_density: Fraction of features' arguments that are 'var' arguments.
+        :param randomizer: random.Random object.
+        :param widget_counter: One-element list with the number of the next widget - used for unique object names.
+        :return: None
+        """
+        components_node = ET.SubElement(layout_node, 'components')
+        ET.SubElement(components_node, 'component', type='self', module_id='0',
+                      class_id=str(cls.CLASSES.index(layout_class)))
+
+        for widget_index in range(components):
+            cls.appendWidget(components_node, cls.WIDGET_CLASSES[widget_index % len(cls.WIDGET_CLASSES)], features,
+                             var_density, randomizer, widget_counter)
+
+        if depth > 1:
+            nested_node = ET.SubElement(components_node, 'layout', name='level_' + str(depth - 1))
+            cls.appendLayoutContent(nested_node, 'QHBoxLayout', components, depth - 1, grid_rows, grid_columns,
+                                    features, var_density, randomizer, widget_counter)
+        elif grid_rows and grid_columns:
+            grid_node = ET.SubElement(components_node, 'layout', name='grid')
+            grid_components = ET.SubElement(grid_node, 'components')
+            ET.SubElement(grid_components, 'component', type='self', module_id='0',
+                          class_id=str(cls.CLASSES.index('QGridLayout')))
+            for row in range(grid_rows):
+                for column in range(grid_columns):
+                    cls.appendWidget(grid_components, 'QLabel', features, var_density, randomizer, widget_counter,
+                                     {'row': str(row), 'column': str(column)})
+
+    @classmethod
+    def appendWidget(cls, components_node: ET.Element, class_name: str, features: int, var_density: float,
+                     randomizer: random.Random, widget_counter: list, placement: dict = None):
+        """
+        Appends 'component' node of single widget.
+
+        :param components_node: xml.etree.ElementTree.Element object that represents 'components' XML node.
+        :param class_name: Name of the class of the widget.
+        :param features: Number of features of the widget.
+        :param var_density: Fraction of features' arguments that are 'var' arguments.
+        :param randomizer: random.Random object.
+        :param widget_counter: One-element list with the number of the next widget.
+        :param placement: Dictionary with 'row' and 'column' attributes - for widgets placed in QGridLayout.
+        :return: None
+        """
+        widget_number = widget_counter[0]
+        widget_counter[0] += 1
+
+        component_node = ET.SubElement(components_node, 'component', type='widget', module_id='0',
+                                       class_id=str(cls.CLASSES.index(class_name)), **(placement or {}))
+        args_node = ET.SubElement(component_node, 'constructor_args')
+        ET.SubElement(args_node, 'arg', value=class_name + ' ' + str(widget_number), type='str', kind='unnamed')
+        ET.SubElement(args_node, 'arg', value='widget_' + str(widget_number), type='str', kind='named',
+                      arg_name='objectName')
+
+        if not features:
+            return
+
+        features_node = ET.SubElement(component_node, 'features')
+        for feature_index in range(features):
+            feature_node = ET.SubElement(features_node, 'feature')
+            feature_args = ET.SubElement(feature_node, 'feature_args')
+            setting_attrs = ET.SubElement(feature_node, 'setting_attributes')
+
+            feature_kind = feature_index % 3
+            if feature_kind == 0:
+                ET.SubElement(feature_args, 'arg', value=str(100 + feature_index), type='int', kind='unnamed')
+                ET.SubElement(feature_args, 'arg', value='30', type='int', kind='unnamed')
+                ET.SubElement(setting_attrs, 'component_attr', parent_type_id='0', name='setMinimumSize')
+            elif feature_kind == 1 and class_name == 'QPushButton':
+                cls.appendTextArg(feature_args, 'onClicked', var_density, randomizer, method=True)
+                ET.SubElement(setting_attrs, 'component_attr', parent_type_id='0', name='clicked')
+                ET.SubElement(setting_attrs, 'component_attr', parent_type_id='0', name='connect')
+            else:
+                cls.appendTextArg(feature_args, 'Tooltip ' + str(widget_number), var_density, randomizer)
+                ET.SubElement(setting_attrs, 'component_attr', parent_type_id='0', name='setToolTip')
+
+    @classmethod
+    def appendTextArg(cls, args_node: ET.Element, value: str, var_density: float, randomizer: random.Random,
+                      method: bool = False):
+        """
+        Appends single argument - plain string or 'var' argument, depending on 'var' arguments density.
+
+        :param args_node: xml.etree.ElementTree.Element object that represents list of arguments.
+        :param value: String value of plain argument (or the name of base object's method, if 'method' is True).
+        :param var_density: Fraction of arguments that are 'var' arguments.
+        :param randomizer: random.Random object.
+        :param method: If True, the argument is always 'var' argument that references method of base object.
+        :return: None
+        """
+        if method:
+            ET.SubElement(args_node, 'arg', value=value, type='var', kind='unnamed', parent_type_id='2')
+        elif randomizer.random() >= var_density:
+            ET.SubElement(args_node, 'arg', value=value, type='str', kind='unnamed')
+        elif randomizer.random() < 0.5:
+            ET.SubElement(args_node, 'arg', value=cls.VAR_MODULE_OBJECT, type='var', kind='unnamed',
+                          parent_type_id='1', module_id=str(cls.MODULES.index(cls.VAR_MODULE_NAME)))
+        else:
+            ET.SubElement(args_node, 'arg', value='tooltip_text', type='var', kind='unnamed', parent_type_id='2')
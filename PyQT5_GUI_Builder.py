@@ -1,8 +1,119 @@
-from PyQt5 import QtWidgets as QtWidgets
-from importlib import *
-from enum import *
+from __future__ import annotations
+from importlib import import_module, reload
+from enum import Enum
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from typing import NamedTuple
+from string import Template
+import importlib.util
+import threading
+import weakref
+import struct
+import mmap
+import json
+import keyword
+import hashlib
+import time
+import re
 import sys
+import os
+
+
+class LazyModule:
+    """
+    Proxy of the module that is imported on the first access to any of its attributes. After the import, all
+    attributes of the module are copied to the proxy - so next accesses are as fast as for the module itself.
+    Time of every import made by this class (also by 'importModule' method) is stored in 'import_costs' dictionary.
+    """
+
+    # Import time (in ns) of the modules imported by 'importModule' method - keyed on the name of the module. Time of
+    # importing the module includes the time of importing all modules it imports.
+    import_costs = dict()
+
+    def __init__(self, module_name: str):
+        """
+        :param module_name: String name of the module.
+        """
+        self.__dict__['_module_name'] = module_name
+        self.__dict__['_module'] = None
+
+    @classmethod
+    def importModule(cls, module_name: str):
+        """
+        Returns given module - the module is imported (and the time of import is stored) if it is not imported yet.
+
+        :param module_name: String name of the module.
+        :return: Module object.
+        """
+        module = sys.modules.get(module_name)
+        if module is not None:
+            return module
+
+        start_ns = time.perf_counter_ns()
+        module = import_module(module_name)
+        cls.import_costs.setdefault(module_name, time.perf_counter_ns() - start_ns)
+
+        return module
+
+    @classmethod
+    def returnImportCosts(cls) -> list:
+        """
+        Returns the time of imports made by this class - sorted from the slowest one.
+
+        :return: List of tuples - ( module name, import time in ms ).
+        """
+        return sorted(((module_name, cost_ns / 1e6) for module_name, cost_ns in cls.import_costs.items()),
+                      key=lambda module_cost: -module_cost[1])
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        :return: True if the module is already imported.
+        """
+        return self._module is not None
+
+    def returnModule(self):
+        """
+        Returns the module - it is imported if needed.
+
+        :return: Module object.
+        """
+        if self._module is None:
+            module = self.importModule(self._module_name)
+            self.__dict__.update(module.__dict__)
+            self.__dict__['_module'] = module
+
+        return self._module
+
+    def __getattr__(self, attr_name: str):
+        # Called only for names missing in the copied dictionary of the module - also after the module is loaded,
+        # because some modules (e.g. 'concurrent.futures') provide names through module-level '__getattr__'.
+        return getattr(self.returnModule(), attr_name)
+
+    def __repr__(self) -> str:
+        return '<lazy module ' + repr(self._module_name) + (' (loaded)>' if self._module is not None else '>')
+
+
+# PyQt5 modules and Qt classes of the builder are imported on first use - so importing this module is fast.
+QtWidgets = LazyModule('PyQt5.QtWidgets')
+QtCore = LazyModule('PyQt5.QtCore')
+# Modules used only by asynchronous builds.
+asyncio = LazyModule('asyncio')
+futures = LazyModule('concurrent.futures')
+Widgets = LazyModule('PyQT5_GUI_Builder_Widgets')
+# Names of the classes defined in 'PyQT5_GUI_Builder_Widgets' module - available also as attributes of this module.
+WIDGETS_CLASSES_NAMES = ('DeferredLayoutWidget', 'VirtualGridModel', 'VirtualGridView', 'LiveComponent',
+                         'LiveLayoutReloader', 'BuildTransaction', 'GuiThreadInvoker', 'MainWindow')
+
+
+def __getattr__(attr_name: str):
+    if attr_name in WIDGETS_CLASSES_NAMES:
+        return getattr(Widgets, attr_name)
+
+    raise AttributeError('module ' + repr(__name__) + ' has no attribute ' + repr(attr_name))
 
 
 class XmlNodeNames(Enum):
@@ -21,6 +132,10 @@ class XmlNodeNames(Enum):
     FEATURES_LIST = 'features'
     FEATURE_PARAMS = 'feature_args'
     FEATURE_SETTING_ATTRS = 'setting_attributes'
+    TEMPLATES_LIST = 'templates'
+    TEMPLATE_NODE = 'template'
+    REPEAT_NODE = 'repeat'
+    INCLUDE_NODE = 'include'
 
 
 class XmlAttrsNames(Enum):
@@ -34,6 +149,9 @@ class XmlAttrsNames(Enum):
     PARENT_DESC = 'desc'
     PARENT_ID = 'id'
     LAYOUT_NAME = 'name'
+    LAYOUT_ID = 'id'
+    LAYOUT_DEFERRED = 'deferred'
+    LAYOUT_VIRTUAL = 'virtual'
     COMPONENT_TYPE = 'type'
     COMPONENT_CLASS_ID = 'class_id'
     COMPONENT_MODULE_ID = 'module_id'
@@ -46,6 +164,14 @@ class XmlAttrsNames(Enum):
     PARENT_TYPE_ID = 'parent_type_id'
     PARENT_MODULE_ID = 'module_id'
     SETTING_ATTR_NAME = 'name'
+    TEMPLATE_NAME = 'name'
+    REPEAT_TEMPLATE = 'template'
+    REPEAT_COUNT = 'count'
+    REPEAT_ITEMS = 'items'
+    REPEAT_START = 'start'
+    REPEAT_INDEX_NAME = 'index_name'
+    REPEAT_ITEM_NAME = 'item_name'
+    INCLUDE_FILE = 'file'
 
 
 class XmlCommonAttrValues(Enum):
@@ -60,430 +186,4378 @@ class XmlCommonAttrValues(Enum):
     ARG_TYPE_SELF = 'self'
     ARG_KIND_NAMED = 'named'
     ARG_KIND_UNNAMED = 'unnamed'
+    LAYOUT_DEFERRED_TRUE = 'true'
+    LAYOUT_VIRTUAL_TRUE = 'true'
+    REPEAT_INDEX_NAME_DEFAULT = 'index'
+    REPEAT_ITEM_NAME_DEFAULT = 'item'
 
 
-class PyQT5_GUI_Builder:
+class LayoutBuildError(Exception):
     """
-    Class to build PyQt5 layouts based on given XML config file. Such file should contain information about all GUI
-    components - layouts and widgets. There is a support for multiple nested layouts and for binding particular widgets
-    to functions.
+    Exception raised when XML config file cannot be turned into layout. It identifies XML node that caused the error -
+    the original exception is available as '__cause__' attribute.
     """
 
-    @classmethod
-    def returnGuiLayout(cls, config_filepath: str, layout_name: str, base_object) -> QtWidgets.QLayout:
+    def __init__(self, message: str, xml_node: ET.Element = None, config_filepath: str = None,
+                 layout_name: str = None):
         """
-        Main class method that returns final QLayout object based on i.e. given XML config file.
-
+        :param message: String description of the error.
+        :param xml_node: xml.etree.ElementTree.Element object that caused the error.
         :param config_filepath: String path to XML config file.
-        :param layout_name: Name of the desired layout described in the XML file (value of the 'name' attribute in
-            the 'layout' XML node). There is a support for multiple layout definitions in one single file.
-        :param base_object: Reference to the python object, that calls this function. If not used, pass 'None'.
-        :return: QtWidgets.QLayout object with all the layouts and widgets described in XML config file.
+        :param layout_name: Name of the layout that was being processed.
         """
-        config_tree = ET.parse(config_filepath)
-        # Import all config settings that the file contains
-        common_node = config_tree.find(XmlNodeNames.COMMON_DATA.value)
+        super().__init__(message)
+        self.message = message
+        self.xml_node = xml_node
+        self.config_filepath = config_filepath
+        self.layout_name = layout_name
 
-        # Return information about: modules and classes listed in XML config file
-        modules_data = cls.returnValuePairsList(common_node,
-                                                XmlNodeNames.MODULES_LIST.value,
-                                                XmlAttrsNames.MODULE_ID.value,
-                                                XmlAttrsNames.MODULE_NAME.value)
-        classes_data = cls.returnValuePairsList(common_node,
-                                                XmlNodeNames.CLASSES_LIST.value,
-                                                XmlAttrsNames.CLASS_ID.value,
-                                                XmlAttrsNames.CLASS_NAME.value)
-
-        # Check if layout with given name exists in the xml config file
-        layout_data = cls.returnLayoutNode(config_tree, layout_name)
-        if layout_data is None:
-            raise ValueError('Wrong layout name specified - such layout does not exists in ' + config_filepath)
+    @staticmethod
+    def returnNodeDescription(xml_node: ET.Element) -> str:
+        """
+        Returns short description of XML node - its opening tag with all attributes.
+
+        :param xml_node: xml.etree.ElementTree.Element object.
+        :return: String description of the node.
+        """
+        return '<' + ' '.join([xml_node.tag] + [attr_name + '="' + attr_value + '"'
+                                                for attr_name, attr_value in xml_node.attrib.items()]) + '>'
 
-        # Call the recursive function responsible for layout building
-        gui_layout = cls.buildGuiLayout(layout_data, modules_data, classes_data, base_object)
+    def __str__(self) -> str:
+        description = self.message
+        if self.xml_node is not None:
+            description += ' - in node ' + self.returnNodeDescription(self.xml_node)
+        if self.layout_name is not None:
+            description += ' of layout "' + self.layout_name + '"'
+        if self.config_filepath is not None:
+            description += ' in ' + self.config_filepath
 
-        return gui_layout
+        return description
 
-    @staticmethod
-    def returnValuePairsList(data_xml_node: ET.Element,
-                             setting_list_node: str, data_id_attr: str, data_value_attr: str) -> dict:
+
+class ArgSpec(NamedTuple):
+    """
+    Compiled form of single 'arg' XML node. The value is already cast to the desired datatype. For named arguments
+    'arg_name' contains the name of the argument, for unnamed ones it is None.
+    """
+    arg_type: str
+    value: object
+    arg_name: str
+    parent_type_id: str
+    module_name: str
+
+
+class SettingAttrSpec(NamedTuple):
+    """
+    Compiled form of single 'component_attr' XML node - one step of getting the method that implements a feature.
+    """
+    parent_type_id: str
+    name: str
+    module_name: str
+
+
+class FeatureSpec(NamedTuple):
+    """
+    Compiled form of single 'feature' XML node - arguments and the chain of setting attributes.
+    """
+    args: tuple
+    setting_attrs: tuple
+
+
+class ComponentSpec(NamedTuple):
+    """
+    Compiled form of single 'component' XML node. 'placement' contains 'row' and 'column' values (if specified).
+    """
+    component_type: str
+    module_name: str
+    class_name: str
+    placement: tuple
+    constructor_args: tuple
+    features: tuple
+
+
+class LayoutSpec(NamedTuple):
+    """
+    Compiled form of 'layout' XML node. 'components' contains ComponentSpec and nested LayoutSpec objects - in the
+    same order as in the XML file. 'deferred' is True for nested layouts that can be built lazily. 'virtual' is True
+    for grid layouts whose cells are shown by VirtualGridView.
+    """
+    name: str
+    placement: tuple
+    components: tuple
+    deferred: bool = False
+    virtual: bool = False
+
+
+class BuildEvent(NamedTuple):
+    """
+    Single measured event of the build - e.g. parsing of XML file, building of a component or implementing of a
+    feature. Times are in nanoseconds - 'start_ns' is the value of time.perf_counter_ns().
+    """
+    category: str
+    name: str
+    config_filepath: str
+    layout_name: str
+    component_class: str
+    start_ns: int
+    elapsed_ns: int
+    thread_id: int
+
+
+class RepeatSpec(NamedTuple):
+    """
+    Compiled 'repeat' node driven by python iterable - it can be expanded only during the build, when the items are
+    known.
+    """
+    repeat_node: ET.Element
+    modules_data: dict
+    classes_data: dict
+
+
+class ParsedConfig:
+    """
+    Class to store the result of parsing single XML config file - the whole XML tree and the dictionaries of modules
+    and classes read from 'common' node. Objects of this class are shared between builds, so they should be treated
+    as read-only.
+    """
+
+    def __init__(self, config_filepath: str, config_tree: ET.ElementTree, modules_data: dict, classes_data: dict,
+                 included_configs: tuple = (), file_key: tuple = None):
         """
-        Returns simple dictionary of key-value pairs based on given list of XML nodes. Key-value pairs are made based
-        on given XML attributes' names - one for dictionary key and second for value.
+        :param config_filepath: String path to XML config file the data was read from.
+        :param config_tree: xml.etree.ElementTree object that represents whole XML tree read from XML file.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file
+            (together with the ones from included files).
+        :param classes_data: Dictionary of key-value pairs containing information about classes listed in XML file
+            (together with the ones from included files).
+        :param included_configs: Tuple of ParsedConfig objects of files included by 'include' nodes placed in
+            'common' node - in the order of 'include' nodes.
+        :param file_key: Key of the version of XML file the data was read from - returned by
+            'ParsedConfigCache.returnFileKey' method before the file was read.
+        """
+        self.config_filepath = config_filepath
+        self.config_tree = config_tree
+        self.modules_data = modules_data
+        self.classes_data = classes_data
+        self.included_configs = included_configs
+        self.file_key = file_key
+        # Keys of all files included directly or indirectly - by their absolute paths. The data is up to date only as
+        # long as all of them are unchanged.
+        self.dependencies = dict()
+        for included_config in included_configs:
+            self.dependencies[included_config.file_key[0]] = included_config.file_key
+            self.dependencies.update(included_config.dependencies)
+        # Compiled layout plans with resolver's generation they were made in - filled on demand by
+        # 'PyQT5_GUI_Builder.compileLayout'.
+        self.layout_plans = dict()
 
-        :param data_xml_node: xml.etree.ElementTree.Element object that contains lists of XML nodes.
-        :param setting_list_node: String name of XML node that represents desired list of XML nodes.
-        :param data_id_attr: String name of XML attribute that represents key for result dictionary.
-        :param data_value_attr: String name of XML attribute that represents value for result dictionary.
-        :return: Dictionary of simple key:value pairs.
+        # Index of main-level 'layout' nodes - by the values of their 'name' and 'id' attributes. Values that occur
+        # more than once are stored separately - such layouts cannot be found by them.
+        self.layouts_by_name = dict()
+        self.layouts_by_id = dict()
+        self.duplicate_names = set()
+        self.duplicate_ids = set()
+        # Templates of included files and of this file - by their names.
+        self.templates = dict()
+        # 'repeat' nodes the content of their templates was put into - together with the ones of included files, as
+        # the nodes of their templates are shared with this file.
+        self.inlined_repeat_nodes = set()
+        self.indexLayouts()
+        self.inlineTemplates()
+
+    def indexLayouts(self):
         """
-        data = dict()
+        Builds the index of main-level 'layout' nodes by the values of their 'name' and 'id' attributes.
 
-        data_list = data_xml_node.find(setting_list_node)
+        :return: None
+        """
+        layouts_node = self.config_tree.find(XmlNodeNames.LAYOUTS_LIST.value)
+        if layouts_node is None:
+            return
 
-        for piece_of_data in data_list:
-            data_id = piece_of_data.attrib[data_id_attr]
-            data_value = piece_of_data.attrib[data_value_attr]
-            data[data_id] = data_value
+        for layout in layouts_node:
+            if layout.tag != XmlNodeNames.LAYOUT_NODE.value:
+                continue
+            for attr_name, index, duplicates in ((XmlAttrsNames.LAYOUT_NAME.value, self.layouts_by_name,
+                                                  self.duplicate_names),
+                                                 (XmlAttrsNames.LAYOUT_ID.value, self.layouts_by_id,
+                                                  self.duplicate_ids)):
+                attr_value = layout.attrib.get(attr_name)
+                if attr_value is None:
+                    continue
+                if attr_value in index:
+                    duplicates.add(attr_value)
+                index[attr_value] = layout
 
-        return data
+    def inlineTemplates(self):
+        """
+        Puts the content of templates listed in 'templates' node (inside 'common' node) into 'repeat' nodes that
+        reference them by 'template' attribute - so the 'repeat' nodes can be expanded without access to 'common'
+        node. Templates of included files can be referenced too - templates of this file take precedence over them.
+        Template's nodes are shared, not copied.
 
-    @staticmethod
-    def returnLayoutNode(config_tree: ET.ElementTree, layout_name: str) -> ET.Element:
+        :return: None
         """
-        Returns 'layout' node (found at main level) from XML config file, that contains 'name' attribute with given
-        value.
+        for included_config in self.included_configs:
+            self.templates.update(included_config.templates)
+            self.inlined_repeat_nodes.update(included_config.inlined_repeat_nodes)
+
+        common_node = self.config_tree.find(XmlNodeNames.COMMON_DATA.value)
+        templates_node = common_node.find(XmlNodeNames.TEMPLATES_LIST.value) if common_node is not None else None
+        if templates_node is not None:
+            self.templates.update({template_node.attrib.get(XmlAttrsNames.TEMPLATE_NAME.value): template_node
+                                   for template_node in templates_node
+                                   if template_node.tag == XmlNodeNames.TEMPLATE_NODE.value})
+        if not self.templates:
+            return
+
+        # The list of nodes is made first - the content put into them is walked by 'inlineRepeatNode' method.
+        for repeat_node in list(self.config_tree.iter(XmlNodeNames.REPEAT_NODE.value)):
+            self.inlineRepeatNode(repeat_node, ())
+
+    def inlineRepeatNode(self, repeat_node: ET.Element, template_path: tuple):
+        """
+        Puts the content of the template referenced by given 'repeat' node into it - after the content of 'repeat'
+        nodes nested in the template. Every node is filled only once, even if it is reached through many templates.
+
+        :param repeat_node: xml.etree.ElementTree.Element object that represents 'repeat' XML node.
+        :param template_path: Tuple of the names of templates being inlined - the ones that contain given node.
+        :return: None
+        """
+        template_name = repeat_node.attrib.get(XmlAttrsNames.REPEAT_TEMPLATE.value)
+        if template_name is None or repeat_node in self.inlined_repeat_nodes:
+            return
+        # Template that contains itself (directly or through other templates) would make the XML tree cyclic.
+        if template_name in template_path:
+            raise LayoutBuildError('Circular template reference: ' + ' -> '.join(template_path + (template_name,)),
+                                   repeat_node, self.config_filepath)
+        template_node = self.templates.get(template_name)
+        if template_node is None:
+            raise LayoutBuildError('Unknown template "' + template_name + '"', repeat_node, self.config_filepath)
+
+        for nested_repeat_node in list(template_node.iter(XmlNodeNames.REPEAT_NODE.value)):
+            self.inlineRepeatNode(nested_repeat_node, template_path + (template_name,))
+        repeat_node.extend(list(template_node))
+        self.inlined_repeat_nodes.add(repeat_node)
+
+    def returnLayoutNode(self, layout_name: str) -> ET.Element:
+        """
+        Returns main-level 'layout' node with given value of 'name' attribute.
 
-        :param config_tree: xml.etree.ElementTree object that represents whole XML tree read from XML file.
         :param layout_name: String value for 'name' attribute of 'layout' XML node to be found.
-        :return: xml.etree.ElementTree.Element object describing desired layout (or None if no layout found).
+        :return: xml.etree.ElementTree.Element object describing desired layout.
         """
-        layouts_node = config_tree.find(XmlNodeNames.LAYOUTS_LIST.value)
-        lay_name_attr = XmlAttrsNames.LAYOUT_NAME.value
+        if layout_name in self.duplicate_names:
+            raise ValueError('Ambiguous layout name specified - there is more than one layout named "' + layout_name +
+                             '" in ' + self.config_filepath)
 
-        for layout in layouts_node:
-            if layout.attrib[lay_name_attr] == layout_name:
-                return layout
+        layout_data = self.layouts_by_name.get(layout_name)
+        if layout_data is None:
+            raise ValueError('Wrong layout name specified - such layout does not exists in ' + self.config_filepath)
 
-        return None
+        return layout_data
 
-    @classmethod
-    def buildGuiLayout(cls, layout_node: ET.Element, modules_data: dict, classes_data: dict, base_object) \
-            -> QtWidgets.QLayout:
+    def returnLayoutNodeById(self, layout_id: str) -> ET.Element:
         """
-        Recursive class method responsible for building process of given PyQt5 layout.
+        Returns main-level 'layout' node with given value of 'id' attribute.
 
-        :param layout_node: xml.etree.ElementTree.Element object that represents XML node describing desired
-            PyQt5 layout.
-        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
-        :param classes_data: Dictionary of key-value pairs containing information about classes listed in XML file.
-        :param base_object: Reference to the python object, that calls this function. If not used, pass 'None'.
-        :return: QtWidgets.QLayout object with all component layouts and widgets - as described in XML file.
+        :param layout_id: String value for 'id' attribute of 'layout' XML node to be found.
+        :return: xml.etree.ElementTree.Element object describing desired layout.
         """
-        main_layout = None
-        # Read the list of 'component' nodes under given 'layout' node
-        layout_components = layout_node.find(XmlNodeNames.COMPONENTS_LIST.value)
+        if layout_id in self.duplicate_ids:
+            raise ValueError('Ambiguous layout id specified - there is more than one layout with id "' + layout_id +
+                             '" in ' + self.config_filepath)
 
-        for component_node in layout_components:
-            # Read the 'row' and 'column' attributes of given 'component' node - if they exist.
-            # They exist if the 'component' node is under 'layout' node that represents QGridLayout object.
-            placement_args = cls.returnComponentPlacementArgs(component_node)
+        layout_data = self.layouts_by_id.get(layout_id)
+        if layout_data is None:
+            raise ValueError('Wrong layout id specified - such layout does not exists in ' + self.config_filepath)
 
-            # If the next node that occurred is a 'component' node - build QWidget object based on it and add it to
-            # existing layout.
-            if component_node.tag == XmlNodeNames.COMPONENT_NODE.value:
+        return layout_data
 
-                # Read the 'type' attribute of the current 'component' node. 'self' means, that this node represents
-                # the constructor for main Layout object. 'widget' means that this node is for component QWidget object.
-                component_type = component_node.attrib[XmlAttrsNames.COMPONENT_TYPE.value]
-                # Build single component object (QWidget or main QLayout) based on the current XML node.
-                component_object = cls.buildComponentObject(component_node, modules_data, classes_data, base_object)
 
-                if component_type == XmlCommonAttrValues.COMPONENT_TYPE_SELF.value:
-                    main_layout = component_object
-                elif component_type == XmlCommonAttrValues.COMPONENT_TYPE_WIDGET.value:
-                    main_layout.addWidget(component_object, *placement_args)
+class ParsedConfigCache:
+    """
+    Process-wide cache of parsed XML config files. Entries are keyed on file's absolute path and validated against
+    file's modification time and size - so the changed file is parsed again automatically. Files included by other
+    files are cached the same way - the cache keeps the graph of dependencies, so when an included file changes, all
+    files that include it (directly or indirectly) are invalidated too. The number of stored entries is bounded - the
+    least recently used entry is evicted when the limit is exceeded.
+    """
 
-            # If the next node that occurred is a 'layout' node - call this function once again - to build
-            # this component layout and add it to the existing layout.
-            elif component_node.tag == XmlNodeNames.LAYOUT_NODE.value:
-                main_layout.addLayout(cls.buildGuiLayout(component_node, modules_data, classes_data, base_object),
-                                      *placement_args)
+    def __init__(self, max_entries: int = 32):
+        """
+        :param max_entries: Maximum number of parsed config files kept in the cache.
+        """
+        if max_entries < 1:
+            raise ValueError('Cache size must be a positive integer')
 
-        return main_layout
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        # Graph of dependencies - absolute paths of files that include given file (directly).
+        self._dependents = dict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
 
     @staticmethod
-    def returnComponentPlacementArgs(component_node: ET.Element):
+    def returnFileKey(config_filepath: str) -> tuple:
         """
-        Function to return array containing values of 'row' and 'column' attributes of 'component' or nested 'layout'
-        nodes - if they exist. They exist if the parent layout object is a QGridLayout - they are needed to place the
-        component inside QGridLayout object.
+        Returns the key that identifies current version of given file - its absolute path, modification time and size.
 
-        :param component_node: xml.etree.ElementTree.Element object that represents current 'component' or
-            nested 'layout' XML node
-        :return: List containing 'row' and 'column' attrs' values - if they exist. If not - empty list.
+        :param config_filepath: String path to XML config file.
+        :return: Tuple - ( absolute path, modification time in ns, size in bytes )
         """
-        placement_args = []
-        if (XmlAttrsNames.COMPONENT_ROW.value in component_node.attrib and
-                XmlAttrsNames.COMPONENT_COLUMN.value in component_node.attrib):
-            placement_args.append(int(component_node.attrib[XmlAttrsNames.COMPONENT_ROW.value]))
-            placement_args.append(int(component_node.attrib[XmlAttrsNames.COMPONENT_COLUMN.value]))
+        file_path = os.path.abspath(config_filepath)
+        file_stat = os.stat(file_path)
 
-        return placement_args
+        return file_path, file_stat.st_mtime_ns, file_stat.st_size
 
-    @classmethod
-    def buildComponentObject(cls, component_node: ET.Element, modules_data: dict, classes_data: dict, base_object):
+    def returnParsedConfig(self, config_filepath: str, loader, file_key: tuple = None) -> ParsedConfig:
         """
-        Method to build a single component of PyQt5 layout based on the given XML node object.
+        Returns parsed config for given file - from the cache if it is up to date, otherwise by calling given loader
+        and storing its result.
 
-        :param component_node: xml.etree.ElementTree.Element object that represents 'component' XML node.
-        :param modules_data: Dictionary of key-value pairs containing info about modules listed in XML config file
-            ('module' nodes).
-        :param classes_data: Dictionary of key-value pairs containing info about classes listed in XML config file
-            ('class' nodes).
-        :param base_object: Reference to python object that called this function (or acts like a host-object for result
-            layout - e.g. contains methods that need to be connected to buttons etc...).
-        :return: QWidget or QLayout object.
+        :param config_filepath: String path to XML config file.
+        :param loader: Callable that takes the string path of XML config file and returns ParsedConfig object.
+        :param file_key: Key of the current version of the file returned by 'returnFileKey' method - if the caller
+            already has it. Otherwise the file is checked again.
+        :return: ParsedConfig object for given file.
         """
-        # Read:
-        # - the name of the class that the result object should be an instance of,
-        # - the name of the module that contains this class definition,
-        # using the dictionaries of classes and modules and 'component' XML node attributes.
-        class_name = classes_data[component_node.attrib[XmlAttrsNames.COMPONENT_CLASS_ID.value]]
-        module_name = modules_data[component_node.attrib[XmlAttrsNames.COMPONENT_MODULE_ID.value]]
+        if file_key is None:
+            file_key = self.returnFileKey(config_filepath)
+        file_path = file_key[0]
 
-        # Return an object that represents desired class for current layout component.
-        class_obj = cls.returnObjectByName(module_name, class_name)
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is not None and entry[0] == file_key and self.areDependenciesCurrent(entry[1]):
+                self._entries.move_to_end(file_path)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
 
-        # Read constructor's arguments listed in current 'component' XML node.
-        constructor_args, constructor_kwargs = cls.returnFunctionArguments(component_node,
-                                                                           XmlNodeNames.CONSTRUCTOR_ARGS.value,
-                                                                           modules_data,
-                                                                           None,
-                                                                           base_object)
-        # Create result GUI component object from given class and constructor arguments.
-        component_object = class_obj(*constructor_args, **constructor_kwargs)
+        # Parse the file outside the lock - so other files can be read from the cache meanwhile.
+        parsed_config = loader(config_filepath)
 
-        # Read list of 'feature' XML nodes for current PyQt5 GUI component. They represent various changes that can be
-        # applied to the current GUI component after its creation - e.g. changing the size, connecting PyQt5 signals...
-        component_features = component_node.find(XmlNodeNames.FEATURES_LIST.value)
-        if component_features:
-            # For every feature in the list - implement it
-            for feature_node in component_features:
-                component_object = cls.implementFeature(component_object, feature_node, modules_data, base_object)
+        with self._lock:
+            # Dependencies of the previous version of the file may differ - so its edges are replaced.
+            if entry is not None:
+                self.removeDependencies(file_path, entry[1])
+            for dependency_path in parsed_config.dependencies:
+                self._dependents.setdefault(dependency_path, set()).add(file_path)
+            self._entries[file_path] = (file_key, parsed_config)
+            self._entries.move_to_end(file_path)
+            while len(self._entries) > self.max_entries:
+                evicted_path, evicted_entry = self._entries.popitem(last=False)
+                self.removeDependencies(evicted_path, evicted_entry[1])
+                self._evictions += 1
 
-        return component_object
+        return parsed_config
 
-    @staticmethod
-    def returnObjectByName(module_name: str, object_name: str):
+    def removeDependencies(self, file_path: str, parsed_config: ParsedConfig):
         """
-        Returns object - e.g. class or function based on its name and the name of the module that contains relevant
-        definition.
+        Removes given file from the graph of dependencies as a dependent of the files it includes - e.g. when it is
+        evicted from the cache. The edges pointing to the file (from the files that include it) are kept.
 
-        :param module_name: String name of the module that contains definition of the object.
-        :param object_name: String name of the desired object to be returned.
-        :return: Any object - e.g. class or function
+        :param file_path: Absolute path of XML config file.
+        :param parsed_config: ParsedConfig object of given file.
+        :return: None
         """
+        with self._lock:
+            for dependency_path in parsed_config.dependencies:
+                dependents = self._dependents.get(dependency_path)
+                if dependents is not None:
+                    dependents.discard(file_path)
+                    if not dependents:
+                        del self._dependents[dependency_path]
 
-        if module_name:
-            # If given module is not imported already, import it.
-            if module_name not in sys.modules:
-                module = import_module(module_name)
-            else:
-                module = sys.modules[module_name]
+    def areDependenciesCurrent(self, parsed_config: ParsedConfig) -> bool:
+        """
+        Checks if all files included by given parsed config are unchanged. Changed files are invalidated - together
+        with all files that depend on them.
 
-            obj = getattr(module, object_name)
-        else:
-            # If module's name is not provided, try to find desired object in dictionary of global object in the current
-            # module's scope.
-            obj = globals()[object_name]
+        :param parsed_config: ParsedConfig object.
+        :return: True if all included files are unchanged, otherwise False.
+        """
+        for dependency_path, dependency_key in parsed_config.dependencies.items():
+            try:
+                current_key = self.returnFileKey(dependency_path)
+            except OSError:
+                current_key = None
+            if current_key != dependency_key:
+                self.invalidate(dependency_path)
+                return False
 
-        return obj
+        return True
 
-    @classmethod
-    def returnFunctionArguments(cls, component_node: ET.Element, args_node_name: str, modules_data: dict,
-                                current_object, base_object) -> tuple:
+    def invalidate(self, config_filepath: str) -> bool:
         """
-        Returns both: unnamed and named arguments for objects' constructors and methods based on 'arg' XML nodes
-        placed in the config file.
+        Removes given file from the cache - together with all cached files that include it - so the next build
+        parses them again.
 
-        :param component_node: xml.etree.ElementTree.Element object that represents current 'component' XML node.
-        :param args_node_name: String name of XML node that represents list of arguments ('arg' XML nodes).
-        :param modules_data: Dictionary of key-value pairs containing info about modules listed in XML config file
-            ('module' nodes).
-        :param current_object: Object that was created based on the current 'component' XML node. If no object was
-            created yet (this func is called for constructor's arguments), pass None.
-        :param base_object: Reference to python object that called this function (or acts like a host-object for result
-            layout - e.g. contains methods that need to be connected to buttons etc...).
-        :return: Tuple - ( list of unnamed arguments, dictionary of named arguments )
+        :param config_filepath: String path to XML config file.
+        :return: True if the file or any of its dependents was cached, otherwise False.
         """
+        file_path = os.path.abspath(config_filepath)
 
-        result_args = list()
-        result_kwargs = dict()
-        args_list = component_node.find(args_node_name)
+        with self._lock:
+            entry = self._entries.pop(file_path, None)
+            invalidated = entry is not None
+            if invalidated:
+                self.removeDependencies(file_path, entry[1])
+                self._invalidations += 1
+            for dependent_path in self._dependents.pop(file_path, ()):
+                invalidated = self.invalidate(dependent_path) or invalidated
+            return invalidated
 
-        if not args_list:
-            return result_args, result_kwargs
+    def returnDependents(self, config_filepath: str) -> set:
+        """
+        Returns the paths of cached files that include given file - directly or indirectly.
 
-        for arg in args_list:
-            # Read following attributes for given 'arg' XML node:
-            # - 'type' - describing type of data of the current argument
-            # - 'value' - the main content of the current argument
-            # - 'kind' - information whether the argument is 'named' or 'unnamed'
-            arg_type = arg.attrib[XmlAttrsNames.ARG_TYPE_ATTR.value]
-            arg_value = arg.attrib[XmlAttrsNames.ARG_VALUE_ATTR.value]
-            arg_kind = arg.attrib[XmlAttrsNames.ARG_KIND_ATTR.value]
+        :param config_filepath: String path to XML config file.
+        :return: Set of absolute paths.
+        """
+        dependents = set()
+        with self._lock:
+            pending_paths = [os.path.abspath(config_filepath)]
+            while pending_paths:
+                for dependent_path in self._dependents.get(pending_paths.pop(), ()):
+                    if dependent_path not in dependents:
+                        dependents.add(dependent_path)
+                        pending_paths.append(dependent_path)
+
+        return dependents
+
+    def clear(self):
+        """
+        Removes all entries from the cache and resets its statistics.
+
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+            self._dependents.clear()
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns statistics of the cache usage.
+
+        :return: Dictionary with number of hits, misses, evictions, invalidations and current size of the cache.
+        """
+        with self._lock:
+            return {'hits': self._hits,
+                    'misses': self._misses,
+                    'evictions': self._evictions,
+                    'invalidations': self._invalidations,
+                    'size': len(self._entries),
+                    'max_entries': self.max_entries}
+
+
+class SymbolResolver:
+    """
+    Class to resolve module-level objects (e.g. classes and functions) by their names - with memoization. Resolved
+    objects are cached across builds (if 'persistent' is True) or only for the life of a single build. Attributes of
+    base object are read once per build - they are cached only inside the build scope.
+    Cached module-level objects should be invalidated after relevant module is reloaded - see 'invalidate' and
+    'reloadModule' methods.
+    """
+
+    def __init__(self, persistent: bool = True):
+        """
+        :param persistent: If True, module-level objects are cached across builds. If False, they are cached only
+            inside the build scope.
+        """
+        self.persistent = persistent
+        # Counter incremented on every invalidation - objects that store resolved references (e.g. LayoutPlan) can
+        # use it to check if they are still valid.
+        self.generation = 0
+        self._objects = dict()
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    @staticmethod
+    def newScope() -> dict:
+        """
+        Returns empty cache of the build scope - to be passed to 'buildScope' method when the build is run in parts.
+
+        :return: Dictionary of scope's caches.
+        """
+        return {'objects': dict(), 'base_attrs': dict()}
+
+    @contextmanager
+    def buildScope(self, scope: dict = None):
+        """
+        Context manager that marks the life of a single build. Attributes of base objects and (for non-persistent
+        resolver) module-level objects are cached only inside it. Scopes can be nested - each one has its own cache.
+
+        :param scope: Cache of the build scope returned by 'newScope' method - to continue the build that was run
+            in parts. If not given, new scope is created.
+        :return: None
+        """
+        scopes = self._local.__dict__.setdefault('scopes', list())
+        scopes.append(scope if scope is not None else self.newScope())
+        try:
+            yield
+        finally:
+            scopes.pop()
+
+    def returnScope(self) -> dict:
+        """
+        Returns the cache of the innermost build scope of the current thread.
+
+        :return: Dictionary of scope's caches or None if there is no active build scope.
+        """
+        scopes = getattr(self._local, 'scopes', None)
+        if scopes:
+            return scopes[-1]
+
+        return None
+
+    def returnObjectsCache(self) -> dict:
+        """
+        Returns the dictionary that should be used for caching module-level objects.
+
+        :return: Dictionary of cached objects or None if objects should not be cached.
+        """
+        if self.persistent:
+            return self._objects
+
+        scope = self.returnScope()
+        return scope['objects'] if scope is not None else None
+
+    def returnObject(self, module_name: str, object_name: str):
+        """
+        Returns module-level object by its name and the name of the module that contains it.
+
+        :param module_name: String name of the module that contains definition of the object.
+        :param object_name: String name of the desired object to be returned.
+        :return: Any object - e.g. class or function
+        """
+        return self.returnAttributeChain(module_name, object_name, ())
+
+    def returnAttributeChain(self, module_name: str, object_name: str, attr_names: tuple):
+        """
+        Returns the object got "step-by-step" - starting from module-level object and reading given attributes in
+        order - e.g. 'module.object.attr_1.attr_2'.
+
+        :param module_name: String name of the module that contains definition of the object.
+        :param object_name: String name of the module-level object.
+        :param attr_names: Tuple of string names of attributes to be read.
+        :return: Any object - the value of the last attribute.
+        """
+        cache_key = (module_name, object_name, attr_names)
+        objects_cache = self.returnObjectsCache()
+
+        if objects_cache is not None:
+            entry = objects_cache.get(cache_key)
+            # Module object is stored to detect modules removed from 'sys.modules' and imported again.
+            if entry is not None and (entry[0] is None or sys.modules.get(module_name) is entry[0]):
+                return entry[1]
+
+        module, obj = self.importObject(module_name, object_name)
+        for attr_name in attr_names:
+            obj = getattr(obj, attr_name)
+
+        if objects_cache is not None:
+            with self._lock:
+                objects_cache[cache_key] = (module, obj)
+
+        return obj
+
+    def returnBaseObjectAttribute(self, base_object, attr_name: str):
+        """
+        Returns the attribute of base object. Inside the build scope it is read only once.
+
+        :param base_object: Reference to python object that called the build.
+        :param attr_name: String name of the attribute.
+        :return: Any object - the value of the attribute.
+        """
+        scope = self.returnScope()
+        if scope is None:
+            return getattr(base_object, attr_name)
+
+        cache_key = (id(base_object), attr_name)
+        base_attrs = scope['base_attrs']
+        if cache_key in base_attrs:
+            return base_attrs[cache_key]
+
+        obj = base_attrs[cache_key] = getattr(base_object, attr_name)
+
+        return obj
+
+    @staticmethod
+    def importObject(module_name: str, object_name: str) -> tuple:
+        """
+        Returns module-level object by its name - without using the cache. The module is imported if needed.
+
+        :param module_name: String name of the module that contains definition of the object.
+        :param object_name: String name of the desired object to be returned.
+        :return: Tuple - ( module object or None if no module name was given, desired object )
+        """
+        if module_name:
+            # If given module is not imported already, import it (and store the time of the import). Modules listed in
+            # XML files are not wrapped in LazyModule proxies - they are imported only here, when the first object is
+            # resolved from them, and the real module object is needed to detect modules imported again (see
+            # 'returnAttributeChain' method) and to reload them (proxy would keep the attributes of the old module).
+            module = LazyModule.importModule(module_name)
+
+            return module, getattr(module, object_name)
+
+        # If module's name is not provided, try to find desired object in dictionary of global object in the current
+        # module's scope.
+        if object_name in globals():
+            return None, globals()[object_name]
+
+        return None, __getattr__(object_name)
+
+    @staticmethod
+    def returnImportCosts() -> list:
+        """
+        Returns the time of importing the modules imported while resolving objects (and of lazily imported PyQt5
+        modules) - sorted from the slowest one.
+
+        :return: List of tuples - ( module name, import time in ms ).
+        """
+        return LazyModule.returnImportCosts()
+
+    def invalidate(self, module_name: str = None):
+        """
+        Removes cached objects from given module - or all cached objects if no module name is given.
+
+        :param module_name: String name of the module.
+        :return: None
+        """
+        with self._lock:
+            if module_name is None:
+                self._objects.clear()
+            else:
+                for cache_key in [key for key in self._objects if key[0] == module_name]:
+                    del self._objects[cache_key]
+            self.generation += 1
+
+    def reloadModule(self, module_name: str):
+        """
+        Reloads given module and removes all cached objects from it.
+
+        :param module_name: String name of the module.
+        :return: Reloaded module object.
+        """
+        module = reload(sys.modules[module_name])
+        self.invalidate(module_name)
+
+        return module
+
+
+# Context manager used in place of traced event when the instrumentation is disabled.
+NO_TRACE = nullcontext()
+
+
+class BuildInstrumentation:
+    """
+    Base class of instrumentation hooks - set its instance as 'PyQT5_GUI_Builder.instrumentation' to receive build
+    events. 'onEventStarted' is called before and 'onEventFinished' after every measured part of the build. Events
+    are emitted for categories: 'parse', 'common_data', 'compile', 'build', 'plan_build', 'layout', 'component',
+    'construct', 'feature', 'resolve' and 'insert'. Hooks are called in the thread that runs the build.
+    """
+
+    def onEventStarted(self, category: str, name: str, config_filepath: str, layout_name: str,
+                       component_class: str):
+        """
+        Called before measured part of the build.
+
+        :param category: String category of the event.
+        :param name: String name of the event - e.g. name of the class or of the feature's method.
+        :param config_filepath: String path to XML config file (None if unknown).
+        :param layout_name: Name of the built layout (None if unknown).
+        :param component_class: Name of the class of the component (None if not applicable).
+        :return: None
+        """
+
+    def onEventFinished(self, build_event: BuildEvent):
+        """
+        Called after measured part of the build - also if it raised an exception.
+
+        :param build_event: BuildEvent object.
+        :return: None
+        """
+
+    @contextmanager
+    def traceEvent(self, category: str, name: str, component_class: str = None):
+        """
+        Context manager that measures its body and calls the hooks.
+
+        :param category: String category of the event.
+        :param name: String name of the event.
+        :param component_class: Name of the class of the component (None if not applicable).
+        :return: None
+        """
+        config_filepath, layout_name = PyQT5_GUI_Builder.returnTraceContext()
+        self.onEventStarted(category, name, config_filepath, layout_name, component_class)
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.onEventFinished(BuildEvent(category, name, config_filepath, layout_name, component_class, start_ns,
+                                            time.perf_counter_ns() - start_ns, threading.get_ident()))
+
+
+class BuildTraceRecorder(BuildInstrumentation):
+    """
+    Instrumentation that records all build events - they can be exported as summary table or as Chrome trace
+    ('trace_event' JSON format - to be opened in chrome://tracing or Perfetto).
+    """
+
+    def __init__(self):
+        self.events = list()
+
+    def onEventFinished(self, build_event: BuildEvent):
+        self.events.append(build_event)
+
+    def clear(self):
+        """
+        Removes all recorded events.
+
+        :return: None
+        """
+        self.events = list()
+
+    def returnSelfTimes(self) -> list:
+        """
+        Returns the exclusive time of every recorded event - its time without the time of events nested in it (in the
+        same thread).
+
+        :return: List of tuples - ( BuildEvent object, exclusive time in ns ) - in the order of recording.
+        """
+        children_ns = [0] * len(self.events)
+        events_by_thread = dict()
+        for event_index, build_event in enumerate(self.events):
+            events_by_thread.setdefault(build_event.thread_id, list()).append(event_index)
+
+        for event_indexes in events_by_thread.values():
+            event_indexes.sort(key=lambda index: (self.events[index].start_ns, -self.events[index].elapsed_ns))
+            # Stack of events that are still open at the start of the current one.
+            open_events = list()
+            for event_index in event_indexes:
+                build_event = self.events[event_index]
+                while open_events and (self.events[open_events[-1]].start_ns +
+                                       self.events[open_events[-1]].elapsed_ns) <= build_event.start_ns:
+                    open_events.pop()
+                if open_events:
+                    children_ns[open_events[-1]] += build_event.elapsed_ns
+                open_events.append(event_index)
+
+        return [(build_event, build_event.elapsed_ns - children_ns[event_index])
+                for event_index, build_event in enumerate(self.events)]
+
+    def returnSelfTimesByCategory(self) -> dict:
+        """
+        Returns the sum of exclusive times of recorded events - for every category.
+
+        :return: Dictionary of categories and times in ns.
+        """
+        totals = dict()
+        for build_event, self_ns in self.returnSelfTimes():
+            totals[build_event.category] = totals.get(build_event.category, 0) + self_ns
+
+        return totals
+
+    def returnSummaryTable(self, max_rows: int = 30) -> str:
+        """
+        Returns text table with statistics of recorded events - grouped by category and name, sorted by the total
+        exclusive time.
+
+        :param max_rows: Maximum number of rows of the table.
+        :return: String table.
+        """
+        groups = dict()
+        for build_event, self_ns in self.returnSelfTimes():
+            group = groups.setdefault((build_event.category, build_event.name), [0, 0, 0, 0])
+            group[0] += 1
+            group[1] += build_event.elapsed_ns
+            group[2] += self_ns
+            group[3] = max(group[3], build_event.elapsed_ns)
+
+        lines = ['{:<12} {:<40} {:>8} {:>12} {:>12} {:>12}'.format('category', 'name', 'count', 'total ms',
+                                                                   'self ms', 'max ms')]
+        for (category, name), (count, total_ns, self_ns, max_ns) in sorted(groups.items(),
+                                                                          key=lambda item: -item[1][2])[:max_rows]:
+            lines.append('{:<12} {:<40} {:>8} {:>12.3f} {:>12.3f} {:>12.3f}'.format(
+                category, str(name)[:40], count, total_ns / 1e6, self_ns / 1e6, max_ns / 1e6))
+
+        return '\n'.join(lines)
+
+    def returnChromeTrace(self) -> dict:
+        """
+        Returns recorded events in Chrome 'trace_event' format.
+
+        :return: Dictionary ready to be written as JSON.
+        """
+        first_ns = min((build_event.start_ns for build_event in self.events), default=0)
+        process_id = os.getpid()
+
+        trace_events = list()
+        for build_event in self.events:
+            trace_events.append({'name': build_event.name,
+                                 'cat': build_event.category,
+                                 'ph': 'X',
+                                 'ts': (build_event.start_ns - first_ns) / 1000.0,
+                                 'dur': build_event.elapsed_ns / 1000.0,
+                                 'pid': process_id,
+                                 'tid': build_event.thread_id,
+                                 'args': {'config_filepath': build_event.config_filepath,
+                                          'layout_name': build_event.layout_name,
+                                          'component_class': build_event.component_class}})
+
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def writeChromeTrace(self, trace_filepath: str):
+        """
+        Writes recorded events to JSON file in Chrome 'trace_event' format.
+
+        :param trace_filepath: String path of the file to be written.
+        :return: None
+        """
+        with open(trace_filepath, 'w', encoding='utf-8') as trace_file:
+            json.dump(self.returnChromeTrace(), trace_file)
+
+
+class WidgetPool:
+    """
+    Pool of widgets for recycling - set its instance as 'PyQT5_GUI_Builder.widget_pool' to use it. Widgets released to
+    the pool (see 'release' and 'releaseLayout' methods) are reused by later builds instead of constructing new ones -
+    if they are of the same class, were constructed with the same arguments and have the same features (names of their
+    setting attributes are part of the pool's key). Reused widget is reset (see 'resetWidget' method) and all its
+    features are applied again. Signal connections made by features are recorded and disconnected when the widget is
+    released - so they are not doubled. Connections made by constructor's arguments are kept, because they are part of
+    the pool's key. Only the widgets whose features are setters ('set...' methods - applying them again overwrites the
+    state they set) or signal connections are pooled - the widgets with other features (e.g. 'addItem') are deleted
+    when released, because applying their features again would not give the state of freshly built widget.
+    The pool is bounded - when there are more than 'max_size' idle widgets, the least recently released ones are
+    deleted. The pool should be used only by the Qt main thread.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        :param max_size: Maximum number of idle widgets stored in the pool.
+        """
+        self.max_size = max_size
+        # Idle widgets - keyed on pool key - and all idle widgets in the order of releasing.
+        self._idle = dict()
+        self._idle_order = OrderedDict()
+        # Pool keys and recorded connections of the widgets built through the pool.
+        self._tracked = weakref.WeakKeyDictionary()
+        # Functions resetting the widgets of given classes - see 'registerResetFunction' method.
+        self._reset_functions = dict()
+        self._hits = 0
+        self._misses = 0
+        self._releases = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> dict:
+        """
+        :return: Dictionary with the statistics of the pool.
+        """
+        return {'hits': self._hits,
+                'misses': self._misses,
+                'releases': self._releases,
+                'evictions': self._evictions,
+                'size': len(self._idle_order),
+                'max_size': self.max_size}
+
+    @staticmethod
+    def returnPoolKey(class_obj, args, kwargs: dict, features_key: tuple = ()):
+        """
+        Returns the key of the pool for given class, constructor's arguments and features.
+
+        :param class_obj: Class of the widget.
+        :param args: Unnamed constructor's arguments.
+        :param kwargs: Dictionary of named constructor's arguments.
+        :param features_key: Tuple of the names of setting attributes of widget's features - e.g. returned by
+            'PyQT5_GUI_Builder.returnFeaturesKey' method.
+        :return: Hashable key - or None if the arguments are not hashable (such widgets are not pooled).
+        """
+        pool_key = (class_obj, tuple(args), tuple(sorted(kwargs.items())), features_key)
+        try:
+            hash(pool_key)
+        except TypeError:
+            return None
+
+        return pool_key
+
+    def acquire(self, class_obj, args, kwargs: dict, features_key: tuple = ()):
+        """
+        Returns idle widget of given class constructed with given arguments and with given features - after resetting
+        it. If there is no such widget in the pool, new one is constructed.
+
+        :param class_obj: Class of the widget.
+        :param args: Unnamed constructor's arguments.
+        :param kwargs: Dictionary of named constructor's arguments.
+        :param features_key: Tuple of the names of setting attributes of the features that will be applied to the
+            widget - see 'returnPoolKey' method.
+        :return: QWidget object.
+        """
+        pool_key = self.returnPoolKey(class_obj, args, kwargs, features_key)
+        if pool_key is None:
+            return class_obj(*args, **kwargs)
+
+        idle_widgets = self._idle.get(pool_key)
+        if idle_widgets:
+            widget = idle_widgets.pop()
+            del self._idle_order[widget]
+            self._hits += 1
+            self.resetWidget(widget, args, kwargs)
+        else:
+            widget = class_obj(*args, **kwargs)
+            self._misses += 1
+            if not isinstance(widget, QtWidgets.QWidget):
+                return widget
+
+        # Pool key, recorded connections and the flag telling if the widget can be pooled after releasing.
+        self._tracked[widget] = [pool_key, list(), True]
+
+        return widget
+
+    def recordFeature(self, widget, setting_attr, args):
+        """
+        Records signal connection made by feature of the widget - if the feature is a 'connect' method of the signal.
+        If the feature is neither a connection nor a setter, the widget will not be pooled after releasing.
+
+        :param widget: Widget the feature is implemented for.
+        :param setting_attr: Object called to implement the feature.
+        :param args: Unnamed arguments of the feature.
+        :return: None
+        """
+        tracked = self._tracked.get(widget)
+        if tracked is None:
+            return
+
+        setting_attr_name = getattr(setting_attr, '__name__', '')
+        bound_signal = getattr(setting_attr, '__self__', None)
+        if setting_attr_name == 'connect' and isinstance(bound_signal, QtCore.pyqtBoundSignal) and args:
+            tracked[1].append((bound_signal, args[0]))
+        elif not setting_attr_name.startswith('set'):
+            tracked[2] = False
+
+    def release(self, widget) -> bool:
+        """
+        Returns the widget to the pool - its recorded connections are disconnected and it is detached from its parent.
+
+        :param widget: QWidget object built through the pool.
+        :return: True if the widget was stored in the pool, False if it was not built through the pool or its features
+            do not allow pooling it (see 'recordFeature' method).
+        """
+        tracked = self._tracked.pop(widget, None)
+        if tracked is None:
+            return False
+
+        pool_key, connections, poolable = tracked
+        if not poolable:
+            return False
+
+        for bound_signal, slot in connections:
+            try:
+                bound_signal.disconnect(slot)
+            except TypeError:
+                pass
+
+        widget.setParent(None)
+        self._idle.setdefault(pool_key, list()).append(widget)
+        self._idle_order[widget] = pool_key
+        self._releases += 1
+
+        # Delete the least recently released widgets above the limit.
+        while len(self._idle_order) > self.max_size:
+            evicted_widget, evicted_key = self._idle_order.popitem(last=False)
+            self._idle[evicted_key].remove(evicted_widget)
+            evicted_widget.deleteLater()
+            self._evictions += 1
+
+        return True
+
+    def releaseLayout(self, gui_layout: QtWidgets.QLayout):
+        """
+        Takes all widgets out of given layout (and its nested layouts) - widgets built through the pool are returned
+        to it, the other ones are deleted. The layout is left empty.
+
+        :param gui_layout: QLayout object - e.g. built by 'PyQT5_GUI_Builder.returnGuiLayout' method.
+        :return: None
+        """
+        while gui_layout.count():
+            layout_item = gui_layout.takeAt(0)
+            widget = layout_item.widget()
+            nested_layout = layout_item.layout()
+            if widget is not None and not self.release(widget):
+                widget.setParent(None)
+                widget.deleteLater()
+            elif nested_layout is not None:
+                self.releaseLayout(nested_layout)
+
+    def registerResetFunction(self, class_obj, reset_function):
+        """
+        Registers function that resets reused widgets of given class (and of its subclasses) - instead of
+        'resetWidget' method.
+
+        :param class_obj: Class of the widgets.
+        :param reset_function: Callable with three arguments - widget, unnamed and named constructor's arguments.
+        :return: None
+        """
+        self._reset_functions[class_obj] = reset_function
+
+    def resetWidget(self, widget, args, kwargs: dict):
+        """
+        Resets reused widget before its features are applied again. Named constructor's arguments that are Qt
+        properties are set again and the text of the widget is set to the first string argument. The state set by
+        features is not reset here - the widget is reused only by the component with the same features, which are all
+        setters or connections, so applying them again overwrites it. Any other state changed after the build (e.g. by
+        the user or by the program) is not reset - register reset function (see 'registerResetFunction' method) for
+        the classes that need it.
+
+        :param widget: Reused QWidget object.
+        :param args: Unnamed constructor's arguments.
+        :param kwargs: Dictionary of named constructor's arguments.
+        :return: None
+        """
+        for class_obj in type(widget).__mro__:
+            reset_function = self._reset_functions.get(class_obj)
+            if reset_function is not None:
+                reset_function(widget, args, kwargs)
+                return
+
+        meta_object = widget.metaObject()
+        for arg_name, arg_value in kwargs.items():
+            if meta_object.indexOfProperty(arg_name) >= 0:
+                widget.setProperty(arg_name, arg_value)
+
+        if hasattr(widget, 'setText'):
+            widget.setText(next((arg for arg in args if isinstance(arg, str)), ''))
+
+    def clear(self):
+        """
+        Deletes all idle widgets.
+
+        :return: None
+        """
+        for widget in self._idle_order:
+            widget.deleteLater()
+        self._idle = dict()
+        self._idle_order = OrderedDict()
+
+
+class PyQT5_GUI_Builder:
+    """
+    Class to build PyQt5 layouts based on given XML config file. Such file should contain information about all GUI
+    components - layouts and widgets. There is a support for multiple nested layouts and for binding particular widgets
+    to functions.
+    """
+
+    # Process-wide cache of parsed XML config files - shared by all builds.
+    config_cache = ParsedConfigCache()
+    # Resolver of module-level objects used by all builds.
+    symbol_resolver = SymbolResolver()
+    # Pool of worker threads that prepare layouts for asynchronous builds - created on first use.
+    prepare_executor = None
+    prepare_max_workers = 4
+    _gui_invoker = None
+    _executor_lock = threading.Lock()
+    # Instrumentation hooks (BuildInstrumentation object) - None when the instrumentation is disabled.
+    instrumentation = None
+    _trace_context = threading.local()
+    # Pool of widgets reused by builds (WidgetPool object) - None when widgets are not recycled.
+    widget_pool = None
+    # Build transaction (BuildTransaction object) open in the current thread - see 'buildTransaction' method.
+    _build_transaction = threading.local()
+    # Absolute paths of XML config files being read by the current thread - to detect circular includes.
+    _loading_configs = threading.local()
+
+    @classmethod
+    def returnGuiLayout(cls, config_filepath: str, layout_name: str, base_object, use_cache: bool = True,
+                        use_generated: bool = True, streaming: bool = False, lazy: bool = False,
+                        use_precompiled: bool = True) -> QtWidgets.QLayout:
+        """
+        Main class method that returns final QLayout object based on i.e. given XML config file.
+
+        :param config_filepath: String path to XML config file - or to binary config file written by
+            BinaryConfigWriter (recognized by its extension). Binary files are read directly - all the options below
+            except 'lazy' are not used for them.
+        :param layout_name: Name of the desired layout described in the XML file (value of the 'name' attribute in
+            the 'layout' XML node). There is a support for multiple layout definitions in one single file.
+        :param base_object: Reference to the python object, that calls this function. If not used, pass 'None'.
+        :param use_cache: If True, parsed XML config file is taken from the process-wide cache (and stored there).
+            The file is parsed again only if it has changed since it was cached. If False, the file is read directly
+            from disk - generated modules and precompiled artifacts are not used either.
+        :param use_generated: If True and there is up-to-date python module generated for desired layout by
+            'LayoutCodeGenerator', the layout is built by this module - without parsing the XML file. Generated modules
+            are not used inside build transaction (see 'buildTransaction' method) nor when 'widget_pool' is set.
+        :param streaming: If True, XML config file is read incrementally and only 'common' node and desired layout
+            are kept in memory - reading stops as soon as both of them are found. Intended for large files with many
+            layouts. The process-wide cache is not used in this mode.
+        :param lazy: If True, nested layouts marked with 'deferred="true"' attribute are not built immediately - they
+            are replaced with DeferredLayoutWidget placeholders that build them when they become visible to the user
+            for the first time - e.g. hidden page of QStackedLayout is shown or the placeholder is scrolled into view
+            (or when their 'materialize' method is called). Generated modules are not used in this mode.
+        :param use_precompiled: If True and there is up-to-date artifact precompiled for desired layout by
+            'LayoutPrecompiler', the layout is built from this artifact - without parsing the XML file. Artifacts are
+            not used in streaming mode.
+        :return: QtWidgets.QLayout object with all the layouts and widgets described in XML config file.
+        """
+        with cls.traceContext(config_filepath, layout_name):
+            if BinaryConfigReader.isBinaryConfig(config_filepath):
+                layout_plan = BinaryConfigReader.returnReader(config_filepath).returnLayoutPlan(layout_name)
+                with cls.symbol_resolver.buildScope(), (cls.traceEvent('build', layout_name)
+                                                        if cls.instrumentation is not None else NO_TRACE):
+                    return layout_plan.build(base_object, lazy)
+
+            # The file is checked only once - its key is passed to all the lookups below.
+            file_key = ParsedConfigCache.returnFileKey(config_filepath) if use_cache else None
+
+            # Generated modules create objects without the builder - so they cannot be used inside build transaction
+            # nor with widget pool (their widgets would be neither taken from the pool nor recycled).
+            if (use_cache and use_generated and not lazy and cls.widget_pool is None and
+                    cls.returnBuildTransaction() is None):
+                generated_module = LayoutCodeGenerator.returnGeneratedModule(config_filepath, layout_name, file_key)
+                if generated_module is not None:
+                    with cls.traceEvent('build', layout_name) if cls.instrumentation is not None else NO_TRACE:
+                        return generated_module.buildLayout(base_object)
+
+            if use_cache and use_precompiled and not streaming:
+                layout_plan = LayoutPrecompiler.returnPrecompiledPlan(config_filepath, layout_name, file_key)
+                if layout_plan is not None:
+                    with cls.symbol_resolver.buildScope(), (cls.traceEvent('build', layout_name)
+                                                            if cls.instrumentation is not None else NO_TRACE):
+                        return layout_plan.build(base_object, lazy)
+
+            if streaming:
+                parsed_config = cls.loadLayoutStreaming(config_filepath, layout_name)
+            else:
+                parsed_config = cls.returnParsedConfig(config_filepath, use_cache, file_key)
+
+            # Check if layout with given name exists in the xml config file
+            layout_data = parsed_config.returnLayoutNode(layout_name)
+
+            # Call the recursive function responsible for layout building
+            with cls.symbol_resolver.buildScope(), (cls.traceEvent('build', layout_name)
+                                                    if cls.instrumentation is not None else NO_TRACE):
+                gui_layout = cls.buildGuiLayout(layout_data, parsed_config.modules_data, parsed_config.classes_data,
+                                                base_object, lazy)
+
+            return gui_layout
+
+    @classmethod
+    def returnGuiLayouts(cls, config_filepath: str, layout_names: list, base_object, use_cache: bool = True,
+                         lazy: bool = False) -> dict:
+        """
+        Returns many QLayout objects described in one XML config file. The file is parsed only once and all layouts
+        are checked before any of them is built.
+
+        :param config_filepath: String path to XML config file.
+        :param layout_names: List of names of the desired layouts described in the XML file.
+        :param base_object: Reference to the python object, that calls this function. If not used, pass 'None'.
+        :param use_cache: If True, parsed XML config file is taken from the process-wide cache (and stored there).
+        :param lazy: If True, nested layouts marked as deferred are built when they become visible to the user.
+        :return: Dictionary of layout names and QtWidgets.QLayout objects - in the same order as given names.
+        """
+        parsed_config = cls.returnParsedConfig(config_filepath, use_cache)
+
+        layouts_data = [(layout_name, parsed_config.returnLayoutNode(layout_name)) for layout_name in layout_names]
+
+        gui_layouts = dict()
+        with cls.symbol_resolver.buildScope():
+            for layout_name, layout_data in layouts_data:
+                with cls.traceContext(config_filepath, layout_name), (cls.traceEvent('build', layout_name)
+                                                                      if cls.instrumentation is not None
+                                                                      else NO_TRACE):
+                    gui_layouts[layout_name] = cls.buildGuiLayout(layout_data, parsed_config.modules_data,
+                                                                  parsed_config.classes_data, base_object, lazy)
+
+        return gui_layouts
+
+    @classmethod
+    def returnLiveGuiLayout(cls, config_filepath: str, layout_name: str, base_object,
+                            watch: bool = True) -> 'LiveLayoutReloader':
+        """
+        Builds GUI layout that is kept in sync with XML config file - after the file changes, only the changed
+        components are built again (see LiveLayoutReloader class).
+
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the desired layout described in the XML file.
+        :param base_object: Reference to the python object, that calls this function. If not used, pass 'None'.
+        :param watch: If True, the file is watched and the layout is reloaded after every change. If False, call
+            'reload' method of returned object.
+        :return: LiveLayoutReloader object - the layout is available as its 'gui_layout' attribute.
+        """
+        live_reloader = Widgets.LiveLayoutReloader(config_filepath, layout_name, base_object)
+        if watch:
+            live_reloader.start()
+
+        return live_reloader
+
+    @classmethod
+    def returnGuiLayoutIncremental(cls, config_filepath: str, layout_name: str, base_object,
+                                   progress_callback=None, finished_callback=None, use_cache: bool = True) \
+            -> 'IncrementalLayoutBuild':
+        """
+        Prepares incremental build of the layout described in given XML config file. The layout is built in small
+        steps - every component construction, feature implementation and nested layout insertion is a separate step.
+        Steps can be run in time slices - so the Qt event loop is not blocked for the whole build. Call 'start' method
+        of returned object to run the build by QTimer or call its 'pump' method manually.
+
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the desired layout described in the XML file.
+        :param base_object: Reference to the python object, that calls this function. If not used, pass 'None'.
+        :param progress_callback: Callable called after every time slice with two arguments - number of done steps
+            and number of all steps. If not used, pass 'None'.
+        :param finished_callback: Callable called with built QLayout object when the build is done. If not used,
+            pass 'None'.
+        :param use_cache: If True, parsed XML config file is taken from the process-wide cache (and stored there).
+        :return: IncrementalLayoutBuild object.
+        """
+        parsed_config = cls.returnParsedConfig(config_filepath, use_cache)
+        # Both the counting and the build go through 'repeat' nodes - so they are expanded once, before both of them
+        # (python iterables of 'repeat' nodes may be one-shot, e.g. generators).
+        layout_data = cls.returnExpandedLayoutNode(parsed_config.returnLayoutNode(layout_name),
+                                                   parsed_config.modules_data, base_object)
+
+        build_steps = cls.iterGuiLayout(layout_data, parsed_config.modules_data, parsed_config.classes_data,
+                                        base_object)
+
+        steps_count = cls.countBuildSteps(layout_data, parsed_config.modules_data, base_object)
+
+        return IncrementalLayoutBuild(build_steps, steps_count, cls.symbol_resolver, progress_callback,
+                                      finished_callback)
+
+    @classmethod
+    async def returnGuiLayoutAsync(cls, config_filepath: str, layout_name: str, base_object,
+                                   use_cache: bool = True) -> QtWidgets.QLayout:
+        """
+        Coroutine that returns QLayout object described in given XML config file. Parsing of the file and resolving of
+        module-level objects is done by worker thread - only the construction of GUI components is done by the thread
+        of running event loop. So the event loop must run in the Qt main thread - e.g. with qasync.
+
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the desired layout described in the XML file.
+        :param base_object: Reference to the python object, that calls this function. If not used, pass 'None'.
+        :param use_cache: If True, parsed XML config file and compiled plan are taken from the process-wide cache.
+        :return: QtWidgets.QLayout object. Errors of the preparation are raised as LayoutBuildError.
+        """
+        loop = asyncio.get_running_loop()
+        layout_plan = await loop.run_in_executor(cls.returnPrepareExecutor(), cls.prepareLayoutPlan,
+                                                 config_filepath, layout_name, use_cache)
+
+        return layout_plan.build(base_object)
+
+    @classmethod
+    def submitGuiLayout(cls, config_filepath: str, layout_name: str, base_object,
+                        use_cache: bool = True) -> futures.Future:
+        """
+        Starts asynchronous build of the layout described in given XML config file. Parsing of the file and resolving
+        of module-level objects is done by worker thread, then the construction of GUI components is passed to the Qt
+        main thread - it is done when the Qt event loop processes the events. This method must be called from the
+        Qt main thread.
+
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the desired layout described in the XML file.
+        :param base_object: Reference to the python object, that calls this function. If not used, pass 'None'.
+        :param use_cache: If True, parsed XML config file and compiled plan are taken from the process-wide cache.
+        :return: concurrent.futures.Future object - its result is QtWidgets.QLayout object. Errors of the preparation
+            are set on it as LayoutBuildError.
+        """
+        gui_invoker = cls.returnGuiInvoker()
+        layout_future = futures.Future()
+
+        def buildPreparedLayout(prepare_future: futures.Future):
+            # Called in the Qt main thread.
+            if not layout_future.set_running_or_notify_cancel():
+                return
+            try:
+                layout_future.set_result(prepare_future.result().build(base_object))
+            except BaseException as build_error:
+                layout_future.set_exception(build_error)
+
+        prepare_future = cls.returnPrepareExecutor().submit(cls.prepareLayoutPlan, config_filepath, layout_name,
+                                                            use_cache)
+        prepare_future.add_done_callback(lambda done_future: gui_invoker.invoke(buildPreparedLayout, done_future))
+
+        return layout_future
+
+    @classmethod
+    def prepareLayoutPlan(cls, config_filepath: str, layout_name: str, use_cache: bool = True) -> 'LayoutPlan':
+        """
+        Compiles the layout for asynchronous build - called by worker thread. All errors (e.g. missing file or wrong
+        layout name) are raised as LayoutBuildError.
+
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the desired layout described in the XML file.
+        :param use_cache: If True, parsed XML config file and compiled plan are taken from the process-wide cache.
+        :return: LayoutPlan object.
+        """
+        try:
+            return cls.compileLayout(config_filepath, layout_name, use_cache)
+        except LayoutBuildError:
+            raise
+        except Exception as prepare_error:
+            raise LayoutBuildError('Cannot prepare layout (' + type(prepare_error).__name__ + ': ' +
+                                   str(prepare_error) + ')', None, config_filepath, layout_name) from prepare_error
+
+    @classmethod
+    def returnPrepareExecutor(cls) -> futures.ThreadPoolExecutor:
+        """
+        Returns the pool of worker threads used for preparing layouts - it is created on the first call.
+
+        :return: concurrent.futures.ThreadPoolExecutor object.
+        """
+        with cls._executor_lock:
+            if cls.prepare_executor is None:
+                cls.prepare_executor = futures.ThreadPoolExecutor(max_workers=cls.prepare_max_workers,
+                                                                  thread_name_prefix='gui_builder_prepare')
+            return cls.prepare_executor
+
+    @classmethod
+    def returnGuiInvoker(cls) -> 'GuiThreadInvoker':
+        """
+        Returns the object that passes function calls to the Qt main thread - it is created on the first call, so the
+        first call must be made from the Qt main thread.
+
+        :return: GuiThreadInvoker object.
+        """
+        with cls._executor_lock:
+            if cls._gui_invoker is None:
+                cls._gui_invoker = Widgets.GuiThreadInvoker()
+            return cls._gui_invoker
+
+    @classmethod
+    def releaseGuiLayout(cls, gui_layout: QtWidgets.QLayout):
+        """
+        Takes all widgets out of given layout - before the layout is thrown away. Widgets built through
+        'widget_pool' are returned to it (so the next builds can reuse them), the other ones are deleted.
+
+        :param gui_layout: QLayout object - e.g. built by 'returnGuiLayout' method.
+        :return: None
+        """
+        # Empty pool does not store any widgets - so all of them are deleted.
+        widget_pool = cls.widget_pool if cls.widget_pool is not None else WidgetPool(0)
+        widget_pool.releaseLayout(gui_layout)
+
+    @classmethod
+    def buildTransaction(cls, target_widget: QtWidgets.QWidget = None) -> 'BuildTransaction':
+        """
+        Returns context manager of transactional build. Layouts built inside it (in the current thread) are built with
+        signals of all created objects blocked. Updates of the target widget are disabled and its layout is activated
+        only once - when the transaction is committed. Generated modules are not used inside the transaction. E.g.:
+
+            with PyQT5_GUI_Builder.buildTransaction(widget) as transaction:
+                widget.setLayout(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, layout_name, base_object))
+            print(transaction.stats)
+
+        :param target_widget: QWidget object that receives built layout inside the transaction. If not used, pass
+            'None'.
+        :return: BuildTransaction object.
+        """
+        return Widgets.BuildTransaction(target_widget)
+
+    @classmethod
+    def returnBuildTransaction(cls) -> 'BuildTransaction':
+        """
+        Returns build transaction open in the current thread.
+
+        :return: BuildTransaction object or None.
+        """
+        return getattr(cls._build_transaction, 'value', None)
+
+    @classmethod
+    def traceEvent(cls, category: str, name: str, component_class: str = None):
+        """
+        Returns context manager that measures given part of the build with current instrumentation. Call sites check
+        if 'instrumentation' is set before calling this method - so disabled instrumentation costs only this check.
+
+        :param category: String category of the event.
+        :param name: String name of the event.
+        :param component_class: Name of the class of the component (None if not applicable).
+        :return: Context manager.
+        """
+        instrumentation = cls.instrumentation
+        if instrumentation is None:
+            return NO_TRACE
+
+        return instrumentation.traceEvent(category, name, component_class)
+
+    @classmethod
+    @contextmanager
+    def traceContext(cls, config_filepath: str, layout_name: str):
+        """
+        Context manager that sets XML config file and layout name reported with build events of the current thread.
+
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the built layout.
+        :return: None
+        """
+        previous_context = getattr(cls._trace_context, 'value', (None, None))
+        cls._trace_context.value = (config_filepath, layout_name)
+        try:
+            yield
+        finally:
+            cls._trace_context.value = previous_context
+
+    @classmethod
+    def returnTraceContext(cls) -> tuple:
+        """
+        Returns XML config file and layout name of the build running in the current thread.
+
+        :return: Tuple - ( config file path, layout name ) - with None values if unknown.
+        """
+        return getattr(cls._trace_context, 'value', (None, None))
+
+    @classmethod
+    def returnParsedConfig(cls, config_filepath: str, use_cache: bool = True, file_key: tuple = None) -> ParsedConfig:
+        """
+        Returns parsed XML config file - from the process-wide cache or read directly from disk.
+
+        :param config_filepath: String path to XML config file.
+        :param use_cache: If True, the process-wide cache is used.
+        :param file_key: Key of the current version of the file returned by 'ParsedConfigCache.returnFileKey' method
+            - if the caller already has it.
+        :return: ParsedConfig object for given file.
+        """
+        if use_cache:
+            return cls.config_cache.returnParsedConfig(config_filepath, cls.loadParsedConfig, file_key)
+
+        return cls.loadParsedConfig(config_filepath, False)
+
+    @classmethod
+    def loadParsedConfig(cls, config_filepath: str, use_cache: bool = True) -> ParsedConfig:
+        """
+        Reads and parses given XML config file - without using the cache.
+
+        :param config_filepath: String path to XML config file.
+        :param use_cache: If True, files included by given file are taken from the process-wide cache.
+        :return: ParsedConfig object for given file.
+        """
+        file_key = ParsedConfigCache.returnFileKey(config_filepath)
+
+        with cls.traceEvent('parse', config_filepath) if cls.instrumentation is not None else NO_TRACE:
+            config_tree = ET.parse(config_filepath)
+        # Import all config settings that the file contains
+        common_node = config_tree.find(XmlNodeNames.COMMON_DATA.value)
+
+        # Return information about: modules and classes listed in XML config file and in included files
+        included_configs = cls.returnIncludedConfigs(common_node, config_filepath, use_cache)
+        modules_data, classes_data = cls.mergeCommonData(included_configs, *cls.returnCommonData(common_node))
+
+        return ParsedConfig(config_filepath, config_tree, modules_data, classes_data, included_configs, file_key)
+
+    @classmethod
+    def returnIncludedConfigs(cls, common_node: ET.Element, config_filepath: str, use_cache: bool = True) -> tuple:
+        """
+        Returns parsed XML config files included by 'include' nodes placed in given 'common' node. Paths in 'file'
+        attributes are relative to the directory of the including file.
+
+        :param common_node: xml.etree.ElementTree.Element object that represents 'common' XML node (or None).
+        :param config_filepath: String path to XML config file that contains given 'common' node.
+        :param use_cache: If True, included files are taken from the process-wide cache.
+        :return: Tuple of ParsedConfig objects.
+        """
+        if common_node is None:
+            return ()
+
+        include_nodes = common_node.findall(XmlNodeNames.INCLUDE_NODE.value)
+        if not include_nodes:
+            return ()
+
+        config_path = os.path.abspath(config_filepath)
+        loading_configs = getattr(cls._loading_configs, 'value', None)
+        if loading_configs is None:
+            loading_configs = cls._loading_configs.value = list()
+
+        included_configs = list()
+        loading_configs.append(config_path)
+        try:
+            for include_node in include_nodes:
+                include_path = os.path.join(os.path.dirname(config_path),
+                                            include_node.attrib[XmlAttrsNames.INCLUDE_FILE.value])
+                if os.path.abspath(include_path) in loading_configs:
+                    raise LayoutBuildError('Circular include of ' + include_path, include_node, config_filepath)
+                try:
+                    included_configs.append(cls.returnParsedConfig(include_path, use_cache))
+                except LayoutBuildError:
+                    raise
+                except Exception as include_error:
+                    raise LayoutBuildError('Cannot include file (' + type(include_error).__name__ + ': ' +
+                                           str(include_error) + ')', include_node,
+                                           config_filepath) from include_error
+        finally:
+            loading_configs.pop()
+
+        return tuple(included_configs)
+
+    @staticmethod
+    def mergeCommonData(included_configs: tuple, modules_data: dict, classes_data: dict) -> tuple:
+        """
+        Merges the dictionaries of modules and classes of included files with the ones of the including file - its
+        own entries take precedence. If the file does not add anything to single included file, the dictionaries of
+        included file are shared, not copied.
+
+        :param included_configs: Tuple of ParsedConfig objects of included files.
+        :param modules_data: Dictionary of modules listed in the including file.
+        :param classes_data: Dictionary of classes listed in the including file.
+        :return: Tuple - ( dictionary of modules' data, dictionary of classes' data )
+        """
+        merged_data = list()
+
+        for data_name, own_data in (('modules_data', modules_data), ('classes_data', classes_data)):
+            included_data = [getattr(included_config, data_name) for included_config in included_configs]
+            if len(included_data) == 1 and not own_data:
+                merged_data.append(included_data[0])
+                continue
+            data = dict()
+            for single_data in included_data:
+                data.update(single_data)
+            data.update(own_data)
+            merged_data.append(data)
+
+        return tuple(merged_data)
+
+    @classmethod
+    def returnCommonData(cls, common_node: ET.Element) -> tuple:
+        """
+        Returns the dictionaries of modules and classes listed in 'common' XML node.
+
+        :param common_node: xml.etree.ElementTree.Element object that represents 'common' XML node.
+        :return: Tuple - ( dictionary of modules' data, dictionary of classes' data )
+        """
+        with cls.traceEvent('common_data', 'common') if cls.instrumentation is not None else NO_TRACE:
+            modules_data = cls.returnValuePairsList(common_node,
+                                                    XmlNodeNames.MODULES_LIST.value,
+                                                    XmlAttrsNames.MODULE_ID.value,
+                                                    XmlAttrsNames.MODULE_NAME.value)
+            classes_data = cls.returnValuePairsList(common_node,
+                                                    XmlNodeNames.CLASSES_LIST.value,
+                                                    XmlAttrsNames.CLASS_ID.value,
+                                                    XmlAttrsNames.CLASS_NAME.value)
+
+        return modules_data, classes_data
+
+    @classmethod
+    def loadLayoutStreaming(cls, config_filepath: str, layout_name: str) -> ParsedConfig:
+        """
+        Reads given XML config file incrementally (with xml.etree.ElementTree.iterparse) and keeps only the 'common'
+        node and the main-level 'layout' node with given name. All other nodes are cleared as soon as they are read.
+        Reading stops when both needed nodes are complete. The first layout with given name is used - the rest of the
+        file is not read, so unlike 'ParsedConfig.returnLayoutNode' method, duplicate names are not reported.
+
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Value of 'name' attribute of 'layout' XML node to be kept.
+        :return: ParsedConfig object with XML tree that contains only 'common' node and desired 'layout' node (if it
+            was found).
+        """
+        common_node = None
+        layout_node = None
+        root_node = None
+        # Stack of currently open XML nodes - the first one is the root node.
+        open_nodes = list()
+
+        with open(config_filepath, 'rb') as config_file, (cls.traceEvent('parse', config_filepath)
+                                                          if cls.instrumentation is not None else NO_TRACE):
+            for event, xml_node in ET.iterparse(config_file, events=('start', 'end')):
+                if event == 'start':
+                    if root_node is None:
+                        root_node = xml_node
+                    open_nodes.append(xml_node)
+                    continue
+
+                open_nodes.pop()
+                depth = len(open_nodes)
+
+                # Main-level nodes - 'common', 'layouts' etc.
+                if depth == 1:
+                    if xml_node.tag == XmlNodeNames.COMMON_DATA.value:
+                        common_node = xml_node
+                    else:
+                        xml_node.clear()
+                    root_node.remove(xml_node)
+                # Nodes listed in 'layouts' node - keep only the desired one.
+                elif depth == 2 and open_nodes[1].tag == XmlNodeNames.LAYOUTS_LIST.value:
+                    if (layout_node is None and xml_node.tag == XmlNodeNames.LAYOUT_NODE.value and
+                            xml_node.attrib.get(XmlAttrsNames.LAYOUT_NAME.value) == layout_name):
+                        layout_node = xml_node
+                    else:
+                        xml_node.clear()
+                    open_nodes[1].remove(xml_node)
+
+                if common_node is not None and layout_node is not None:
+                    break
+
+        # Rebuild minimal XML tree - so it can be processed the same way as the whole one.
+        config_root = ET.Element(root_node.tag if root_node is not None else 'body')
+        layouts_node = ET.SubElement(config_root, XmlNodeNames.LAYOUTS_LIST.value)
+        if common_node is not None:
+            config_root.insert(0, common_node)
+        if layout_node is not None:
+            layouts_node.append(layout_node)
+
+        included_configs = cls.returnIncludedConfigs(common_node, config_filepath)
+        modules_data, classes_data = cls.mergeCommonData(included_configs, *cls.returnCommonData(common_node))
+
+        return ParsedConfig(config_filepath, ET.ElementTree(config_root), modules_data, classes_data,
+                            included_configs)
+
+    @staticmethod
+    def returnValuePairsList(data_xml_node: ET.Element,
+                             setting_list_node: str, data_id_attr: str, data_value_attr: str) -> dict:
+        """
+        Returns simple dictionary of key-value pairs based on given list of XML nodes. Key-value pairs are made based
+        on given XML attributes' names - one for dictionary key and second for value.
+
+        :param data_xml_node: xml.etree.ElementTree.Element object that contains lists of XML nodes.
+        :param setting_list_node: String name of XML node that represents desired list of XML nodes.
+        :param data_id_attr: String name of XML attribute that represents key for result dictionary.
+        :param data_value_attr: String name of XML attribute that represents value for result dictionary.
+        :return: Dictionary of simple key:value pairs.
+        """
+        data = dict()
+
+        # Files that include other files do not have to list any modules or classes.
+        data_list = data_xml_node.find(setting_list_node) if data_xml_node is not None else None
+        if data_list is None:
+            return data
+
+        for piece_of_data in data_list:
+            data_id = piece_of_data.attrib[data_id_attr]
+            data_value = piece_of_data.attrib[data_value_attr]
+            data[data_id] = data_value
+
+        return data
+
+    @staticmethod
+    def returnLayoutNode(config_tree: ET.ElementTree, layout_name: str) -> ET.Element:
+        """
+        Returns 'layout' node (found at main level) from XML config file, that contains 'name' attribute with given
+        value.
+
+        :param config_tree: xml.etree.ElementTree object that represents whole XML tree read from XML file.
+        :param layout_name: String value for 'name' attribute of 'layout' XML node to be found.
+        :return: xml.etree.ElementTree.Element object describing desired layout (or None if no layout found).
+        """
+        layouts_node = config_tree.find(XmlNodeNames.LAYOUTS_LIST.value)
+        lay_name_attr = XmlAttrsNames.LAYOUT_NAME.value
+
+        for layout in layouts_node:
+            if layout.attrib[lay_name_attr] == layout_name:
+                return layout
+
+        return None
+
+    @classmethod
+    def buildGuiLayout(cls, layout_node: ET.Element, modules_data: dict, classes_data: dict, base_object,
+                       lazy: bool = False) -> QtWidgets.QLayout:
+        """
+        Recursive class method responsible for building process of given PyQt5 layout.
+
+        :param layout_node: xml.etree.ElementTree.Element object that represents XML node describing desired
+            PyQt5 layout.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :param classes_data: Dictionary of key-value pairs containing information about classes listed in XML file.
+        :param base_object: Reference to the python object, that calls this function. If not used, pass 'None'.
+        :param lazy: If True, nested layouts marked as deferred are replaced with DeferredLayoutWidget placeholders.
+        :return: QtWidgets.QLayout object with all component layouts and widgets - as described in XML file.
+        """
+        if cls.instrumentation is not None:
+            with cls.traceEvent('layout', layout_node.attrib.get(XmlAttrsNames.LAYOUT_NAME.value)):
+                return cls.buildGuiLayoutComponents(layout_node, modules_data, classes_data, base_object, lazy)
+
+        return cls.buildGuiLayoutComponents(layout_node, modules_data, classes_data, base_object, lazy)
+
+    @classmethod
+    def buildGuiLayoutComponents(cls, layout_node: ET.Element, modules_data: dict, classes_data: dict, base_object,
+                                 lazy: bool = False) -> QtWidgets.QLayout:
+        """
+        Builds given PyQt5 layout with all its components - called by 'buildGuiLayout' method.
+
+        :param layout_node: xml.etree.ElementTree.Element object that represents XML node describing desired
+            PyQt5 layout.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :param classes_data: Dictionary of key-value pairs containing information about classes listed in XML file.
+        :param base_object: Reference to the python object, that calls this function. If not used, pass 'None'.
+        :param lazy: If True, nested layouts marked as deferred are replaced with DeferredLayoutWidget placeholders.
+        :return: QtWidgets.QLayout object with all component layouts and widgets - as described in XML file.
+        """
+        # Read the list of 'component' nodes under given 'layout' node - with 'repeat' nodes expanded.
+        layout_components = layout_node.find(XmlNodeNames.COMPONENTS_LIST.value)
+
+        if cls.isVirtualLayout(layout_node):
+            main_layout, cells = cls.collectVirtualGridCells(None, cls.iterLayoutComponents(layout_components,
+                                                                                            modules_data,
+                                                                                            base_object),
+                                                             modules_data, classes_data, base_object, dict())
+            main_layout.addWidget(Widgets.VirtualGridView(cells,
+                                                          layout_node.attrib.get(XmlAttrsNames.LAYOUT_NAME.value)))
+            return main_layout
+
+        return cls.addLayoutComponents(None, cls.iterLayoutComponents(layout_components, modules_data, base_object),
+                                       modules_data, classes_data, base_object, lazy)
+
+    @classmethod
+    def addLayoutComponents(cls, main_layout: QtWidgets.QLayout, component_nodes, modules_data: dict,
+                            classes_data: dict, base_object, lazy: bool = False) -> QtWidgets.QLayout:
+        """
+        Builds components described by given XML nodes and adds them to the layout.
+
+        :param main_layout: QtWidgets.QLayout object the components are added to. Pass 'None' if the layout is not
+            created yet - then the 'component' node with 'self' type creates it.
+        :param component_nodes: Iterable of 'component' and 'layout' XML nodes.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :param classes_data: Dictionary of key-value pairs containing information about classes listed in XML file.
+        :param base_object: Reference to the python object, that calls this function. If not used, pass 'None'.
+        :param lazy: If True, nested layouts marked as deferred are replaced with DeferredLayoutWidget placeholders.
+        :return: QtWidgets.QLayout object with added components.
+        """
+        for component_node in component_nodes:
+            # Read the 'row' and 'column' attributes of given 'component' node - if they exist.
+            # They exist if the 'component' node is under 'layout' node that represents QGridLayout object.
+            placement_args = cls.returnComponentPlacementArgs(component_node)
+
+            # If the next node that occurred is a 'component' node - build QWidget object based on it and add it to
+            # existing layout.
+            if component_node.tag == XmlNodeNames.COMPONENT_NODE.value:
+
+                # Read the 'type' attribute of the current 'component' node. 'self' means, that this node represents
+                # the constructor for main Layout object. 'widget' means that this node is for component QWidget object.
+                component_type = component_node.attrib[XmlAttrsNames.COMPONENT_TYPE.value]
+                # Build single component object (QWidget or main QLayout) based on the current XML node.
+                component_object = cls.buildComponentObject(component_node, modules_data, classes_data, base_object)
+
+                if component_type == XmlCommonAttrValues.COMPONENT_TYPE_SELF.value:
+                    main_layout = component_object
+                elif component_type == XmlCommonAttrValues.COMPONENT_TYPE_WIDGET.value:
+                    with cls.traceEvent('insert', 'addWidget') if cls.instrumentation is not None else NO_TRACE:
+                        main_layout.addWidget(component_object, *placement_args)
+
+            # If the next node that occurred is a 'layout' node - call this function once again - to build
+            # this component layout and add it to the existing layout.
+            elif component_node.tag == XmlNodeNames.LAYOUT_NODE.value:
+                # In lazy mode the deferred layout is replaced with placeholder widget - it builds the layout later.
+                if lazy and cls.isDeferredLayout(component_node):
+                    main_layout.addWidget(cls.returnDeferredLayoutWidget(component_node, modules_data, classes_data,
+                                                                         base_object),
+                                          *placement_args)
+                    continue
+
+                nested_layout = cls.buildGuiLayout(component_node, modules_data, classes_data, base_object, lazy)
+                with cls.traceEvent('insert', 'addLayout') if cls.instrumentation is not None else NO_TRACE:
+                    main_layout.addLayout(nested_layout, *placement_args)
+
+        return main_layout
+
+    @staticmethod
+    def isDeferredLayout(layout_node: ET.Element) -> bool:
+        """
+        Checks if given 'layout' node is marked as deferred - with 'deferred="true"' attribute.
+
+        :param layout_node: xml.etree.ElementTree.Element object that represents 'layout' XML node.
+        :return: True if the layout can be built lazily.
+        """
+        return (layout_node.attrib.get(XmlAttrsNames.LAYOUT_DEFERRED.value, '').lower() ==
+                XmlCommonAttrValues.LAYOUT_DEFERRED_TRUE.value)
+
+    @staticmethod
+    def isVirtualLayout(layout_node: ET.Element) -> bool:
+        """
+        Checks if given 'layout' node is marked as virtual - with 'virtual="true"' attribute. Cells of such grid layout
+        are shown by VirtualGridView and their widgets are built when they become visible.
+
+        :param layout_node: xml.etree.ElementTree.Element object that represents 'layout' XML node.
+        :return: True if the layout is virtualized.
+        """
+        return (layout_node.attrib.get(XmlAttrsNames.LAYOUT_VIRTUAL.value, '').lower() ==
+                XmlCommonAttrValues.LAYOUT_VIRTUAL_TRUE.value)
+
+    @classmethod
+    def collectVirtualGridCells(cls, main_layout: QtWidgets.QLayout, component_nodes, modules_data: dict,
+                                classes_data: dict, base_object, cells: dict) -> tuple:
+        """
+        Builds the main layout of virtual grid layout and collects the functions that build its cells. Components
+        of other types than 'self' and 'widget' are built immediately - as in not virtualized layout.
+
+        :param main_layout: QtWidgets.QLayout object - 'None' if it is not created yet.
+        :param component_nodes: Iterable of 'component' and 'layout' XML nodes.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :param classes_data: Dictionary of key-value pairs containing information about classes listed in XML file.
+        :param base_object: Reference to the python object, that calls the build.
+        :param cells: Dictionary to be filled - ( row, column ) tuples and callables that build the cells' widgets.
+        :return: Tuple - ( main QLayout object, dictionary of cells )
+        """
+        for component_node in component_nodes:
+            if component_node.tag == XmlNodeNames.COMPONENT_NODE.value:
+                component_type = component_node.attrib[XmlAttrsNames.COMPONENT_TYPE.value]
+                if component_type == XmlCommonAttrValues.COMPONENT_TYPE_SELF.value:
+                    main_layout = cls.buildComponentObject(component_node, modules_data, classes_data, base_object)
+                    continue
+                if component_type != XmlCommonAttrValues.COMPONENT_TYPE_WIDGET.value:
+                    cls.buildComponentObject(component_node, modules_data, classes_data, base_object)
+                    continue
+            elif component_node.tag != XmlNodeNames.LAYOUT_NODE.value:
+                continue
+
+            placement_args = cls.returnComponentPlacementArgs(component_node)
+            if not placement_args:
+                raise LayoutBuildError('Components of virtual grid layout must have "row" and "column" attributes',
+                                       component_node)
+            cells[tuple(placement_args)] = partial(cls.buildVirtualGridCell, component_node, modules_data,
+                                                   classes_data, base_object)
+
+        return main_layout, cells
+
+    @classmethod
+    def buildVirtualGridCell(cls, component_node: ET.Element, modules_data: dict, classes_data: dict,
+                             base_object) -> QtWidgets.QWidget:
+        """
+        Builds the widget of single cell of virtual grid layout - the same way as in not virtualized layout. Nested
+        layouts are placed inside QWidget object.
+
+        :param component_node: xml.etree.ElementTree.Element object that represents 'component' or 'layout' XML node.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :param classes_data: Dictionary of key-value pairs containing information about classes listed in XML file.
+        :param base_object: Reference to the python object, that calls the build.
+        :return: QWidget object.
+        """
+        with cls.symbol_resolver.buildScope():
+            if component_node.tag == XmlNodeNames.COMPONENT_NODE.value:
+                return cls.buildComponentObject(component_node, modules_data, classes_data, base_object)
+
+            return Widgets.VirtualGridView.returnLayoutWidget(cls.buildGuiLayout(component_node, modules_data,
+                                                                                 classes_data, base_object))
+
+    @classmethod
+    def returnDeferredLayoutWidget(cls, layout_node: ET.Element, modules_data: dict, classes_data: dict,
+                                   base_object) -> 'DeferredLayoutWidget':
+        """
+        Returns placeholder widget that builds given layout when it is needed.
+
+        :param layout_node: xml.etree.ElementTree.Element object that represents deferred 'layout' XML node.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :param classes_data: Dictionary of key-value pairs containing information about classes listed in XML file.
+        :param base_object: Reference to the python object, that calls the build.
+        :return: DeferredLayoutWidget object.
+        """
+        def buildDeferredLayout():
+            with cls.symbol_resolver.buildScope():
+                return cls.buildGuiLayout(layout_node, modules_data, classes_data, base_object, True)
+
+        return Widgets.DeferredLayoutWidget(buildDeferredLayout,
+                                            layout_node.attrib.get(XmlAttrsNames.LAYOUT_NAME.value))
+
+    @classmethod
+    def iterGuiLayout(cls, layout_node: ET.Element, modules_data: dict, classes_data: dict, base_object):
+        """
+        Recursive generator that builds given layout step by step - the same way as 'buildGuiLayout' method does. It
+        yields (None) after every component construction, feature implementation and nested layout insertion. The
+        built QLayout object is the return value of the generator.
+
+        :param layout_node: xml.etree.ElementTree.Element object that represents XML node describing desired
+            PyQt5 layout.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :param classes_data: Dictionary of key-value pairs containing information about classes listed in XML file.
+        :param base_object: Reference to the python object, that calls this function. If not used, pass 'None'.
+        :return: Generator object - its return value is QtWidgets.QLayout object.
+        """
+        # Virtual grid layout builds only its main layout now - so it is built in one step.
+        if cls.isVirtualLayout(layout_node):
+            main_layout = cls.buildGuiLayout(layout_node, modules_data, classes_data, base_object)
+            yield
+            return main_layout
+
+        main_layout = None
+        layout_components = layout_node.find(XmlNodeNames.COMPONENTS_LIST.value)
+
+        for component_node in cls.iterLayoutComponents(layout_components, modules_data, base_object):
+            placement_args = cls.returnComponentPlacementArgs(component_node)
+
+            if component_node.tag == XmlNodeNames.COMPONENT_NODE.value:
+                component_type = component_node.attrib[XmlAttrsNames.COMPONENT_TYPE.value]
+                component_object = cls.constructComponentObject(component_node, modules_data, classes_data,
+                                                                base_object)
+                yield
+
+                component_features = component_node.find(XmlNodeNames.FEATURES_LIST.value)
+                if component_features:
+                    for feature_node in component_features:
+                        component_object = cls.implementFeature(component_object, feature_node, modules_data,
+                                                                base_object)
+                        yield
+
+                if component_type == XmlCommonAttrValues.COMPONENT_TYPE_SELF.value:
+                    main_layout = component_object
+                elif component_type == XmlCommonAttrValues.COMPONENT_TYPE_WIDGET.value:
+                    main_layout.addWidget(component_object, *placement_args)
+
+            elif component_node.tag == XmlNodeNames.LAYOUT_NODE.value:
+                nested_layout = yield from cls.iterGuiLayout(component_node, modules_data, classes_data, base_object)
+                main_layout.addLayout(nested_layout, *placement_args)
+                yield
+
+        return main_layout
+
+    @classmethod
+    def countBuildSteps(cls, layout_node: ET.Element, modules_data: dict = None, base_object=None) -> int:
+        """
+        Returns the number of steps made by 'iterGuiLayout' generator for given layout.
+
+        :param layout_node: xml.etree.ElementTree.Element object that represents 'layout' XML node.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file -
+            needed to expand 'repeat' nodes driven by module-level iterables.
+        :param base_object: Reference to the python object, that calls the build - needed to expand 'repeat' nodes
+            driven by iterables of base object.
+        :return: Number of build steps.
+        """
+        if cls.isVirtualLayout(layout_node):
+            return 1
+
+        steps_count = 0
+
+        for component_node in cls.iterLayoutComponents(layout_node.find(XmlNodeNames.COMPONENTS_LIST.value),
+                                                       modules_data, base_object):
+            if component_node.tag == XmlNodeNames.COMPONENT_NODE.value:
+                component_features = component_node.find(XmlNodeNames.FEATURES_LIST.value)
+                steps_count += 1 + (len(component_features) if component_features is not None else 0)
+            elif component_node.tag == XmlNodeNames.LAYOUT_NODE.value:
+                steps_count += 1 + cls.countBuildSteps(component_node, modules_data, base_object)
+
+        return steps_count
+
+    @classmethod
+    def returnExpandedLayoutNode(cls, layout_node: ET.Element, modules_data: dict, base_object) -> ET.Element:
+        """
+        Recursive class method that returns copy of given 'layout' node with 'repeat' nodes (also the ones in nested
+        layouts) replaced by their expanded content - so python iterables of 'repeat' nodes are read only once, even
+        if the layout is gone through many times.
+
+        :param layout_node: xml.etree.ElementTree.Element object that represents 'layout' XML node.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :param base_object: Reference to the python object, that calls the build.
+        :return: xml.etree.ElementTree.Element object - new 'layout' node without 'repeat' nodes.
+        """
+        expanded_node = ET.Element(layout_node.tag, layout_node.attrib)
+
+        for child_node in layout_node:
+            if child_node.tag != XmlNodeNames.COMPONENTS_LIST.value:
+                expanded_node.append(child_node)
+                continue
+
+            expanded_components = ET.SubElement(expanded_node, child_node.tag, child_node.attrib)
+            for component_node in cls.iterLayoutComponents(child_node, modules_data, base_object):
+                if component_node.tag == XmlNodeNames.LAYOUT_NODE.value:
+                    component_node = cls.returnExpandedLayoutNode(component_node, modules_data, base_object)
+                expanded_components.append(component_node)
+
+        return expanded_node
+
+    @classmethod
+    def iterLayoutComponents(cls, layout_components: ET.Element, modules_data: dict, base_object,
+                             expand_items: bool = True):
+        """
+        Generator that yields 'component' and 'layout' nodes of given 'components' node - with 'repeat' nodes replaced
+        by their expanded content.
+
+        :param layout_components: xml.etree.ElementTree.Element object that represents 'components' XML node.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :param base_object: Reference to the python object, that calls the build.
+        :param expand_items: If False, 'repeat' nodes driven by python iterables are yielded without expansion - used
+            when the layout is compiled, before the items are known.
+        :return: Generator object.
+        """
+        for component_node in layout_components:
+            if component_node.tag != XmlNodeNames.REPEAT_NODE.value:
+                yield component_node
+            elif not expand_items and XmlAttrsNames.REPEAT_ITEMS.value in component_node.attrib:
+                yield component_node
+            else:
+                yield from cls.iterRepeatNodes(component_node, modules_data, base_object, expand_items)
+
+    @classmethod
+    def iterRepeatNodes(cls, repeat_node: ET.Element, modules_data: dict, base_object, expand_items: bool = True):
+        """
+        Generator that expands 'repeat' node - it yields the content of the node once per item, with '$index' and
+        '$item' placeholders (or the names given by 'index_name' and 'item_name' attributes) in attributes' values
+        replaced. If items are dictionaries, their keys can be used as placeholders too.
+        Items are the numbers from 'start' (default 0) - if 'count' attribute is specified - or the elements of python
+        iterable named by 'items' attribute - read from module or base object, the same way as 'var' arguments are
+        ('parent_type_id' attribute, and 'module_id' for module-level objects).
+
+        :param repeat_node: xml.etree.ElementTree.Element object that represents 'repeat' XML node.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :param base_object: Reference to the python object, that calls the build.
+        :param expand_items: If False, nested 'repeat' nodes driven by python iterables are yielded without expansion.
+        :return: Generator object.
+        """
+        start = int(repeat_node.attrib.get(XmlAttrsNames.REPEAT_START.value, '0'))
+        index_name = repeat_node.attrib.get(XmlAttrsNames.REPEAT_INDEX_NAME.value,
+                                            XmlCommonAttrValues.REPEAT_INDEX_NAME_DEFAULT.value)
+        item_name = repeat_node.attrib.get(XmlAttrsNames.REPEAT_ITEM_NAME.value,
+                                           XmlCommonAttrValues.REPEAT_ITEM_NAME_DEFAULT.value)
+
+        items_name = repeat_node.attrib.get(XmlAttrsNames.REPEAT_ITEMS.value)
+        if items_name is None:
+            items = range(start, start + int(repeat_node.attrib[XmlAttrsNames.REPEAT_COUNT.value]))
+        else:
+            items = cls.getObjectBasedOnParentType(repeat_node, modules_data, items_name, None, base_object)
+
+        # Prepare the content of the node once - parts without placeholders are shared by all copies.
+        node_templates = [cls.compileNodeTemplate(child_node) for child_node in repeat_node]
+
+        for item_index, item in enumerate(items, start):
+            mapping = {str(key): str(value) for key, value in item.items()} if isinstance(item, Mapping) else dict()
+            mapping[index_name] = str(item_index)
+            mapping[item_name] = str(item)
+
+            for node_template in node_templates:
+                component_node = cls.fillNodeTemplate(node_template, mapping)
+                if component_node.tag != XmlNodeNames.REPEAT_NODE.value:
+                    yield component_node
+                elif not expand_items and XmlAttrsNames.REPEAT_ITEMS.value in component_node.attrib:
+                    yield component_node
+                else:
+                    yield from cls.iterRepeatNodes(component_node, modules_data, base_object, expand_items)
+
+    @classmethod
+    def compileNodeTemplate(cls, xml_node: ET.Element):
+        """
+        Recursive class method that prepares XML node for substitution of placeholders.
+
+        :param xml_node: xml.etree.ElementTree.Element object.
+        :return: The same XML node if neither it nor its children contain placeholders. Otherwise tuple - ( XML node,
+            dictionary of attributes' names and string.Template objects, tuple of children's templates ).
+        """
+        children_templates = tuple(cls.compileNodeTemplate(child_node) for child_node in xml_node)
+        attrs_templates = {attr_name: Template(attr_value) for attr_name, attr_value in xml_node.attrib.items()
+                           if '$' in attr_value}
+
+        if not attrs_templates and all(child_template is child_node
+                                       for child_template, child_node in zip(children_templates, xml_node)):
+            return xml_node
+
+        return xml_node, attrs_templates, children_templates
+
+    @classmethod
+    def fillNodeTemplate(cls, node_template, mapping: dict) -> ET.Element:
+        """
+        Recursive class method that returns XML node with placeholders replaced by values from given mapping.
+
+        :param node_template: Object returned by 'compileNodeTemplate' method.
+        :param mapping: Dictionary of placeholders' names and values.
+        :return: xml.etree.ElementTree.Element object.
+        """
+        if isinstance(node_template, ET.Element):
+            return node_template
+
+        xml_node, attrs_templates, children_templates = node_template
+        attributes = dict(xml_node.attrib)
+        for attr_name, attr_template in attrs_templates.items():
+            attributes[attr_name] = attr_template.safe_substitute(mapping)
+
+        filled_node = ET.Element(xml_node.tag, attributes)
+        filled_node.extend([cls.fillNodeTemplate(child_template, mapping) for child_template in children_templates])
+
+        return filled_node
+
+    @staticmethod
+    def returnComponentPlacementArgs(component_node: ET.Element):
+        """
+        Function to return array containing values of 'row' and 'column' attributes of 'component' or nested 'layout'
+        nodes - if they exist. They exist if the parent layout object is a QGridLayout - they are needed to place the
+        component inside QGridLayout object.
+
+        :param component_node: xml.etree.ElementTree.Element object that represents current 'component' or
+            nested 'layout' XML node
+        :return: List containing 'row' and 'column' attrs' values - if they exist. If not - empty list.
+        """
+        placement_args = []
+        if (XmlAttrsNames.COMPONENT_ROW.value in component_node.attrib and
+                XmlAttrsNames.COMPONENT_COLUMN.value in component_node.attrib):
+            placement_args.append(int(component_node.attrib[XmlAttrsNames.COMPONENT_ROW.value]))
+            placement_args.append(int(component_node.attrib[XmlAttrsNames.COMPONENT_COLUMN.value]))
+
+        return placement_args
+
+    @classmethod
+    def buildComponentObject(cls, component_node: ET.Element, modules_data: dict, classes_data: dict, base_object):
+        """
+        Method to build a single component of PyQt5 layout based on the given XML node object.
+
+        :param component_node: xml.etree.ElementTree.Element object that represents 'component' XML node.
+        :param modules_data: Dictionary of key-value pairs containing info about modules listed in XML config file
+            ('module' nodes).
+        :param classes_data: Dictionary of key-value pairs containing info about classes listed in XML config file
+            ('class' nodes).
+        :param base_object: Reference to python object that called this function (or acts like a host-object for result
+            layout - e.g. contains methods that need to be connected to buttons etc...).
+        :return: QWidget or QLayout object.
+        """
+        if cls.instrumentation is not None:
+            class_name = classes_data.get(component_node.attrib.get(XmlAttrsNames.COMPONENT_CLASS_ID.value))
+            with cls.traceEvent('component', class_name, class_name):
+                return cls.buildComponentObjectFeatures(component_node, modules_data, classes_data, base_object)
+
+        return cls.buildComponentObjectFeatures(component_node, modules_data, classes_data, base_object)
+
+    @classmethod
+    def buildComponentObjectFeatures(cls, component_node: ET.Element, modules_data: dict, classes_data: dict,
+                                     base_object):
+        """
+        Creates a single component of PyQt5 layout and implements all its features - called by 'buildComponentObject'
+        method.
+
+        :param component_node: xml.etree.ElementTree.Element object that represents 'component' XML node.
+        :param modules_data: Dictionary of key-value pairs containing info about modules listed in XML config file.
+        :param classes_data: Dictionary of key-value pairs containing info about classes listed in XML config file.
+        :param base_object: Reference to python object that called this function.
+        :return: QWidget or QLayout object.
+        """
+        component_object = cls.constructComponentObject(component_node, modules_data, classes_data, base_object)
+
+        # Read list of 'feature' XML nodes for current PyQt5 GUI component. They represent various changes that can be
+        # applied to the current GUI component after its creation - e.g. changing the size, connecting PyQt5 signals...
+        component_features = component_node.find(XmlNodeNames.FEATURES_LIST.value)
+        if component_features:
+            # For every feature in the list - implement it
+            for feature_node in component_features:
+                component_object = cls.implementFeature(component_object, feature_node, modules_data, base_object)
+
+        return component_object
+
+    @classmethod
+    def constructComponentObject(cls, component_node: ET.Element, modules_data: dict, classes_data: dict,
+                                 base_object):
+        """
+        Method to create a single component of PyQt5 layout based on the given XML node object - without implementing
+        its features.
+
+        :param component_node: xml.etree.ElementTree.Element object that represents 'component' XML node.
+        :param modules_data: Dictionary of key-value pairs containing info about modules listed in XML config file
+            ('module' nodes).
+        :param classes_data: Dictionary of key-value pairs containing info about classes listed in XML config file
+            ('class' nodes).
+        :param base_object: Reference to python object that called this function (or acts like a host-object for result
+            layout - e.g. contains methods that need to be connected to buttons etc...).
+        :return: QWidget or QLayout object.
+        """
+        # Read:
+        # - the name of the class that the result object should be an instance of,
+        # - the name of the module that contains this class definition,
+        # using the dictionaries of classes and modules and 'component' XML node attributes.
+        class_name = classes_data[component_node.attrib[XmlAttrsNames.COMPONENT_CLASS_ID.value]]
+        module_name = modules_data[component_node.attrib[XmlAttrsNames.COMPONENT_MODULE_ID.value]]
+
+        # Return an object that represents desired class for current layout component.
+        class_obj = cls.returnObjectByName(module_name, class_name)
+
+        # Read constructor's arguments listed in current 'component' XML node.
+        constructor_args, constructor_kwargs = cls.returnFunctionArguments(component_node,
+                                                                           XmlNodeNames.CONSTRUCTOR_ARGS.value,
+                                                                           modules_data,
+                                                                           None,
+                                                                           base_object)
+        # Create result GUI component object from given class and constructor arguments. With the widget pool, the
+        # widgets are taken from the pool.
+        use_pool = (cls.widget_pool is not None and component_node.attrib[XmlAttrsNames.COMPONENT_TYPE.value] ==
+                    XmlCommonAttrValues.COMPONENT_TYPE_WIDGET.value)
+
+        if cls.instrumentation is not None:
+            with cls.traceEvent('construct', class_name, class_name):
+                if use_pool:
+                    component_object = cls.widget_pool.acquire(class_obj, constructor_args, constructor_kwargs,
+                                                                cls.returnFeaturesKey(component_node))
+                else:
+                    component_object = class_obj(*constructor_args, **constructor_kwargs)
+        elif use_pool:
+            component_object = cls.widget_pool.acquire(class_obj, constructor_args, constructor_kwargs,
+                                                        cls.returnFeaturesKey(component_node))
+        else:
+            component_object = class_obj(*constructor_args, **constructor_kwargs)
+
+        # Signals of objects created inside build transaction are blocked until the transaction is committed.
+        build_transaction = getattr(cls._build_transaction, 'value', None)
+        if build_transaction is not None:
+            build_transaction.watchObject(component_object)
+
+        return component_object
+
+    @staticmethod
+    def returnFeaturesKey(component_node: ET.Element) -> tuple:
+        """
+        Returns the names of setting attributes of the features of given component - used as a part of the key of
+        'widget_pool', so the widgets are reused only by the components with the same features.
+
+        :param component_node: xml.etree.ElementTree.Element object that represents 'component' XML node.
+        :return: Tuple of strings - dot-separated names of setting attributes of every feature.
+        """
+        component_features = component_node.find(XmlNodeNames.FEATURES_LIST.value)
+        if component_features is None:
+            return ()
+
+        return tuple('.'.join(component_attr.attrib.get(XmlAttrsNames.SETTING_ATTR_NAME.value, '')
+                              for component_attr in feature_node.find(XmlNodeNames.FEATURE_SETTING_ATTRS.value))
+                     for feature_node in component_features)
+
+    @classmethod
+    def returnObjectByName(cls, module_name: str, object_name: str):
+        """
+        Returns object - e.g. class or function based on its name and the name of the module that contains relevant
+        definition. Objects are resolved by 'symbol_resolver' - so every object is looked up only once.
+
+        :param module_name: String name of the module that contains definition of the object.
+        :param object_name: String name of the desired object to be returned.
+        :return: Any object - e.g. class or function
+        """
+        if cls.instrumentation is not None:
+            with cls.traceEvent('resolve', module_name + '.' + object_name):
+                return cls.symbol_resolver.returnObject(module_name, object_name)
+
+        return cls.symbol_resolver.returnObject(module_name, object_name)
+
+    @classmethod
+    def returnFunctionArguments(cls, component_node: ET.Element, args_node_name: str, modules_data: dict,
+                                current_object, base_object) -> tuple:
+        """
+        Returns both: unnamed and named arguments for objects' constructors and methods based on 'arg' XML nodes
+        placed in the config file.
+
+        :param component_node: xml.etree.ElementTree.Element object that represents current 'component' XML node.
+        :param args_node_name: String name of XML node that represents list of arguments ('arg' XML nodes).
+        :param modules_data: Dictionary of key-value pairs containing info about modules listed in XML config file
+            ('module' nodes).
+        :param current_object: Object that was created based on the current 'component' XML node. If no object was
+            created yet (this func is called for constructor's arguments), pass None.
+        :param base_object: Reference to python object that called this function (or acts like a host-object for result
+            layout - e.g. contains methods that need to be connected to buttons etc...).
+        :return: Tuple - ( list of unnamed arguments, dictionary of named arguments )
+        """
+
+        result_args = list()
+        result_kwargs = dict()
+        args_list = component_node.find(args_node_name)
+
+        if not args_list:
+            return result_args, result_kwargs
+
+        for arg in args_list:
+            # Read following attributes for given 'arg' XML node:
+            # - 'type' - describing type of data of the current argument
+            # - 'value' - the main content of the current argument
+            # - 'kind' - information whether the argument is 'named' or 'unnamed'
+            arg_type = arg.attrib[XmlAttrsNames.ARG_TYPE_ATTR.value]
+            arg_value = arg.attrib[XmlAttrsNames.ARG_VALUE_ATTR.value]
+            arg_kind = arg.attrib[XmlAttrsNames.ARG_KIND_ATTR.value]
+
+            # Cast arguments as desired datatypes.
+            if arg_type == XmlCommonAttrValues.ARG_TYPE_INTEGER.value:
+                arg_value = int(arg_value)
+            elif arg_type in [XmlCommonAttrValues.ARG_TYPE_STRING.value, XmlCommonAttrValues.ARG_TYPE_VARIABLE.value]:
+                arg_value = str(arg_value)
+
+            # If the argument has "var" datatype specified, the 'value' contains the NAME of object/constant that
+            # needs to be added to the result tuple. The function below is to get the actual reference of desired
+            # object based on its parent's type.
+            if arg_type == XmlCommonAttrValues.ARG_TYPE_VARIABLE.value:
+                arg_value = cls.getObjectBasedOnParentType(arg, modules_data, arg_value, current_object, base_object)
+
+            # If the argument has "self" datatype specified, the value that has to be passed is a reference to the
+            # current object that is being created
+            if arg_type == XmlCommonAttrValues.ARG_TYPE_SELF.value:
+                arg_value = current_object
+
+            # Add this argument to relevant container based on its 'kind' XML attribute
+            if arg_kind == XmlCommonAttrValues.ARG_KIND_NAMED.value:
+                arg_name = arg.attrib[XmlAttrsNames.ARG_NAME_ATTR.value]
+                result_kwargs[arg_name] = arg_value
+            elif arg_kind == XmlCommonAttrValues.ARG_KIND_UNNAMED.value:
+                result_args.append(arg_value)
+
+        return result_args, result_kwargs
+
+    @classmethod
+    def getObjectBasedOnParentType(cls, xml_node: ET.Element, modules_data: dict, object_name: str, current_object,
+                                   base_object):
+        """
+        Gets the reference of an object by given name and the type of object's parent - read from config XML file.
+
+        :param xml_node: xml.etree.ElementTree.Element object that represents current XML node containing info about
+            object to get.
+        :param modules_data: Dictionary of key-value pairs containing info about modules listed in XML config file
+            ('module' nodes).
+        :param object_name: Name of the object which reference will be got.
+        :param current_object: GUI object that was created based on the current 'component' XML node. If no object was
+            created yet (this func is called for constructor's arguments), pass None.
+        :param base_object: Reference to python object that called this function (or acts like a host-object for result
+            layout - e.g. contains methods that need to be connected to buttons etc...).
+        :return: Any object - reference got by name and object's parent type.
+        """
+
+        obj = None
+        # In this case, there must be 'parent_type_id' attribute specified in given XML node. Read it. It stands for
+        # the type of parent object that contains the object specified by name in the 'value' attribute in
+        # 'arg' XML node.
+        parent_type_id = xml_node.attrib[XmlAttrsNames.PARENT_TYPE_ID.value]
+
+        # In the following case, the parent object of the one specified, is the current GUI component object
+        # that is being created/modified.
+        if parent_type_id == "0":
+            # Assign the exact object to the result variable.
+            obj = getattr(current_object, object_name)
+        # In the following case, the parent object is a whole module.
+        elif parent_type_id == "1":
+            # In this case, there must be 'module_id' attribute specified for current XML node. Read it.
+            # Read the module name using the id read from XML node and the dictionary of modules' information.
+            module_name = modules_data[xml_node.attrib[XmlAttrsNames.PARENT_MODULE_ID.value]]
+            # Assign the exact object to the result variable.
+            obj = cls.returnObjectByName(module_name, object_name)
+        # In the following case, the parent object is an object that called this function.
+        elif parent_type_id == "2":
+            # Assign the exact object to the result variable. It is read only once per build.
+            with cls.traceEvent('resolve', object_name) if cls.instrumentation is not None else NO_TRACE:
+                obj = cls.symbol_resolver.returnBaseObjectAttribute(base_object, object_name)
+
+        return obj
+
+    @classmethod
+    def implementFeature(cls, target_obj, feature_node: ET.Element, modules_data: dict, base_object):
+        """
+        Reads the information about desired modification that should be applied to current GUI component object and
+        implements it. Information is read from 'feature' XML node in given config file.
+
+        :param target_obj: Reference to the current GUI component that should be modified.
+        :param feature_node: xml.etree.ElementTree.Element object that represents 'feature' XML node from config file.
+        :param modules_data: Dictionary of key-value pairs containing info about modules listed in XML config file
+            ('module' nodes).
+        :param base_object: Reference to python object that called this function (or acts like a host-object for result
+            layout - e.g. contains methods that need to be connected to buttons etc...).
+        :return: Any object - current GUI component after modification.
+        """
+
+        # Read arguments of feature to be implemented (from 'arg' XML nodes listed inside 'feature' node)
+        args, kwargs = cls.returnFunctionArguments(feature_node,
+                                                   XmlNodeNames.FEATURE_PARAMS.value,
+                                                   modules_data,
+                                                   target_obj,
+                                                   base_object)
+
+        # Get the object (e.g. method) that is responsible for feature implementation. This object is described inside
+        # 'setting_attributes' XML node, inside 'feature' node).
+        setting_attr = cls.returnSettingAttribute(feature_node, modules_data, target_obj, base_object)
+
+        # Connections made by the features of pooled widgets are recorded - to disconnect them when they are released.
+        if cls.widget_pool is not None:
+            cls.widget_pool.recordFeature(target_obj, setting_attr, args)
+
+        # Do the modification of the current GUI object.
+        if cls.instrumentation is not None:
+            setting_attrs_names = '.'.join(component_attr.attrib.get(XmlAttrsNames.SETTING_ATTR_NAME.value, '')
+                                           for component_attr in
+                                           feature_node.find(XmlNodeNames.FEATURE_SETTING_ATTRS.value))
+            with cls.traceEvent('feature', setting_attrs_names, type(target_obj).__name__):
+                setting_attr(*args, **kwargs)
+        else:
+            setting_attr(*args, **kwargs)
+
+        return target_obj
+
+    @classmethod
+    def returnSettingAttribute(cls, xml_node: ET.Element, modules_data, current_object, base_object):
+        """
+        Gets the method responsible for implementing particular feature based on the data placed under
+        'feature' XML node in config file - inside 'setting_attributes' node.
+ 
+        :param xml_node: xml.etree.ElementTree.Element object that represents 'feature' XML node from config file.
+        :param modules_data: Dictionary of key-value pairs containing info about modules listed in XML config file
+            ('module' nodes).
+        :param current_object: Object that was created based on the current 'component' XML node.
+        :param base_object: Reference to python object that called this function (or acts like a host-object for result
+            layout - e.g. contains methods that need to be connected to buttons etc...).
+        :return: Any object that represents e.g. method responsible for implementing given feature.
+        """
+
+        final_setting_attr = current_object
+        # Sometimes there is a need to get the desired method "step-by-step". For example - for QPushButton, the method
+        # responsible for setting 'clicked' action is 'QPushButton.clicked.connect', so there must be two
+        # 'component_attr' XML nodes inside 'setting_attributes' node - first for 'clicked' property, and the second for
+        # 'connect'.
+        # This is why the following algorithm runs in a loop.
+        component_setting_attrs = list(xml_node.find(XmlNodeNames.FEATURE_SETTING_ATTRS.value))
+        attr_index = 0
+        while attr_index < len(component_setting_attrs):
+            component_attr = component_setting_attrs[attr_index]
+            attr_index += 1
+            # Read the value of 'name' XML attribute for 'component_attr' node. This is a name of component
+            # method/property responsible for feature implementation.
+            attr_name = component_attr.attrib[XmlAttrsNames.SETTING_ATTR_NAME.value]
+
+            # If the object is a module-level one, it does not depend on current object - so it can be resolved
+            # together with all following attributes of it (nodes with 'parent_type_id' = "0") only once.
+            if component_attr.attrib[XmlAttrsNames.PARENT_TYPE_ID.value] == "1":
+                chain_names = list()
+                while (attr_index < len(component_setting_attrs) and
+                       component_setting_attrs[attr_index].attrib[XmlAttrsNames.PARENT_TYPE_ID.value] == "0"):
+                    chain_names.append(component_setting_attrs[attr_index].attrib[
+                                           XmlAttrsNames.SETTING_ATTR_NAME.value])
+                    attr_index += 1
+
+                module_name = modules_data[component_attr.attrib[XmlAttrsNames.PARENT_MODULE_ID.value]]
+                with cls.traceEvent('resolve', module_name + '.' + attr_name) \
+                        if cls.instrumentation is not None else NO_TRACE:
+                    final_setting_attr = cls.symbol_resolver.returnAttributeChain(module_name, attr_name,
+                                                                                  tuple(chain_names))
+                continue
+
+            # Get the reference of the object described by 'component_attr' node.
+            final_setting_attr = cls.getObjectBasedOnParentType(component_attr, modules_data, attr_name,
+                                                                final_setting_attr, base_object)
+
+        return final_setting_attr
+
+    @classmethod
+    def compileLayout(cls, config_filepath: str, layout_name: str, use_cache: bool = True) -> 'LayoutPlan':
+        """
+        Compiles layout described in given XML config file into reusable build plan. The plan can be used to build
+        the same layout many times - without reading the XML nodes again. Plans are stored together with parsed
+        config file, so they are compiled again only after the file changes.
+
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the desired layout described in the XML file.
+        :param use_cache: If True, parsed XML config file and compiled plan are taken from the process-wide cache.
+        :return: LayoutPlan object - call its 'build' method to get QtWidgets.QLayout object.
+        """
+        parsed_config = cls.returnParsedConfig(config_filepath, use_cache)
+
+        # Plans store resolved module-level objects - so they are valid only for the current resolver's generation.
+        generation = cls.symbol_resolver.generation
+        entry = parsed_config.layout_plans.get(layout_name)
+        if entry is not None and entry[0] == generation:
+            return entry[1]
+
+        layout_data = parsed_config.returnLayoutNode(layout_name)
+        try:
+            with cls.traceContext(config_filepath, layout_name), (cls.traceEvent('compile', layout_name)
+                                                                  if cls.instrumentation is not None else NO_TRACE):
+                layout_spec = cls.compileLayoutSpec(layout_data, parsed_config.modules_data,
+                                                    parsed_config.classes_data)
+                with cls.symbol_resolver.buildScope():
+                    layout_plan = LayoutPlan(layout_spec, layout_data)
+        except LayoutBuildError as build_error:
+            build_error.config_filepath = config_filepath
+            build_error.layout_name = layout_name
+            raise
+        parsed_config.layout_plans[layout_name] = (generation, layout_plan)
+
+        return layout_plan
+
+    @classmethod
+    def compileLayoutSpec(cls, layout_node: ET.Element, modules_data: dict, classes_data: dict) -> LayoutSpec:
+        """
+        Recursive class method that compiles 'layout' XML node into LayoutSpec object. All the ids of modules and
+        classes are replaced with their names and all the arguments are cast to desired datatypes.
+
+        :param layout_node: xml.etree.ElementTree.Element object that represents 'layout' XML node.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :param classes_data: Dictionary of key-value pairs containing information about classes listed in XML file.
+        :return: LayoutSpec object.
+        """
+        components = list()
+        layout_components = layout_node.find(XmlNodeNames.COMPONENTS_LIST.value)
+
+        # 'repeat' nodes with fixed number of copies are expanded now - the ones driven by python iterables are
+        # expanded during the build.
+        for component_node in cls.iterLayoutComponents(layout_components, modules_data, None, expand_items=False):
+            if component_node.tag == XmlNodeNames.REPEAT_NODE.value:
+                components.append(RepeatSpec(component_node, modules_data, classes_data))
+            elif component_node.tag == XmlNodeNames.COMPONENT_NODE.value:
+                try:
+                    components.append(cls.compileComponentSpec(component_node, modules_data, classes_data))
+                except Exception as compile_error:
+                    raise LayoutBuildError('Cannot compile component (' + type(compile_error).__name__ + ': ' +
+                                           str(compile_error) + ')', component_node) from compile_error
+            elif component_node.tag == XmlNodeNames.LAYOUT_NODE.value:
+                components.append(cls.compileLayoutSpec(component_node, modules_data, classes_data))
+
+        return LayoutSpec(layout_node.attrib.get(XmlAttrsNames.LAYOUT_NAME.value),
+                          tuple(cls.returnComponentPlacementArgs(layout_node)),
+                          tuple(components),
+                          cls.isDeferredLayout(layout_node),
+                          cls.isVirtualLayout(layout_node))
+
+    @classmethod
+    def compileComponentSpec(cls, component_node: ET.Element, modules_data: dict, classes_data: dict) \
+            -> ComponentSpec:
+        """
+        Compiles 'component' XML node into ComponentSpec object.
+
+        :param component_node: xml.etree.ElementTree.Element object that represents 'component' XML node.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :param classes_data: Dictionary of key-value pairs containing information about classes listed in XML file.
+        :return: ComponentSpec object.
+        """
+        features = list()
+        component_features = component_node.find(XmlNodeNames.FEATURES_LIST.value)
+        if component_features is not None:
+            for feature_node in component_features:
+                features.append(FeatureSpec(cls.compileArgsSpec(feature_node, XmlNodeNames.FEATURE_PARAMS.value,
+                                                                modules_data),
+                                            cls.compileSettingAttrsSpec(feature_node, modules_data)))
+
+        return ComponentSpec(component_node.attrib[XmlAttrsNames.COMPONENT_TYPE.value],
+                             modules_data[component_node.attrib[XmlAttrsNames.COMPONENT_MODULE_ID.value]],
+                             classes_data[component_node.attrib[XmlAttrsNames.COMPONENT_CLASS_ID.value]],
+                             tuple(cls.returnComponentPlacementArgs(component_node)),
+                             cls.compileArgsSpec(component_node, XmlNodeNames.CONSTRUCTOR_ARGS.value, modules_data),
+                             tuple(features))
+
+    @staticmethod
+    def compileArgsSpec(component_node: ET.Element, args_node_name: str, modules_data: dict) -> tuple:
+        """
+        Compiles the list of 'arg' XML nodes into tuple of ArgSpec objects. Arguments with unknown 'kind' are skipped
+        - the same way as in 'returnFunctionArguments' method.
+
+        :param component_node: xml.etree.ElementTree.Element object that contains list of arguments.
+        :param args_node_name: String name of XML node that represents list of arguments ('arg' XML nodes).
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :return: Tuple of ArgSpec objects.
+        """
+        result_args = list()
+        args_list = component_node.find(args_node_name)
+
+        if args_list is None:
+            return tuple(result_args)
+
+        for arg in args_list:
+            arg_type = arg.attrib[XmlAttrsNames.ARG_TYPE_ATTR.value]
+            arg_value = arg.attrib[XmlAttrsNames.ARG_VALUE_ATTR.value]
+            arg_kind = arg.attrib[XmlAttrsNames.ARG_KIND_ATTR.value]
+
+            if arg_type == XmlCommonAttrValues.ARG_TYPE_INTEGER.value:
+                arg_value = int(arg_value)
+
+            if arg_kind == XmlCommonAttrValues.ARG_KIND_NAMED.value:
+                arg_name = arg.attrib[XmlAttrsNames.ARG_NAME_ATTR.value]
+            elif arg_kind == XmlCommonAttrValues.ARG_KIND_UNNAMED.value:
+                arg_name = None
+            else:
+                continue
+
+            parent_type_id = None
+            module_name = None
+            if arg_type == XmlCommonAttrValues.ARG_TYPE_VARIABLE.value:
+                parent_type_id = arg.attrib[XmlAttrsNames.PARENT_TYPE_ID.value]
+                if parent_type_id == "1":
+                    module_name = modules_data[arg.attrib[XmlAttrsNames.PARENT_MODULE_ID.value]]
+
+            result_args.append(ArgSpec(arg_type, arg_value, arg_name, parent_type_id, module_name))
+
+        return tuple(result_args)
+
+    @staticmethod
+    def compileSettingAttrsSpec(feature_node: ET.Element, modules_data: dict) -> tuple:
+        """
+        Compiles the list of 'component_attr' XML nodes of given 'feature' node into tuple of SettingAttrSpec objects.
+
+        :param feature_node: xml.etree.ElementTree.Element object that represents 'feature' XML node.
+        :param modules_data: Dictionary of key-value pairs containing information about modules listed in XML file.
+        :return: Tuple of SettingAttrSpec objects.
+        """
+        setting_attrs = list()
+
+        for component_attr in feature_node.find(XmlNodeNames.FEATURE_SETTING_ATTRS.value):
+            parent_type_id = component_attr.attrib[XmlAttrsNames.PARENT_TYPE_ID.value]
+            module_name = None
+            if parent_type_id == "1":
+                module_name = modules_data[component_attr.attrib[XmlAttrsNames.PARENT_MODULE_ID.value]]
+
+            setting_attrs.append(SettingAttrSpec(parent_type_id,
+                                                 component_attr.attrib[XmlAttrsNames.SETTING_ATTR_NAME.value],
+                                                 module_name))
+
+        return tuple(setting_attrs)
+
+
+class LayoutPlan:
+    """
+    Immutable build plan of a single layout - made from LayoutSpec object. All the classes and module-level objects are
+    resolved once, when the plan is created. Only the references to the attributes of the current GUI component and of
+    the base object are read during the build - because they are different for every built object.
+    """
+
+    # Codes of the sources of argument values and setting attributes.
+    SOURCE_CONSTANT = 0
+    SOURCE_CURRENT_OBJECT = 1
+    SOURCE_BASE_OBJECT = 2
+    SOURCE_SELF = 3
+
+    # Kinds of build steps.
+    STEP_COMPONENT = 0
+    STEP_LAYOUT = 1
+    STEP_REPEAT = 2
+
+    def __init__(self, layout_spec: LayoutSpec, layout_node: ET.Element = None):
+        """
+        :param layout_spec: LayoutSpec object that describes the layout - e.g. returned by
+            'PyQT5_GUI_Builder.compileLayoutSpec' method.
+        :param layout_node: xml.etree.ElementTree.Element object the spec was compiled from. If given, errors of
+            resolving the objects are reported as LayoutBuildError with relevant XML node.
+        """
+        self.layout_spec = layout_spec
+        self._steps = self.linkLayout(layout_spec, layout_node)
+
+    def build(self, base_object, lazy: bool = False) -> QtWidgets.QLayout:
+        """
+        Builds new layout object based on this plan.
+
+        :param base_object: Reference to the python object, that calls this function. If not used, pass 'None'.
+        :param lazy: If True, nested layouts marked as deferred are replaced with DeferredLayoutWidget placeholders.
+        :return: QtWidgets.QLayout object with all component layouts and widgets.
+        """
+        if PyQT5_GUI_Builder.instrumentation is not None:
+            with PyQT5_GUI_Builder.traceEvent('plan_build', self.layout_spec.name):
+                return self.runLayoutSteps(self._steps, base_object, lazy, self.layout_spec.virtual,
+                                           self.layout_spec.name)
+
+        return self.runLayoutSteps(self._steps, base_object, lazy, self.layout_spec.virtual, self.layout_spec.name)
+
+    @classmethod
+    def linkLayout(cls, layout_spec: LayoutSpec, layout_node: ET.Element = None) -> tuple:
+        """
+        Turns LayoutSpec object into tuple of build steps - one step per component or nested layout.
+
+        :param layout_spec: LayoutSpec object.
+        :param layout_node: xml.etree.ElementTree.Element object the spec was compiled from - used for error
+            reporting. If not used, pass 'None'.
+        :return: Tuple of build steps - ( step kind, placement args, step data ). For nested layouts the step
+            data is a tuple - ( nested layout steps, is deferred, nested layout name, is virtual ). For 'repeat' nodes
+            driven by python iterables it is RepeatSpec object.
+        """
+        steps = list()
+
+        # XML nodes the components were compiled from - in the same order as components in the spec.
+        component_nodes = [None] * len(layout_spec.components)
+        if layout_node is not None:
+            component_nodes = [component_node for component_node in PyQT5_GUI_Builder.iterLayoutComponents(
+                                   layout_node.find(XmlNodeNames.COMPONENTS_LIST.value), None, None,
+                                   expand_items=False)
+                               if component_node.tag in (XmlNodeNames.COMPONENT_NODE.value,
+                                                         XmlNodeNames.LAYOUT_NODE.value,
+                                                         XmlNodeNames.REPEAT_NODE.value)]
+
+        for component_spec, component_node in zip(layout_spec.components, component_nodes):
+            if isinstance(component_spec, LayoutSpec):
+                steps.append((cls.STEP_LAYOUT, component_spec.placement,
+                              (cls.linkLayout(component_spec, component_node), component_spec.deferred,
+                               component_spec.name, component_spec.virtual)))
+                continue
+            if isinstance(component_spec, RepeatSpec):
+                steps.append((cls.STEP_REPEAT, (), component_spec))
+                continue
+
+            try:
+                class_obj = PyQT5_GUI_Builder.returnObjectByName(component_spec.module_name,
+                                                                 component_spec.class_name)
+                features = tuple((cls.linkArgs(feature_spec.args), cls.linkSettingAttrs(feature_spec.setting_attrs))
+                                 for feature_spec in component_spec.features)
+                steps.append((cls.STEP_COMPONENT, component_spec.placement, (component_spec.component_type,
+                                                                class_obj,
+                                                                cls.linkArgs(component_spec.constructor_args),
+                                                                features)))
+            except Exception as link_error:
+                if component_node is None:
+                    raise
+                raise LayoutBuildError('Cannot resolve objects of component (' + type(link_error).__name__ + ': ' +
+                                       str(link_error) + ')', component_node) from link_error
+
+        return tuple(steps)
+
+    @classmethod
+    def linkArgs(cls, args_spec: tuple) -> tuple:
+        """
+        Turns tuple of ArgSpec objects into ready-to-use arguments. Values that do not depend on built objects are
+        stored directly - the remaining ones are stored as list of slots filled during the build.
+
+        :param args_spec: Tuple of ArgSpec objects.
+        :return: Tuple - ( tuple of unnamed arguments, dictionary of named arguments, tuple of dynamic slots )
+        """
+        args = list()
+        kwargs = dict()
+        dynamic_slots = list()
+
+        for arg_spec in args_spec:
+            source, value = cls.returnValueSource(arg_spec.arg_type, arg_spec.parent_type_id, arg_spec.value,
+                                                  arg_spec.module_name)
+            if arg_spec.arg_name is None:
+                slot_target = len(args)
+                args.append(value)
+            else:
+                slot_target = arg_spec.arg_name
+                kwargs[arg_spec.arg_name] = value
+
+            if source != cls.SOURCE_CONSTANT:
+                dynamic_slots.append((slot_target, arg_spec.arg_name is not None, source, value))
+
+        return tuple(args), kwargs, tuple(dynamic_slots)
+
+    @classmethod
+    def linkSettingAttrs(cls, setting_attrs_spec: tuple) -> tuple:
+        """
+        Turns tuple of SettingAttrSpec objects into chain of ( source code, value ) pairs.
+
+        :param setting_attrs_spec: Tuple of SettingAttrSpec objects.
+        :return: Tuple of ( source code, value ) pairs.
+        """
+        return tuple(cls.returnValueSource(XmlCommonAttrValues.ARG_TYPE_VARIABLE.value, attr_spec.parent_type_id,
+                                           attr_spec.name, attr_spec.module_name)
+                     for attr_spec in setting_attrs_spec)
+
+    @staticmethod
+    def returnValueSource(value_type: str, parent_type_id: str, value, module_name: str) -> tuple:
+        """
+        Returns the source of the value of an argument or setting attribute. Module-level objects are resolved
+        immediately.
+
+        :param value_type: String datatype of the value - as in 'type' attribute of 'arg' XML node.
+        :param parent_type_id: String id of parent object type - for 'var' values.
+        :param value: Value read from XML file - the name of the object for 'var' values.
+        :param module_name: Name of the module that contains the object - for 'var' values with module parent type.
+        :return: Tuple - ( source code, value or attribute name )
+        """
+        if value_type == XmlCommonAttrValues.ARG_TYPE_SELF.value:
+            return LayoutPlan.SOURCE_SELF, None
+
+        if value_type == XmlCommonAttrValues.ARG_TYPE_VARIABLE.value:
+            if parent_type_id == "0":
+                return LayoutPlan.SOURCE_CURRENT_OBJECT, value
+            elif parent_type_id == "1":
+                return LayoutPlan.SOURCE_CONSTANT, PyQT5_GUI_Builder.returnObjectByName(module_name, value)
+            elif parent_type_id == "2":
+                return LayoutPlan.SOURCE_BASE_OBJECT, value
+            return LayoutPlan.SOURCE_CONSTANT, None
+
+        return LayoutPlan.SOURCE_CONSTANT, value
+
+    @staticmethod
+    def returnArgs(linked_args: tuple, current_object, base_object) -> tuple:
+        """
+        Returns the arguments ready to be passed to the function - with all dynamic slots filled.
+
+        :param linked_args: Tuple returned by 'linkArgs' method.
+        :param current_object: Current GUI component object (None for constructor's arguments).
+        :param base_object: Reference to the python object, that calls the build.
+        :return: Tuple - ( list or tuple of unnamed arguments, dictionary of named arguments )
+        """
+        args, kwargs, dynamic_slots = linked_args
+        if not dynamic_slots:
+            return args, kwargs
+
+        args = list(args)
+        kwargs = dict(kwargs)
+        for slot_target, is_named, source, value in dynamic_slots:
+            if source == LayoutPlan.SOURCE_CURRENT_OBJECT:
+                value = getattr(current_object, value)
+            elif source == LayoutPlan.SOURCE_BASE_OBJECT:
+                value = getattr(base_object, value)
+            else:
+                value = current_object
+
+            if is_named:
+                kwargs[slot_target] = value
+            else:
+                args[slot_target] = value
+
+        return args, kwargs
+
+    @classmethod
+    def runLayoutSteps(cls, steps: tuple, base_object, lazy: bool = False, virtual: bool = False,
+                       layout_name: str = None) -> QtWidgets.QLayout:
+        """
+        Recursive class method that builds a layout by running given build steps.
+
+        :param steps: Tuple of build steps returned by 'linkLayout' method.
+        :param base_object: Reference to the python object, that calls the build.
+        :param lazy: If True, nested layouts marked as deferred are replaced with DeferredLayoutWidget placeholders.
+        :param virtual: If True, the cells of the layout are shown by VirtualGridView.
+        :param layout_name: Name of the layout - used as object name of VirtualGridView.
+        :return: QtWidgets.QLayout object.
+        """
+        if PyQT5_GUI_Builder.instrumentation is not None:
+            with PyQT5_GUI_Builder.traceEvent('layout', layout_name):
+                if virtual:
+                    return cls.runVirtualGridSteps(steps, base_object, layout_name)
+                return cls.runLayoutComponentSteps(steps, base_object, lazy)
+
+        if virtual:
+            return cls.runVirtualGridSteps(steps, base_object, layout_name)
+
+        return cls.runLayoutComponentSteps(steps, base_object, lazy)
+
+    @classmethod
+    def runLayoutComponentSteps(cls, steps: tuple, base_object, lazy: bool = False) -> QtWidgets.QLayout:
+        """
+        Runs the build steps of components and nested layouts of a layout (which is not virtual).
+
+        :param steps: Tuple of build steps returned by 'linkLayout' method.
+        :param base_object: Reference to the python object, that calls the build.
+        :param lazy: If True, nested layouts marked as deferred are replaced with DeferredLayoutWidget placeholders.
+        :return: QtWidgets.QLayout object.
+        """
+        main_layout = None
+        trace = PyQT5_GUI_Builder.instrumentation is not None
+        # With instrumentation every component, constructor and feature is measured - the same way as in XML build.
+        run_component_step = cls.runTracedComponentStep if trace else cls.runComponentStep
+
+        for step_kind, placement_args, step_data in steps:
+            if step_kind == cls.STEP_REPEAT:
+                # Items of the 'repeat' node are known only now - its copies are built the same way as XML nodes.
+                main_layout = PyQT5_GUI_Builder.addLayoutComponents(
+                    main_layout,
+                    PyQT5_GUI_Builder.iterRepeatNodes(step_data.repeat_node, step_data.modules_data, base_object),
+                    step_data.modules_data, step_data.classes_data, base_object, lazy)
+                continue
+
+            if step_kind == cls.STEP_LAYOUT:
+                nested_steps, deferred, nested_name, nested_virtual = step_data
+                if lazy and deferred:
+                    main_layout.addWidget(Widgets.DeferredLayoutWidget(
+                        lambda step_data=step_data: cls.runLayoutSteps(step_data[0], base_object, True,
+                                                                       step_data[3], step_data[2]),
+                        nested_name), *placement_args)
+                else:
+                    nested_layout = cls.runLayoutSteps(nested_steps, base_object, lazy, nested_virtual, nested_name)
+                    with PyQT5_GUI_Builder.traceEvent('insert', 'addLayout') if trace else NO_TRACE:
+                        main_layout.addLayout(nested_layout, *placement_args)
+                continue
+
+            component_object = run_component_step(step_data, base_object)
+
+            component_type = step_data[0]
+            if component_type == XmlCommonAttrValues.COMPONENT_TYPE_SELF.value:
+                main_layout = component_object
+            elif component_type == XmlCommonAttrValues.COMPONENT_TYPE_WIDGET.value:
+                with PyQT5_GUI_Builder.traceEvent('insert', 'addWidget') if trace else NO_TRACE:
+                    main_layout.addWidget(component_object, *placement_args)
+
+        return main_layout
+
+    @staticmethod
+    def returnFeaturesKey(features: tuple) -> tuple:
+        """
+        Returns the names of setting attributes of given linked features - the same key as returned by
+        'PyQT5_GUI_Builder.returnFeaturesKey' method for relevant 'component' XML node.
+
+        :param features: Tuple of linked features - the last item of component's step data.
+        :return: Tuple of strings - dot-separated names of setting attributes of every feature.
+        """
+        # Module-level objects are already resolved, so their own names are used.
+        return tuple('.'.join(value if isinstance(value, str) else getattr(value, '__name__', '')
+                              for _, value in setting_attrs)
+                     for _, setting_attrs in features)
+
+    @classmethod
+    def runComponentStep(cls, step_data: tuple, base_object):
+        """
+        Builds single component - creates the object and implements its features.
+
+        :param step_data: Step data of component's build step returned by 'linkLayout' method.
+        :param base_object: Reference to the python object, that calls the build.
+        :return: QWidget or QLayout object.
+        """
+        return_args = cls.returnArgs
+        widget_pool = PyQT5_GUI_Builder.widget_pool
+        component_type, class_obj, constructor_args, features = step_data
+        args, kwargs = return_args(constructor_args, None, base_object)
+        if widget_pool is not None and component_type == XmlCommonAttrValues.COMPONENT_TYPE_WIDGET.value:
+            component_object = widget_pool.acquire(class_obj, args, kwargs, cls.returnFeaturesKey(features))
+        else:
+            component_object = class_obj(*args, **kwargs)
+        build_transaction = getattr(PyQT5_GUI_Builder._build_transaction, 'value', None)
+        if build_transaction is not None:
+            build_transaction.watchObject(component_object)
+
+        for feature_args, setting_attrs in features:
+            args, kwargs = return_args(feature_args, component_object, base_object)
+            setting_attr = component_object
+            for source, value in setting_attrs:
+                if source == cls.SOURCE_CURRENT_OBJECT:
+                    setting_attr = getattr(setting_attr, value)
+                elif source == cls.SOURCE_BASE_OBJECT:
+                    setting_attr = getattr(base_object, value)
+                else:
+                    setting_attr = value
+            if widget_pool is not None:
+                widget_pool.recordFeature(component_object, setting_attr, args)
+            setting_attr(*args, **kwargs)
+
+        return component_object
+
+    @classmethod
+    def runTracedComponentStep(cls, step_data: tuple, base_object):
+        """
+        Builds single component the same way as 'runComponentStep' method does - with 'component', 'construct' and
+        'feature' events of current instrumentation around the whole component, its constructor and every feature.
+
+        :param step_data: Step data of component's build step returned by 'linkLayout' method.
+        :param base_object: Reference to the python object, that calls the build.
+        :return: QWidget or QLayout object.
+        """
+        trace_event = PyQT5_GUI_Builder.traceEvent
+        widget_pool = PyQT5_GUI_Builder.widget_pool
+        component_type, class_obj, constructor_args, features = step_data
+        class_name = class_obj.__name__
+
+        with trace_event('component', class_name, class_name):
+            args, kwargs = cls.returnArgs(constructor_args, None, base_object)
+            with trace_event('construct', class_name, class_name):
+                if widget_pool is not None and component_type == XmlCommonAttrValues.COMPONENT_TYPE_WIDGET.value:
+                    component_object = widget_pool.acquire(class_obj, args, kwargs, cls.returnFeaturesKey(features))
+                else:
+                    component_object = class_obj(*args, **kwargs)
+            build_transaction = getattr(PyQT5_GUI_Builder._build_transaction, 'value', None)
+            if build_transaction is not None:
+                build_transaction.watchObject(component_object)
+
+            for feature_args, setting_attrs in features:
+                args, kwargs = cls.returnArgs(feature_args, component_object, base_object)
+                setting_attr = component_object
+                for source, value in setting_attrs:
+                    if source == cls.SOURCE_CURRENT_OBJECT:
+                        setting_attr = getattr(setting_attr, value)
+                    elif source == cls.SOURCE_BASE_OBJECT:
+                        setting_attr = getattr(base_object, value)
+                    else:
+                        setting_attr = value
+                if widget_pool is not None:
+                    widget_pool.recordFeature(component_object, setting_attr, args)
+                # Names of setting attributes - module-level objects are already resolved, so their own names are used.
+                setting_attrs_names = '.'.join(value if isinstance(value, str) else getattr(value, '__name__', '')
+                                               for _, value in setting_attrs)
+                with trace_event('feature', setting_attrs_names, class_name):
+                    setting_attr(*args, **kwargs)
+
+        return component_object
+
+    @classmethod
+    def runVirtualGridSteps(cls, steps: tuple, base_object, layout_name: str = None) -> QtWidgets.QLayout:
+        """
+        Builds virtual grid layout - only its main layout and VirtualGridView object are created. The steps of cells
+        are run when the cells become visible.
+
+        :param steps: Tuple of build steps returned by 'linkLayout' method.
+        :param base_object: Reference to the python object, that calls the build.
+        :param layout_name: Name of the layout - used as object name of VirtualGridView.
+        :return: QtWidgets.QLayout object.
+        """
+        main_layout = None
+        cells = dict()
+        run_component_step = (cls.runTracedComponentStep if PyQT5_GUI_Builder.instrumentation is not None
+                              else cls.runComponentStep)
+
+        for step_kind, placement_args, step_data in steps:
+            if step_kind == cls.STEP_REPEAT:
+                main_layout, cells = PyQT5_GUI_Builder.collectVirtualGridCells(
+                    main_layout,
+                    PyQT5_GUI_Builder.iterRepeatNodes(step_data.repeat_node, step_data.modules_data, base_object),
+                    step_data.modules_data, step_data.classes_data, base_object, cells)
+                continue
+
+            if step_kind == cls.STEP_COMPONENT:
+                component_type = step_data[0]
+                if component_type == XmlCommonAttrValues.COMPONENT_TYPE_SELF.value:
+                    main_layout = run_component_step(step_data, base_object)
+                    continue
+                if component_type != XmlCommonAttrValues.COMPONENT_TYPE_WIDGET.value:
+                    run_component_step(step_data, base_object)
+                    continue
+
+            if not placement_args:
+                raise LayoutBuildError('Components of virtual grid layout must have "row" and "column" attributes',
+                                       None, None, layout_name)
+            cells[tuple(placement_args)] = partial(cls.runVirtualGridCellStep, step_kind, step_data, base_object)
+
+        main_layout.addWidget(Widgets.VirtualGridView(cells, layout_name))
+
+        return main_layout
+
+    @classmethod
+    def runVirtualGridCellStep(cls, step_kind: int, step_data: tuple, base_object) -> QtWidgets.QWidget:
+        """
+        Builds the widget of single cell of virtual grid layout. Nested layouts are placed inside QWidget object.
+
+        :param step_kind: Kind of the build step of the cell.
+        :param step_data: Step data of the build step of the cell.
+        :param base_object: Reference to the python object, that calls the build.
+        :return: QWidget object.
+        """
+        if step_kind == cls.STEP_COMPONENT:
+            if PyQT5_GUI_Builder.instrumentation is not None:
+                return cls.runTracedComponentStep(step_data, base_object)
+            return cls.runComponentStep(step_data, base_object)
+
+        nested_steps, deferred, nested_name, nested_virtual = step_data
+        return Widgets.VirtualGridView.returnLayoutWidget(cls.runLayoutSteps(nested_steps, base_object, False,
+                                                                             nested_virtual, nested_name))
+
+
+class IncrementalLayoutBuild:
+    """
+    Class to run the layout build in time slices - see 'PyQT5_GUI_Builder.returnGuiLayoutIncremental' method. The build
+    can be driven by QTimer ('start' method) or manually ('pump' method). The result is available through 'future'
+    attribute (concurrent.futures.Future object) and passed to 'finished_callback' - if it was given.
+    """
+
+    def __init__(self, build_steps, steps_count: int, symbol_resolver: SymbolResolver, progress_callback=None,
+                 finished_callback=None):
+        """
+        :param build_steps: Generator that builds the layout step by step - e.g. returned by
+            'PyQT5_GUI_Builder.iterGuiLayout' method.
+        :param steps_count: Number of steps made by the generator - used for progress reporting.
+        :param symbol_resolver: SymbolResolver object used by the build - every slice is run inside the same build
+            scope.
+        :param progress_callback: Callable called after every time slice with two arguments - number of done steps
+            and number of all steps.
+        :param finished_callback: Callable called with built QLayout object when the build is done.
+        """
+        self.steps_count = steps_count
+        self.done_steps = 0
+        self.progress_callback = progress_callback
+        self.finished_callback = finished_callback
+        self.future = futures.Future()
+
+        self._build_steps = build_steps
+        self._symbol_resolver = symbol_resolver
+        self._resolver_scope = symbol_resolver.newScope()
+        self._timer = None
+        self._slice_ms = None
+
+    @property
+    def done(self) -> bool:
+        """
+        :return: True if the build is finished (successfully or not).
+        """
+        return self.future.done()
+
+    def pump(self, budget_ms: float = 10.0) -> bool:
+        """
+        Runs build steps until given time budget is used or the build is finished. Exception raised by the build is
+        set on the future and raised again. The future is set (and the timer stopped) before the callbacks are called
+        - so exception raised by a callback is raised, but the build stays finished.
+
+        :param budget_ms: Time budget of the slice in milliseconds.
+        :return: True if the build is finished.
+        """
+        if self.done:
+            return True
+
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        try:
+            with self._symbol_resolver.buildScope(self._resolver_scope):
+                while True:
+                    next(self._build_steps)
+                    self.done_steps += 1
+                    if time.perf_counter() >= deadline:
+                        break
+        except StopIteration as build_result:
+            self.done_steps = self.steps_count
+            self.finishBuild(build_result.value)
+            return True
+        except BaseException as build_error:
+            self.stopTimer()
+            self.future.set_exception(build_error)
+            raise
+
+        self.reportProgress()
+
+        return False
+
+    def start(self, slice_ms: float = 10.0):
+        """
+        Starts the build driven by QTimer - one time slice is run on every timer's timeout, so the Qt event loop can
+        process other events between slices. Requires running Qt event loop.
+
+        :param slice_ms: Time budget of the slice in milliseconds.
+        :return: None
+        """
+        self._slice_ms = slice_ms
+        if self._timer is None:
+            self._timer = QtCore.QTimer()
+            self._timer.setInterval(0)
+            self._timer.timeout.connect(self.runTimerSlice)
+        self._timer.start()
+
+    def runTimerSlice(self):
+        """
+        Runs single time slice on timer's timeout. Exceptions are not raised - errors of the build are available
+        through the future, errors of the callbacks are passed to 'sys.excepthook'.
+
+        :return: None
+        """
+        try:
+            self.pump(self._slice_ms)
+        except Exception as slice_error:
+            if not (self.future.done() and not self.future.cancelled() and self.future.exception() is slice_error):
+                sys.excepthook(type(slice_error), slice_error, slice_error.__traceback__)
+
+    def cancel(self) -> bool:
+        """
+        Stops the build. Already built components are not removed.
+
+        :return: True if the build was cancelled, False if it was already finished.
+        """
+        if self.done:
+            return False
+
+        self.stopTimer()
+        self._build_steps.close()
+
+        return self.future.cancel()
+
+    def reportProgress(self):
+        """
+        Calls progress callback - if it was given.
+
+        :return: None
+        """
+        if self.progress_callback is not None:
+            self.progress_callback(self.done_steps, self.steps_count)
+
+    def finishBuild(self, gui_layout):
+        """
+        Sets the result of the build, then reports the final progress and calls finished callback - if they were
+        given. If the progress callback raises exception, finished callback is still called and the exception is
+        raised afterwards.
+
+        :param gui_layout: Built QLayout object.
+        :return: None
+        """
+        self.stopTimer()
+        self.future.set_result(gui_layout)
+        try:
+            self.reportProgress()
+        finally:
+            if self.finished_callback is not None:
+                self.finished_callback(gui_layout)
+
+    def stopTimer(self):
+        """
+        Stops the timer that drives the build - if it was started.
+
+        :return: None
+        """
+        if self._timer is not None:
+            self._timer.stop()
+
+
+class LayoutCodeGenerator:
+    """
+    Class to generate plain python modules from layouts described in XML config files. Generated module contains
+    'buildLayout(base_object)' function with straight-line code - constructors' calls, features' calls and adding
+    components to layouts - so no XML parsing is needed at runtime. Generated modules are stored in
+    '__gui_generated__' directory next to XML config file and they are used by 'PyQT5_GUI_Builder.returnGuiLayout'
+    method as long as the hash of XML file stored in them is up to date. Missing (or stale) module is remembered until
+    XML file changes - call 'clear' method after generating modules in another process.
+    """
+
+    GENERATED_DIR_NAME = '__gui_generated__'
+    GENERATOR_VERSION = 2
+    HEADER_PREFIX = '# pyqt5_gui_builder source-hash: '
+    DEPENDENCIES_PREFIX = '# pyqt5_gui_builder dependencies: '
+
+    _lock = threading.RLock()
+    # Hashes of XML config files - keyed on file's absolute path, validated against file's modification time and size.
+    _source_hashes = dict()
+    # Imported generated modules with hashes of XML file and of its included files - keyed on the path of generated
+    # module.
+    _loaded_modules = dict()
+    # Keys of XML config files that had no up-to-date generated module - keyed on file's absolute path and layout name.
+    _missing_modules = dict()
+
+    @classmethod
+    def generateLayoutModule(cls, config_filepath: str, layout_name: str, output_path: str = None) -> str:
+        """
+        Generates python module for given layout and writes it to disk.
+
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the desired layout described in the XML file.
+        :param output_path: String path of the module to be written. If not specified, the module is written to the
+            place where 'PyQT5_GUI_Builder.returnGuiLayout' method looks for it.
+        :return: String path of the written module.
+        """
+        if output_path is None:
+            output_path = cls.returnGeneratedModulePath(config_filepath, layout_name)
+
+        module_source = cls.returnLayoutModuleSource(config_filepath, layout_name)
+
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        # Write to temporary file first - so the module is never read half-written.
+        temp_path = output_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as module_file:
+            module_file.write(module_source)
+        os.replace(temp_path, output_path)
+
+        with cls._lock:
+            cls._loaded_modules.pop(os.path.abspath(output_path), None)
+            cls._missing_modules.pop((os.path.abspath(config_filepath), layout_name), None)
+
+        return output_path
+
+    @classmethod
+    def returnLayoutModuleSource(cls, config_filepath: str, layout_name: str) -> str:
+        """
+        Returns the source code of python module that builds given layout.
+
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the desired layout described in the XML file.
+        :return: String source code of the module.
+        """
+        source_hash = cls.returnSourceHash(config_filepath)
+        parsed_config = PyQT5_GUI_Builder.returnParsedConfig(config_filepath, False)
+
+        dependency_hashes = cls.returnDependencyHashes(config_filepath, parsed_config)
+
+        layout_data = parsed_config.returnLayoutNode(layout_name)
+        layout_spec = PyQT5_GUI_Builder.compileLayoutSpec(layout_data, parsed_config.modules_data,
+                                                          parsed_config.classes_data)
+
+        modules = dict()
+        body_lines = list()
+        try:
+            root_var = cls.writeLayoutCode(layout_spec, modules, body_lines, [0])
+        except LayoutBuildError as build_error:
+            build_error.config_filepath = config_filepath
+            build_error.layout_name = layout_name
+            raise
+
+        lines = [cls.HEADER_PREFIX + source_hash + ' version: ' + str(cls.GENERATOR_VERSION),
+                 cls.DEPENDENCIES_PREFIX + json.dumps(dependency_hashes),
+                 '"""',
+                 'Generated by PyQT5_GUI_Builder from ' + repr(os.path.basename(config_filepath)) + ' file - layout ' +
+                 repr(layout_name) + '. Do not edit - generate the module again after XML file (or any file it '
+                 'includes) changes.',
+                 '"""',
+                 'import importlib',
+                 '',
+                 'LAYOUT_NAME = ' + repr(layout_name),
+                 'SOURCE_HASH = ' + repr(source_hash),
+                 '']
+        for module_name, module_var in modules.items():
+            lines.append(module_var + ' = importlib.import_module(' + repr(module_name) + ')')
+        lines += ['', '', 'def buildLayout(base_object):']
+        lines += ['    ' + line for line in body_lines]
+        lines += ['    return ' + root_var, '']
+
+        return '\n'.join(lines)
+
+    @classmethod
+    def writeLayoutCode(cls, layout_spec: LayoutSpec, modules: dict, lines: list, var_counter: list) -> str:
+        """
+        Recursive class method that appends lines of code building given layout to the list.
+
+        :param layout_spec: LayoutSpec object that describes the layout.
+        :param modules: Dictionary of module names and names of variables that reference them in generated code.
+        :param lines: List of code lines to be extended.
+        :param var_counter: One-element list with the number of the next variable to be used.
+        :return: String name of variable that references built layout ('None' if there is no 'self' component).
+        """
+        if layout_spec.virtual:
+            raise LayoutBuildError('Virtual grid layouts cannot be generated - layout "' + str(layout_spec.name) +
+                                   '" is virtual')
+
+        main_var = 'None'
+
+        for component_spec in layout_spec.components:
+            if isinstance(component_spec, RepeatSpec):
+                raise LayoutBuildError('Layouts with "repeat" nodes driven by python iterables cannot be generated',
+                                       component_spec.repeat_node)
+            if isinstance(component_spec, LayoutSpec):
+                nested_var = cls.writeLayoutCode(component_spec, modules, lines, var_counter)
+                lines.append(main_var + '.addLayout(' +
+                             ', '.join([nested_var] + [repr(arg) for arg in component_spec.placement]) + ')')
+                continue
+
+            component_var = 'c' + str(var_counter[0])
+            var_counter[0] += 1
+            class_expr = cls.returnObjectExpression(component_spec.module_name, component_spec.class_name, modules)
+            lines.append(component_var + ' = ' + class_expr + '(' +
+                         cls.returnArgsCode(component_spec.constructor_args, 'None', modules) + ')')
+
+            for feature_spec in component_spec.features:
+                setting_expr = component_var
+                for attr_spec in feature_spec.setting_attrs:
+                    setting_expr = cls.returnVariableExpression(attr_spec.parent_type_id, attr_spec.name,
+                                                                attr_spec.module_name, setting_expr, modules)
+                lines.append(setting_expr + '(' + cls.returnArgsCode(feature_spec.args, component_var, modules) + ')')
+
+            if component_spec.component_type == XmlCommonAttrValues.COMPONENT_TYPE_SELF.value:
+                main_var = component_var
+            elif component_spec.component_type == XmlCommonAttrValues.COMPONENT_TYPE_WIDGET.value:
+                lines.append(main_var + '.addWidget(' +
+                             ', '.join([component_var] + [repr(arg) for arg in component_spec.placement]) + ')')
+
+        return main_var
+
+    @classmethod
+    def returnArgsCode(cls, args_spec: tuple, current_var: str, modules: dict) -> str:
+        """
+        Returns the code of arguments list for a function call.
+
+        :param args_spec: Tuple of ArgSpec objects.
+        :param current_var: Name of variable that references current GUI component ('None' for constructors).
+        :param modules: Dictionary of module names and names of variables that reference them in generated code.
+        :return: String code of the arguments - without parentheses.
+        """
+        args = list()
+        kwargs = dict()
+
+        for arg_spec in args_spec:
+            if arg_spec.arg_type == XmlCommonAttrValues.ARG_TYPE_SELF.value:
+                arg_code = current_var
+            elif arg_spec.arg_type == XmlCommonAttrValues.ARG_TYPE_VARIABLE.value:
+                arg_code = cls.returnVariableExpression(arg_spec.parent_type_id, arg_spec.value,
+                                                        arg_spec.module_name, current_var, modules)
+            else:
+                arg_code = repr(arg_spec.value)
+
+            if arg_spec.arg_name is None:
+                args.append(arg_code)
+            else:
+                kwargs[arg_spec.arg_name] = arg_code
+
+        for arg_name, arg_code in kwargs.items():
+            if arg_name.isidentifier() and not keyword.iskeyword(arg_name):
+                args.append(arg_name + '=' + arg_code)
+            else:
+                args.append('**{' + repr(arg_name) + ': ' + arg_code + '}')
+
+        return ', '.join(args)
+
+    @classmethod
+    def returnVariableExpression(cls, parent_type_id: str, object_name: str, module_name: str, current_var: str,
+                                 modules: dict) -> str:
+        """
+        Returns the code of expression that references an object by its name and the type of object's parent - the
+        same way as 'PyQT5_GUI_Builder.getObjectBasedOnParentType' method does.
+
+        :param parent_type_id: String id of parent object type.
+        :param object_name: Name of the object to be referenced.
+        :param module_name: Name of the module that contains the object - for module parent type.
+        :param current_var: Expression that references current object.
+        :param modules: Dictionary of module names and names of variables that reference them in generated code.
+        :return: String code of the expression.
+        """
+        if parent_type_id == "0":
+            return cls.returnAttributeExpression(current_var, object_name)
+        elif parent_type_id == "1":
+            return cls.returnObjectExpression(module_name, object_name, modules)
+        elif parent_type_id == "2":
+            return cls.returnAttributeExpression('base_object', object_name)
+
+        return 'None'
+
+    @classmethod
+    def returnObjectExpression(cls, module_name: str, object_name: str, modules: dict) -> str:
+        """
+        Returns the code of expression that references module-level object - the same way as
+        'PyQT5_GUI_Builder.returnObjectByName' method does.
+
+        :param module_name: Name of the module that contains the object. If empty, this module is used.
+        :param object_name: Name of the object to be referenced.
+        :param modules: Dictionary of module names and names of variables that reference them in generated code.
+        :return: String code of the expression.
+        """
+        if not module_name:
+            module_name = __name__
+
+        module_var = modules.get(module_name)
+        if module_var is None:
+            module_var = '_module_' + str(len(modules))
+            modules[module_name] = module_var
+
+        return cls.returnAttributeExpression(module_var, object_name)
+
+    @staticmethod
+    def returnAttributeExpression(object_code: str, attr_name: str) -> str:
+        """
+        Returns the code of expression that reads the attribute of an object.
+
+        :param object_code: Expression that references the object.
+        :param attr_name: Name of the attribute.
+        :return: String code of the expression.
+        """
+        if attr_name.isidentifier() and not keyword.iskeyword(attr_name) and object_code != 'None':
+            return object_code + '.' + attr_name
+
+        return 'getattr(' + object_code + ', ' + repr(attr_name) + ')'
+
+    @classmethod
+    def returnGeneratedModulePath(cls, config_filepath: str, layout_name: str) -> str:
+        """
+        Returns the path of generated module for given layout.
+
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the layout described in the XML file.
+        :return: String path of generated module.
+        """
+        config_dir, config_file = os.path.split(os.path.abspath(config_filepath))
+        name_hash = hashlib.sha1(layout_name.encode('utf-8')).hexdigest()[:8]
+        module_name = re.sub(r'\W', '_', os.path.splitext(config_file)[0] + '__' + layout_name) + '_' + name_hash
+
+        return os.path.join(config_dir, cls.GENERATED_DIR_NAME, module_name + '.py')
+
+    @classmethod
+    def returnSourceHash(cls, config_filepath: str, file_key: tuple = None) -> str:
+        """
+        Returns SHA-256 hash of XML config file. Hash is computed again only after the file changes.
+
+        :param config_filepath: String path to XML config file.
+        :param file_key: Key of the current version of the file returned by 'ParsedConfigCache.returnFileKey' method
+            - if the caller already has it.
+        :return: String hex digest of the hash.
+        """
+        if file_key is None:
+            file_key = ParsedConfigCache.returnFileKey(config_filepath)
+
+        with cls._lock:
+            entry = cls._source_hashes.get(file_key[0])
+        if entry is not None and entry[0] == file_key:
+            return entry[1]
+
+        with open(file_key[0], 'rb') as config_file:
+            source_hash = hashlib.sha256(config_file.read()).hexdigest()
+
+        with cls._lock:
+            cls._source_hashes[file_key[0]] = (file_key, source_hash)
+
+        return source_hash
+
+    @classmethod
+    def returnDependencyHashes(cls, config_filepath: str, parsed_config: ParsedConfig) -> list:
+        """
+        Returns the hashes of all files included by given XML config file. Paths are relative to the directory of
+        the config file - so the files can be moved together.
+
+        :param config_filepath: String path to XML config file.
+        :param parsed_config: ParsedConfig object of the file.
+        :return: List of [ relative path, hash ] pairs - sorted by paths.
+        """
+        config_dir = os.path.dirname(os.path.abspath(config_filepath))
+
+        return [[os.path.relpath(dependency_path, config_dir), cls.returnSourceHash(dependency_path)]
+                for dependency_path in sorted(parsed_config.dependencies)]
+
+    @classmethod
+    def areDependencyHashesCurrent(cls, config_filepath: str, dependency_hashes: list) -> bool:
+        """
+        Checks if files included by XML config file are the same as when given hashes were computed.
+
+        :param config_filepath: String path to XML config file.
+        :param dependency_hashes: List returned by 'returnDependencyHashes' method.
+        :return: True if all included files are unchanged, otherwise False.
+        """
+        config_dir = os.path.dirname(os.path.abspath(config_filepath))
+
+        try:
+            return all(cls.returnSourceHash(os.path.join(config_dir, dependency_path)) == dependency_hash
+                       for dependency_path, dependency_hash in dependency_hashes)
+        except OSError:
+            return False
+
+    @classmethod
+    def returnGeneratedModule(cls, config_filepath: str, layout_name: str, file_key: tuple = None):
+        """
+        Returns imported generated module for given layout - if it exists and it was generated from the current
+        version of XML config file and of all files it includes.
+
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the layout described in the XML file.
+        :param file_key: Key of the current version of XML config file returned by 'ParsedConfigCache.returnFileKey'
+            method - if the caller already has it.
+        :return: Module object or None if there is no up-to-date generated module.
+        """
+        if file_key is None:
+            file_key = ParsedConfigCache.returnFileKey(config_filepath)
+
+        # The module was missing for the current version of XML file - it is not looked for again until the file
+        # changes.
+        missing_key = (file_key[0], layout_name)
+        with cls._lock:
+            if cls._missing_modules.get(missing_key) == file_key:
+                return None
+
+        module_path = cls.returnGeneratedModulePath(config_filepath, layout_name)
+        source_hash = cls.returnSourceHash(config_filepath, file_key)
+
+        with cls._lock:
+            entry = cls._loaded_modules.get(module_path)
+        if entry is not None and entry[0] == source_hash:
+            if cls.areDependencyHashesCurrent(config_filepath, entry[1]):
+                return entry[2]
+            return None
+
+        # Read only the header of generated module - stale modules are never imported.
+        try:
+            with open(module_path, 'r', encoding='utf-8') as module_file:
+                header = module_file.readline()
+                dependencies_line = module_file.readline()
+        except OSError:
+            header = dependencies_line = ''
+
+        expected_header = cls.HEADER_PREFIX + source_hash + ' version: ' + str(cls.GENERATOR_VERSION)
+        if header.rstrip('\n') != expected_header or not dependencies_line.startswith(cls.DEPENDENCIES_PREFIX):
+            with cls._lock:
+                cls._missing_modules[missing_key] = file_key
+            return None
+        dependency_hashes = json.loads(dependencies_line[len(cls.DEPENDENCIES_PREFIX):])
+        if not cls.areDependencyHashesCurrent(config_filepath, dependency_hashes):
+            return None
+
+        module_spec = importlib.util.spec_from_file_location('_gui_generated_' + os.path.basename(module_path)[:-3],
+                                                             module_path)
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+        # Cached bytecode could be out of date if the module was rewritten within the same second - check it again.
+        if getattr(module, 'SOURCE_HASH', None) != source_hash:
+            return None
+
+        with cls._lock:
+            cls._loaded_modules[module_path] = (source_hash, dependency_hashes, module)
+
+        return module
+
+    @classmethod
+    def clear(cls):
+        """
+        Forgets all imported generated modules and missing ones - so the modules are looked for on disk again.
+
+        :return: None
+        """
+        with cls._lock:
+            cls._loaded_modules.clear()
+            cls._missing_modules.clear()
+
+
+class LayoutPrecompiler:
+    """
+    Class to precompile layouts described in XML config files at build/deploy time. Every layout is compiled into
+    LayoutSpec object, checked and written as JSON artifact to '__gui_precompiled__' directory next to XML config
+    file. 'PyQT5_GUI_Builder.returnGuiLayout' method builds the layout from the artifact - without parsing the XML
+    file - as long as the hash of XML file stored in the artifact is up to date. See 'PyQT5_GUI_Builder_Precompile.py'
+    for command-line entry point. Missing artifact is remembered until XML file changes - call 'clear' method after
+    precompiling in another process.
+    """
+
+    PRECOMPILED_DIR_NAME = '__gui_precompiled__'
+    ARTIFACT_VERSION = 3
+    # Artifacts hold only data (JSON) - loading them never runs any code, even if the directory is writable by others.
+    ARTIFACT_EXTENSION = '.json'
+
+    # Tags of components in the data of artifacts.
+    TAG_COMPONENT = 'component'
+    TAG_LAYOUT = 'layout'
+    TAG_REPEAT = 'repeat'
+
+    _lock = threading.RLock()
+    # Build plans made from loaded artifacts - keyed on the path of the artifact. Every entry stores the hash of XML
+    # file, the key of artifact file, resolver's generation the plan was made in and the hashes of included files.
+    _loaded_plans = dict()
+    # Keys of XML config files that had no artifact - keyed on file's absolute path and layout name.
+    _missing_artifacts = dict()
+
+    @classmethod
+    def precompileConfig(cls, config_filepath: str, resolve_objects: bool = True, write_binary: bool = False) -> dict:
+        """
+        Precompiles all main-level layouts of given XML config file. Errors of single layouts do not stop the
+        precompilation of the remaining ones - they are reported in the result.
+
+        :param config_filepath: String path to XML config file.
+        :param resolve_objects: If True, modules listed in XML file are imported and all classes and module-level
+            objects used by the layouts are resolved. Otherwise only the ids of modules and classes are checked.
+        :param write_binary: If True and all layouts were precompiled without errors, the whole file is also written
+            in binary format by BinaryConfigWriter - next to XML config file.
+        :return: Dictionary with the path of the file, elapsed time in milliseconds, lists of written artifacts
+            ( layout name, artifact path ), errors and warnings and the path of binary file (or None).
+        """
+        start_ns = time.perf_counter_ns()
+        result = {'config_filepath': config_filepath, 'artifacts': list(), 'errors': list(), 'warnings': list(),
+                  'binary_path': None}
+
+        try:
+            source_hash = LayoutCodeGenerator.returnSourceHash(config_filepath)
+            parsed_config = PyQT5_GUI_Builder.returnParsedConfig(config_filepath, False)
+            dependency_hashes = LayoutCodeGenerator.returnDependencyHashes(config_filepath, parsed_config)
+            if parsed_config.duplicate_names:
+                result['errors'].append('Duplicated layout names: ' + ', '.join(sorted(parsed_config.duplicate_names)))
+        except Exception as parse_error:
+            result['errors'].append(str(parse_error) if isinstance(parse_error, LayoutBuildError)
+                                    else type(parse_error).__name__ + ': ' + str(parse_error))
+            result['elapsed_ms'] = (time.perf_counter_ns() - start_ns) / 1e6
+            return result
+
+        for layout_name, layout_node in parsed_config.layouts_by_name.items():
+            if layout_name in parsed_config.duplicate_names:
+                continue
+            try:
+                layout_spec = PyQT5_GUI_Builder.compileLayoutSpec(layout_node, parsed_config.modules_data,
+                                                                  parsed_config.classes_data)
+                if resolve_objects:
+                    result['warnings'] += cls.validateLayoutSpec(layout_spec, layout_node)
+                artifact_path = cls.writeArtifact(config_filepath, layout_name, source_hash, layout_spec,
+                                                  dependency_hashes)
+            except Exception as compile_error:
+                if isinstance(compile_error, LayoutBuildError):
+                    compile_error.config_filepath = config_filepath
+                    compile_error.layout_name = layout_name
+                    result['errors'].append(str(compile_error))
+                else:
+                    result['errors'].append(type(compile_error).__name__ + ': ' + str(compile_error) +
+                                            ' - layout "' + layout_name + '"')
+                continue
+            result['artifacts'].append((layout_name, artifact_path))
+
+        if write_binary and not result['errors']:
+            try:
+                result['binary_path'] = BinaryConfigWriter.writeConfig(config_filepath)
+            except Exception as write_error:
+                result['errors'].append(type(write_error).__name__ + ': ' + str(write_error))
+
+        result['elapsed_ms'] = (time.perf_counter_ns() - start_ns) / 1e6
+
+        return result
+
+    @classmethod
+    def validateLayoutSpec(cls, layout_spec: LayoutSpec, layout_node: ET.Element) -> list:
+        """
+        Checks the references of given layout that can be resolved without building it. All classes and module-level
+        objects must exist - otherwise LayoutBuildError is raised. Attributes of the current object are looked up in
+        its class - missing ones are only reported as warnings, because they could be set by class's constructor.
+        Attributes of base object are not checked.
+
+        :param layout_spec: LayoutSpec object compiled from given 'layout' XML node.
+        :param layout_node: xml.etree.ElementTree.Element object that represents 'layout' XML node.
+        :return: List of string warnings.
+        """
+        # Linking resolves all the classes and module-level objects - the same way as before the build.
+        with PyQT5_GUI_Builder.symbol_resolver.buildScope():
+            layout_steps = LayoutPlan.linkLayout(layout_spec, layout_node)
+
+        warnings = list()
+        cls.validateLayoutSteps(layout_steps, layout_spec.name, warnings)
+
+        return warnings
+
+    @classmethod
+    def validateLayoutSteps(cls, layout_steps: tuple, layout_name: str, warnings: list):
+        """
+        Recursive class method that checks the attributes of current objects used by given build steps.
+
+        :param layout_steps: Tuple of build steps returned by 'LayoutPlan.linkLayout' method.
+        :param layout_name: Name of the layout the steps belong to - used in warnings.
+        :param warnings: List of string warnings to be extended.
+        :return: None
+        """
+        for step_kind, placement_args, step_data in layout_steps:
+            if step_kind == LayoutPlan.STEP_LAYOUT:
+                cls.validateLayoutSteps(step_data[0], step_data[2], warnings)
+                continue
+            if step_kind != LayoutPlan.STEP_COMPONENT:
+                continue
+
+            component_type, class_obj, constructor_args, features = step_data
+            for feature_args, setting_attrs in features:
+                attr_names = [value for slot_target, is_named, source, value in feature_args[2]
+                              if source == LayoutPlan.SOURCE_CURRENT_OBJECT]
+                # Only the first setting attribute of the chain is known to be read from the current object.
+                if setting_attrs and setting_attrs[0][0] == LayoutPlan.SOURCE_CURRENT_OBJECT:
+                    attr_names.append(setting_attrs[0][1])
+
+                for attr_name in attr_names:
+                    if not hasattr(class_obj, attr_name):
+                        warnings.append('Class "' + class_obj.__name__ + '" has no attribute "' + attr_name +
+                                        '" - layout "' + str(layout_name) + '"')
+
+    @classmethod
+    def returnArtifactPath(cls, config_filepath: str, layout_name: str) -> str:
+        """
+        Returns the path of precompiled artifact for given layout.
+
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the layout described in the XML file.
+        :return: String path of the artifact.
+        """
+        config_dir = os.path.dirname(os.path.abspath(config_filepath))
+        # The same name as the name of generated module - only the directory and extension differ.
+        module_path = LayoutCodeGenerator.returnGeneratedModulePath(config_filepath, layout_name)
+        artifact_name = os.path.splitext(os.path.basename(module_path))[0] + cls.ARTIFACT_EXTENSION
+
+        return os.path.join(config_dir, cls.PRECOMPILED_DIR_NAME, artifact_name)
+
+    @classmethod
+    def returnArtifactHeader(cls, source_hash: str, layout_name: str, dependency_hashes: list = None) -> tuple:
+        """
+        Returns the header stored at the beginning of the artifact - the artifact is used only if its header is equal
+        to the expected one and the files included by XML config file did not change.
+
+        :param source_hash: String hash of XML config file.
+        :param layout_name: Name of the layout.
+        :param dependency_hashes: List returned by 'LayoutCodeGenerator.returnDependencyHashes' method.
+        :return: Tuple - ( artifact version, hash of XML config file, layout name, hashes of included files )
+        """
+        return cls.ARTIFACT_VERSION, source_hash, layout_name, dependency_hashes or list()
 
-            # Cast arguments as desired datatypes.
-            if arg_type == XmlCommonAttrValues.ARG_TYPE_INTEGER.value:
-                arg_value = int(arg_value)
-            elif arg_type in [XmlCommonAttrValues.ARG_TYPE_STRING.value, XmlCommonAttrValues.ARG_TYPE_VARIABLE.value]:
-                arg_value = str(arg_value)
+    @classmethod
+    def writeArtifact(cls, config_filepath: str, layout_name: str, source_hash: str, layout_spec: LayoutSpec,
+                      dependency_hashes: list = None) -> str:
+        """
+        Writes precompiled artifact of given layout to disk.
 
-            # If the argument has "var" datatype specified, the 'value' contains the NAME of object/constant that
-            # needs to be added to the result tuple. The function below is to get the actual reference of desired
-            # object based on its parent's type.
-            if arg_type == XmlCommonAttrValues.ARG_TYPE_VARIABLE.value:
-                arg_value = cls.getObjectBasedOnParentType(arg, modules_data, arg_value, current_object, base_object)
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the layout described in the XML file.
+        :param source_hash: String hash of XML config file the spec was compiled from.
+        :param layout_spec: LayoutSpec object to be stored.
+        :param dependency_hashes: List returned by 'LayoutCodeGenerator.returnDependencyHashes' method.
+        :return: String path of the written artifact.
+        """
+        artifact_path = cls.returnArtifactPath(config_filepath, layout_name)
+        os.makedirs(os.path.dirname(artifact_path), exist_ok=True)
 
-            # If the argument has "self" datatype specified, the value that has to be passed is a reference to the
-            # current object that is being created
-            if arg_type == XmlCommonAttrValues.ARG_TYPE_SELF.value:
-                arg_value = current_object
+        # Write to temporary file first - so the artifact is never read half-written. Header is written in separate
+        # line, so stale artifacts can be recognized without loading the whole spec.
+        temp_path = artifact_path + '.' + str(os.getpid()) + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as artifact_file:
+            artifact_file.write(json.dumps(cls.returnArtifactHeader(source_hash, layout_name, dependency_hashes)))
+            artifact_file.write('\n')
+            artifact_file.write(json.dumps(cls.returnLayoutSpecData(layout_spec), separators=(',', ':')))
+        os.replace(temp_path, artifact_path)
 
-            # Add this argument to relevant container based on its 'kind' XML attribute
-            if arg_kind == XmlCommonAttrValues.ARG_KIND_NAMED.value:
-                arg_name = arg.attrib[XmlAttrsNames.ARG_NAME_ATTR.value]
-                result_kwargs[arg_name] = arg_value
-            elif arg_kind == XmlCommonAttrValues.ARG_KIND_UNNAMED.value:
-                result_args.append(arg_value)
+        with cls._lock:
+            cls._missing_artifacts.pop((os.path.abspath(config_filepath), layout_name), None)
 
-        return result_args, result_kwargs
+        return artifact_path
 
     @classmethod
-    def getObjectBasedOnParentType(cls, xml_node: ET.Element, modules_data: dict, object_name: str, current_object,
-                                   base_object):
+    def loadArtifact(cls, config_filepath: str, artifact_path: str, expected_header: tuple) -> tuple:
         """
-        Gets the reference of an object by given name and the type of object's parent - read from config XML file.
+        Reads LayoutSpec object from precompiled artifact - if the artifact exists, its header is as expected and the
+        files included by XML config file did not change.
 
-        :param xml_node: xml.etree.ElementTree.Element object that represents current XML node containing info about
-            object to get.
-        :param modules_data: Dictionary of key-value pairs containing info about modules listed in XML config file
-            ('module' nodes).
-        :param object_name: Name of the object which reference will be got.
-        :param current_object: GUI object that was created based on the current 'component' XML node. If no object was
-            created yet (this func is called for constructor's arguments), pass None.
-        :param base_object: Reference to python object that called this function (or acts like a host-object for result
-            layout - e.g. contains methods that need to be connected to buttons etc...).
-        :return: Any object - reference got by name and object's parent type.
+        :param config_filepath: String path to XML config file.
+        :param artifact_path: String path of the artifact.
+        :param expected_header: Tuple returned by 'returnArtifactHeader' method - hashes of included files are read
+            from the artifact.
+        :return: Tuple - ( LayoutSpec object, hashes of included files ) or None if there is no up-to-date artifact.
         """
+        try:
+            with open(artifact_path, 'r', encoding='utf-8') as artifact_file:
+                header = json.loads(artifact_file.readline())
+                if (tuple(header[:3]) != tuple(expected_header[:3]) or
+                        not LayoutCodeGenerator.areDependencyHashesCurrent(config_filepath, header[3])):
+                    return None
+                return cls.returnLayoutSpecFromData(json.loads(artifact_file.readline())), header[3]
+        except (OSError, ValueError, TypeError, IndexError, KeyError, ET.ParseError):
+            return None
 
-        obj = None
-        # In this case, there must be 'parent_type_id' attribute specified in given XML node. Read it. It stands for
-        # the type of parent object that contains the object specified by name in the 'value' attribute in
-        # 'arg' XML node.
-        parent_type_id = xml_node.attrib[XmlAttrsNames.PARENT_TYPE_ID.value]
+    @classmethod
+    def returnLayoutSpecData(cls, layout_spec: LayoutSpec) -> list:
+        """
+        Recursive class method that turns LayoutSpec object into JSON-compatible data - lists, strings, integers,
+        booleans and None only.
 
-        # In the following case, the parent object of the one specified, is the current GUI component object
-        # that is being created/modified.
-        if parent_type_id == "0":
-            # Assign the exact object to the result variable.
-            obj = getattr(current_object, object_name)
-        # In the following case, the parent object is a whole module.
-        elif parent_type_id == "1":
-            # In this case, there must be 'module_id' attribute specified for current XML node. Read it.
-            # Read the module name using the id read from XML node and the dictionary of modules' information.
-            module_name = modules_data[xml_node.attrib[XmlAttrsNames.PARENT_MODULE_ID.value]]
-            # Assign the exact object to the result variable.
-            obj = cls.returnObjectByName(module_name, object_name)
-        # In the following case, the parent object is an object that called this function.
-        elif parent_type_id == "2":
-            # Assign the exact object to the result variable.
-            obj = getattr(base_object, object_name)
+        :param layout_spec: LayoutSpec object.
+        :return: List - ( tag, name, placement, components' data, is deferred, is virtual ).
+        """
+        components_data = list()
+        for component_spec in layout_spec.components:
+            if isinstance(component_spec, LayoutSpec):
+                components_data.append(cls.returnLayoutSpecData(component_spec))
+            elif isinstance(component_spec, RepeatSpec):
+                # 'repeat' nodes driven by python iterables are expanded during the build - they are kept as XML.
+                components_data.append([cls.TAG_REPEAT, ET.tostring(component_spec.repeat_node, encoding='unicode'),
+                                        component_spec.modules_data, component_spec.classes_data])
+            else:
+                components_data.append([cls.TAG_COMPONENT, component_spec.component_type, component_spec.module_name,
+                                        component_spec.class_name, list(component_spec.placement),
+                                        [list(arg_spec) for arg_spec in component_spec.constructor_args],
+                                        [[[list(arg_spec) for arg_spec in feature_spec.args],
+                                          [list(attr_spec) for attr_spec in feature_spec.setting_attrs]]
+                                         for feature_spec in component_spec.features]])
 
-        return obj
+        return [cls.TAG_LAYOUT, layout_spec.name, list(layout_spec.placement), components_data, layout_spec.deferred,
+                layout_spec.virtual]
 
     @classmethod
-    def implementFeature(cls, target_obj, feature_node: ET.Element, modules_data: dict, base_object):
+    def returnLayoutSpecFromData(cls, layout_data: list) -> LayoutSpec:
         """
-        Reads the information about desired modification that should be applied to current GUI component object and
-        implements it. Information is read from 'feature' XML node in given config file.
+        Recursive class method that makes LayoutSpec object from the data returned by 'returnLayoutSpecData' method.
 
-        :param target_obj: Reference to the current GUI component that should be modified.
-        :param feature_node: xml.etree.ElementTree.Element object that represents 'feature' XML node from config file.
-        :param modules_data: Dictionary of key-value pairs containing info about modules listed in XML config file
-            ('module' nodes).
-        :param base_object: Reference to python object that called this function (or acts like a host-object for result
-            layout - e.g. contains methods that need to be connected to buttons etc...).
-        :return: Any object - current GUI component after modification.
+        :param layout_data: List with the data of the layout.
+        :return: LayoutSpec object.
         """
+        _, name, placement, components_data, deferred, virtual = layout_data
 
-        # Read arguments of feature to be implemented (from 'arg' XML nodes listed inside 'feature' node)
-        args, kwargs = cls.returnFunctionArguments(feature_node,
-                                                   XmlNodeNames.FEATURE_PARAMS.value,
-                                                   modules_data,
-                                                   target_obj,
-                                                   base_object)
+        components = list()
+        for component_data in components_data:
+            if component_data[0] == cls.TAG_LAYOUT:
+                components.append(cls.returnLayoutSpecFromData(component_data))
+            elif component_data[0] == cls.TAG_REPEAT:
+                components.append(RepeatSpec(ET.fromstring(component_data[1]), component_data[2], component_data[3]))
+            elif component_data[0] == cls.TAG_COMPONENT:
+                _, component_type, module_name, class_name, component_placement, args_data, features_data = \
+                    component_data
+                components.append(ComponentSpec(
+                    component_type, module_name, class_name, tuple(component_placement),
+                    tuple(ArgSpec(*arg_data) for arg_data in args_data),
+                    tuple(FeatureSpec(tuple(ArgSpec(*arg_data) for arg_data in feature_args),
+                                      tuple(SettingAttrSpec(*attr_data) for attr_data in setting_attrs))
+                          for feature_args, setting_attrs in features_data)))
+            else:
+                raise ValueError('Unknown component tag in precompiled artifact: ' + repr(component_data[0]))
 
-        # Get the object (e.g. method) that is responsible for feature implementation. This object is described inside
-        # 'setting_attributes' XML node, inside 'feature' node).
-        setting_attr = cls.returnSettingAttribute(feature_node, modules_data, target_obj, base_object)
+        return LayoutSpec(name, tuple(placement), tuple(components), bool(deferred), bool(virtual))
 
-        # Do the modification of the current GUI object.
-        setting_attr(*args, **kwargs)
+    @classmethod
+    def returnPrecompiledPlan(cls, config_filepath: str, layout_name: str, file_key: tuple = None) -> LayoutPlan:
+        """
+        Returns build plan of given layout made from its precompiled artifact - if the artifact exists and it was
+        precompiled from the current version of XML config file and of all files it includes.
 
-        return target_obj
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the layout described in the XML file.
+        :param file_key: Key of the current version of XML config file returned by 'ParsedConfigCache.returnFileKey'
+            method - if the caller already has it.
+        :return: LayoutPlan object or None if there is no up-to-date artifact.
+        """
+        if file_key is None:
+            file_key = ParsedConfigCache.returnFileKey(config_filepath)
+
+        # The artifact was missing for the current version of XML file - it is not looked for again until the file
+        # changes.
+        missing_key = (file_key[0], layout_name)
+        with cls._lock:
+            if cls._missing_artifacts.get(missing_key) == file_key:
+                return None
+
+        artifact_path = cls.returnArtifactPath(config_filepath, layout_name)
+        try:
+            artifact_key = ParsedConfigCache.returnFileKey(artifact_path)
+        except OSError:
+            with cls._lock:
+                cls._missing_artifacts[missing_key] = file_key
+            return None
+
+        source_hash = LayoutCodeGenerator.returnSourceHash(config_filepath, file_key)
+        generation = PyQT5_GUI_Builder.symbol_resolver.generation
+
+        with cls._lock:
+            entry = cls._loaded_plans.get(artifact_path)
+        if entry is not None and entry[0] == source_hash and entry[1] == artifact_key:
+            dependency_hashes = entry[4]
+            if not LayoutCodeGenerator.areDependencyHashesCurrent(config_filepath, dependency_hashes):
+                return None
+            if entry[2] == generation:
+                return entry[3]
+            # Resolved objects are out of date - only the linking is done again.
+            layout_spec = entry[3].layout_spec
+        else:
+            artifact = cls.loadArtifact(config_filepath, artifact_path,
+                                        cls.returnArtifactHeader(source_hash, layout_name))
+            if artifact is None:
+                return None
+            layout_spec, dependency_hashes = artifact
+
+        with PyQT5_GUI_Builder.symbol_resolver.buildScope():
+            layout_plan = LayoutPlan(layout_spec)
+
+        with cls._lock:
+            cls._loaded_plans[artifact_path] = (source_hash, artifact_key, generation, layout_plan, dependency_hashes)
+
+        return layout_plan
 
     @classmethod
-    def returnSettingAttribute(cls, xml_node: ET.Element, modules_data, current_object, base_object):
+    def clear(cls):
         """
-        Gets the method responsible for implementing particular feature based on the data placed under
-        'feature' XML node in config file - inside 'setting_attributes' node.
- 
-        :param xml_node: xml.etree.ElementTree.Element object that represents 'feature' XML node from config file.
-        :param modules_data: Dictionary of key-value pairs containing info about modules listed in XML config file
-            ('module' nodes).
-        :param current_object: Object that was created based on the current 'component' XML node.
-        :param base_object: Reference to python object that called this function (or acts like a host-object for result
-            layout - e.g. contains methods that need to be connected to buttons etc...).
-        :return: Any object that represents e.g. method responsible for implementing given feature.
+        Removes all build plans made from loaded artifacts and forgets missing artifacts - so the artifacts are read
+        from disk again.
+
+        :return: None
         """
+        with cls._lock:
+            cls._loaded_plans.clear()
+            cls._missing_artifacts.clear()
 
-        final_setting_attr = current_object
-        # Sometimes there is a need to get the desired method "step-by-step". For example - for QPushButton, the method
-        # responsible for setting 'clicked' action is 'QPushButton.clicked.connect', so there must be two
-        # 'component_attr' XML nodes inside 'setting_attributes' node - first for 'clicked' property, and the second for
-        # 'connect'.
-        # This is why the following algorithm runs in a loop.
-        component_setting_attrs = xml_node.find(XmlNodeNames.FEATURE_SETTING_ATTRS.value)
-        for component_attr in component_setting_attrs:
-            # Read the value of 'name' XML attribute for 'component_attr' node. This is a name of component
-            # method/property responsible for feature implementation.
-            attr_name = component_attr.attrib[XmlAttrsNames.SETTING_ATTR_NAME.value]
 
-            # Get the reference of the object described by 'component_attr' node.
-            final_setting_attr = cls.getObjectBasedOnParentType(component_attr, modules_data, attr_name,
-                                                                final_setting_attr, base_object)
+class BinaryConfigWriter:
+    """
+    Class to write XML config files in compact binary format - read by BinaryConfigReader. All layouts of the file are
+    stored compiled (as LayoutSpec objects would be) with all strings interned in single string table. Integer
+    arguments are stored already cast. Every layout can be found by the index at the end of the file and decoded
+    without touching the other layouts.
 
-        return final_setting_attr
+    Layout of the file (all numbers little-endian):
+        header - magic, version, number of strings and offsets of the sections ('HEADER_FORMAT')
+        layout records - one per main-level layout; nested layouts are stored inside their parents' records,
+            preceded by their length - so they can be skipped
+        common section - ( id, name ) string pairs of modules and classes
+        layouts index - ( name, offset of layout record ) pairs
+        string table - offsets of strings followed by UTF-8 encoded strings
+    """
+
+    MAGIC = b'PQGB'
+    FORMAT_VERSION = 1
+    BINARY_EXTENSION = '.guib'
+    # magic, version, reserved, strings count, strings offset, common offset, layouts count, index offset
+    HEADER_FORMAT = '<4sHHIIIII'
+    # Index of the string used for None values.
+    NONE_INDEX = 0xFFFFFFFF
+
+    # Tags of components' records.
+    TAG_COMPONENT = 0
+    TAG_LAYOUT = 1
+    TAG_REPEAT = 2
 
+    # Tags of arguments' values.
+    VALUE_STRING = 0
+    VALUE_INTEGER = 1
+    VALUE_NONE = 2
 
-class MainWindow(QtWidgets.QMainWindow):
+    # Flags of layout records.
+    FLAG_DEFERRED = 1
+    FLAG_VIRTUAL = 2
+
+    @classmethod
+    def writeConfig(cls, config_filepath: str, output_path: str = None) -> str:
+        """
+        Writes given XML config file in binary format.
+
+        :param config_filepath: String path to XML config file.
+        :param output_path: String path of the binary file to be written. If not specified, the file is written next
+            to XML config file - with 'BINARY_EXTENSION' extension.
+        :return: String path of the written file.
+        """
+        if output_path is None:
+            output_path = cls.returnBinaryPath(config_filepath)
+
+        config_bytes = cls.returnConfigBytes(PyQT5_GUI_Builder.returnParsedConfig(config_filepath, False))
+
+        # Write to temporary file first - readers that mapped the previous version keep reading it safely.
+        temp_path = output_path + '.' + str(os.getpid()) + '.tmp'
+        with open(temp_path, 'wb') as binary_file:
+            binary_file.write(config_bytes)
+        os.replace(temp_path, output_path)
+
+        return output_path
+
+    @classmethod
+    def returnBinaryPath(cls, config_filepath: str) -> str:
+        """
+        Returns the default path of binary file for given XML config file.
+
+        :param config_filepath: String path to XML config file.
+        :return: String path of binary file.
+        """
+        return os.path.splitext(config_filepath)[0] + cls.BINARY_EXTENSION
+
+    @classmethod
+    def returnConfigBytes(cls, parsed_config: ParsedConfig) -> bytes:
+        """
+        Returns binary representation of parsed XML config file.
+
+        :param parsed_config: ParsedConfig object.
+        :return: Bytes of the binary file.
+        """
+        if parsed_config.duplicate_names:
+            raise LayoutBuildError('Duplicated layout names: ' + ', '.join(sorted(parsed_config.duplicate_names)),
+                                   None, parsed_config.config_filepath)
+
+        strings = dict()
+        data = bytearray(struct.calcsize(cls.HEADER_FORMAT))
+
+        layout_offsets = list()
+        for layout_name, layout_node in parsed_config.layouts_by_name.items():
+            try:
+                layout_spec = PyQT5_GUI_Builder.compileLayoutSpec(layout_node, parsed_config.modules_data,
+                                                                  parsed_config.classes_data)
+            except LayoutBuildError as build_error:
+                build_error.config_filepath = parsed_config.config_filepath
+                build_error.layout_name = layout_name
+                raise
+            layout_offsets.append((cls.internString(strings, layout_name), len(data)))
+            cls.packLayoutSpec(data, layout_spec, strings)
+
+        common_offset = len(data)
+        for common_data in (parsed_config.modules_data, parsed_config.classes_data):
+            data += struct.pack('<I', len(common_data))
+            for data_id, data_name in common_data.items():
+                data += struct.pack('<II', cls.internString(strings, data_id), cls.internString(strings, data_name))
+
+        index_offset = len(data)
+        for name_index, layout_offset in layout_offsets:
+            data += struct.pack('<II', name_index, layout_offset)
+
+        # String table - offsets of the strings (relative to the first string) and the strings themselves.
+        strings_offset = len(data)
+        encoded_strings = [string.encode('utf-8') for string in strings]
+        string_offset = 0
+        for encoded_string in encoded_strings:
+            data += struct.pack('<I', string_offset)
+            string_offset += len(encoded_string)
+        data += struct.pack('<I', string_offset)
+        data += b''.join(encoded_strings)
+
+        struct.pack_into(cls.HEADER_FORMAT, data, 0, cls.MAGIC, cls.FORMAT_VERSION, 0, len(strings), strings_offset,
+                         common_offset, len(layout_offsets), index_offset)
+
+        return bytes(data)
+
+    @classmethod
+    def internString(cls, strings: dict, string: str) -> int:
+        """
+        Returns the index of given string in the string table - the string is added to the table if it is new.
+
+        :param strings: Dictionary of strings and their indexes - in the order of adding.
+        :param string: String to be interned or None.
+        :return: Index of the string.
+        """
+        if string is None:
+            return cls.NONE_INDEX
+
+        string_index = strings.get(string)
+        if string_index is None:
+            string_index = strings[string] = len(strings)
+
+        return string_index
+
+    @classmethod
+    def packLayoutSpec(cls, data: bytearray, layout_spec: LayoutSpec, strings: dict):
+        """
+        Recursive class method that appends the record of given layout to the data.
+
+        :param data: Bytearray to be extended.
+        :param layout_spec: LayoutSpec object.
+        :param strings: Dictionary of interned strings.
+        :return: None
+        """
+        flags = (cls.FLAG_DEFERRED if layout_spec.deferred else 0) | (cls.FLAG_VIRTUAL if layout_spec.virtual else 0)
+        data += struct.pack('<IB', cls.internString(strings, layout_spec.name), flags)
+        cls.packPlacement(data, layout_spec.placement)
+        data += struct.pack('<I', len(layout_spec.components))
+
+        for component_spec in layout_spec.components:
+            if isinstance(component_spec, LayoutSpec):
+                # Length of nested record is written before the record (its place is reserved and filled in when the
+                # record is done) - so the reader can skip it.
+                data += struct.pack('<B', cls.TAG_LAYOUT)
+                length_offset = len(data)
+                data += bytes(4)
+                cls.packLayoutSpec(data, component_spec, strings)
+                struct.pack_into('<I', data, length_offset, len(data) - length_offset - 4)
+            elif isinstance(component_spec, RepeatSpec):
+                # 'repeat' nodes driven by python iterables are expanded during the build - they are kept as XML.
+                data += struct.pack('<BI', cls.TAG_REPEAT, cls.internString(
+                    strings, ET.tostring(component_spec.repeat_node, encoding='unicode')))
+            else:
+                data += struct.pack('<BIII', cls.TAG_COMPONENT,
+                                    cls.internString(strings, component_spec.component_type),
+                                    cls.internString(strings, component_spec.module_name),
+                                    cls.internString(strings, component_spec.class_name))
+                cls.packPlacement(data, component_spec.placement)
+                cls.packArgsSpec(data, component_spec.constructor_args, strings)
+                data += struct.pack('<H', len(component_spec.features))
+                for feature_spec in component_spec.features:
+                    cls.packArgsSpec(data, feature_spec.args, strings)
+                    data += struct.pack('<B', len(feature_spec.setting_attrs))
+                    for attr_spec in feature_spec.setting_attrs:
+                        data += struct.pack('<III', cls.internString(strings, attr_spec.parent_type_id),
+                                            cls.internString(strings, attr_spec.name),
+                                            cls.internString(strings, attr_spec.module_name))
+
+    @staticmethod
+    def packPlacement(data: bytearray, placement: tuple):
+        """
+        Appends 'row' and 'column' values of a component or layout to the data.
+
+        :param data: Bytearray to be extended.
+        :param placement: Tuple of integer placement arguments.
+        :return: None
+        """
+        data += struct.pack('<B' + 'i' * len(placement), len(placement), *placement)
+
+    @classmethod
+    def packArgsSpec(cls, data: bytearray, args_spec: tuple, strings: dict):
+        """
+        Appends the records of arguments to the data.
+
+        :param data: Bytearray to be extended.
+        :param args_spec: Tuple of ArgSpec objects.
+        :param strings: Dictionary of interned strings.
+        :return: None
+        """
+        data += struct.pack('<H', len(args_spec))
+        for arg_spec in args_spec:
+            if arg_spec.value is None:
+                value_tag, value_format, value = cls.VALUE_NONE, '', ()
+            elif isinstance(arg_spec.value, int):
+                value_tag, value_format, value = cls.VALUE_INTEGER, 'q', (arg_spec.value,)
+            else:
+                value_tag, value_format, value = cls.VALUE_STRING, 'I', (cls.internString(strings, arg_spec.value),)
+
+            data += struct.pack('<BIIII' + value_format, value_tag,
+                                cls.internString(strings, arg_spec.arg_type),
+                                cls.internString(strings, arg_spec.arg_name),
+                                cls.internString(strings, arg_spec.parent_type_id),
+                                cls.internString(strings, arg_spec.module_name),
+                                *value)
+
+
+class BinaryConfigReader:
     """
-    Sample class for presentation purposes. Contains attribute 'gui_layout' built by 'PyQT5_GUI_Builder.returnGuiLayout'
-    function - based on given XML config file. This attribute (of QLayout type) is a main layout of the app window.
+    Class to read config files written by BinaryConfigWriter. The file is memory-mapped - only its header, common
+    section and layouts index are read when the reader is created. Layouts are decoded on demand, strings are decoded
+    when they are used for the first time. Readers are shared by all builds - see 'returnReader' method.
     """
-    def __init__(self):
-        super().__init__()
-        # Build the main layout attribute based on given XML config file.
-        # HERE THE PATH TO RELEVANT XML CONFIG FILE SHOULD BE SPECIFIED
-        # Path to 1st example file  - Resources/Settings/EX1_QLabel_And_QLineEdit.xml
-        #             layout name   - 1_QLabel_1_QLineEdit
-        # Path to 2nd example file  - Resources/Settings/EX2_2_Rows_Of_QLabel_And_QLineEdit.xml
-        #             layout name   - 2_Rows_Of_QLabel_QLineEdit
-        # Path to 3rd example file  - Resources/Settings/EX3_TwoButtonsWithDifferentMethods.xml
-        #             layout name   - Two_buttons_with_different_methods
-        self.gui_layout = PyQT5_GUI_Builder.returnGuiLayout('Resources/Settings/EX3_TwoButtonsWithDifferentMethods.xml',
-                                                            'Two_buttons_with_different_methods',
-                                                            self)
-
-        self.setWindowTitle('PyQt5 GUI Builder - from XML')
-        self.setFixedSize(600, 400)
-
-        self.central_widget = QtWidgets.QWidget()
-        self.setCentralWidget(self.central_widget)
-        self.lay = QtWidgets.QGridLayout(self.central_widget)
-        self.lay.addLayout(self.gui_layout, 0, 0)
-
-        self.show()
+
+    _lock = threading.RLock()
+    # Readers of binary files - keyed on file's absolute path, validated against file's modification time and size.
+    _readers = dict()
+
+    def __init__(self, config_filepath: str):
+        """
+        :param config_filepath: String path to binary config file.
+        """
+        self.config_filepath = config_filepath
+
+        with open(config_filepath, 'rb') as binary_file:
+            self._buffer = mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, _, strings_count, strings_offset, common_offset, layouts_count,
+         index_offset) = struct.unpack_from(BinaryConfigWriter.HEADER_FORMAT, self._buffer, 0)
+        if magic != BinaryConfigWriter.MAGIC or version != BinaryConfigWriter.FORMAT_VERSION:
+            self._buffer.close()
+            raise ValueError('Not a binary config file of supported version: ' + config_filepath)
+
+        self._strings_offset = strings_offset
+        self._strings_data_offset = strings_offset + 4 * (strings_count + 1)
+        self._strings = dict()
+
+        offset = common_offset
+        self.modules_data, offset = self.readCommonData(offset)
+        self.classes_data, offset = self.readCommonData(offset)
+
+        self.layout_offsets = dict()
+        for name_index, layout_offset in struct.iter_unpack('<II', self._buffer[index_offset:
+                                                                                 index_offset + 8 * layouts_count]):
+            self.layout_offsets[self.returnString(name_index)] = layout_offset
+
+        # Decoded layouts and build plans made from them (with resolver's generation) - filled on demand.
+        self.layout_specs = dict()
+        self.layout_plans = dict()
+
+    @classmethod
+    def returnReader(cls, config_filepath: str) -> 'BinaryConfigReader':
+        """
+        Returns shared reader of given binary config file. New reader is created after the file changes.
+
+        :param config_filepath: String path to binary config file.
+        :return: BinaryConfigReader object.
+        """
+        file_key = ParsedConfigCache.returnFileKey(config_filepath)
+
+        with cls._lock:
+            entry = cls._readers.get(file_key[0])
+            if entry is not None and entry[0] == file_key:
+                return entry[1]
+
+            # Reader of the previous version of the file is not closed - other threads may still decode its layouts.
+            # It is released by GC when the last of them drops it.
+            reader = cls(config_filepath)
+            cls._readers[file_key[0]] = (file_key, reader)
+
+        return reader
 
     @staticmethod
-    def print_msg_method():
+    def isBinaryConfig(config_filepath: str) -> bool:
+        """
+        Checks if given path is the path of binary config file - by its extension.
+
+        :param config_filepath: String path to config file.
+        :return: True for binary config files, otherwise False.
+        """
+        return config_filepath.endswith(BinaryConfigWriter.BINARY_EXTENSION)
+
+    def returnString(self, string_index: int) -> str:
+        """
+        Returns the string of given index from the string table.
+
+        :param string_index: Index of the string.
+        :return: String or None.
+        """
+        if string_index == BinaryConfigWriter.NONE_INDEX:
+            return None
+
+        string = self._strings.get(string_index)
+        if string is None:
+            start, end = struct.unpack_from('<II', self._buffer, self._strings_offset + 4 * string_index)
+            string = self._strings[string_index] = str(self._buffer[self._strings_data_offset + start:
+                                                                    self._strings_data_offset + end], 'utf-8')
+
+        return string
+
+    def readCommonData(self, offset: int) -> tuple:
+        """
+        Reads the dictionary of modules or classes from the common section.
+
+        :param offset: Offset of the data in the file.
+        :return: Tuple - ( dictionary of ids and names, offset of the next data )
+        """
+        (pairs_count,) = struct.unpack_from('<I', self._buffer, offset)
+        offset += 4
+        common_data = dict()
+        for data_id, data_name in struct.iter_unpack('<II', self._buffer[offset:offset + 8 * pairs_count]):
+            common_data[self.returnString(data_id)] = self.returnString(data_name)
+
+        return common_data, offset + 8 * pairs_count
+
+    def returnLayoutSpec(self, layout_name: str) -> LayoutSpec:
+        """
+        Returns LayoutSpec object of given main-level layout - decoded when it is requested for the first time.
+
+        :param layout_name: Name of the layout.
+        :return: LayoutSpec object.
+        """
+        layout_spec = self.layout_specs.get(layout_name)
+        if layout_spec is not None:
+            return layout_spec
+
+        layout_offset = self.layout_offsets.get(layout_name)
+        if layout_offset is None:
+            raise ValueError('Wrong layout name specified - such layout does not exists in ' + self.config_filepath)
+
+        layout_spec = self.layout_specs[layout_name] = self.readLayoutSpec(layout_offset)[0]
+
+        return layout_spec
+
+    def returnLayoutPlan(self, layout_name: str) -> LayoutPlan:
+        """
+        Returns build plan of given main-level layout. Plans are made again only after resolver's generation changes.
+
+        :param layout_name: Name of the layout.
+        :return: LayoutPlan object.
+        """
+        generation = PyQT5_GUI_Builder.symbol_resolver.generation
+        entry = self.layout_plans.get(layout_name)
+        if entry is not None and entry[0] == generation:
+            return entry[1]
+
+        layout_spec = self.returnLayoutSpec(layout_name)
+        with PyQT5_GUI_Builder.symbol_resolver.buildScope():
+            layout_plan = LayoutPlan(layout_spec)
+        self.layout_plans[layout_name] = (generation, layout_plan)
+
+        return layout_plan
+
+    def readLayoutSpec(self, offset: int) -> tuple:
+        """
+        Recursive method that decodes the record of a layout.
+
+        :param offset: Offset of the record in the file.
+        :return: Tuple - ( LayoutSpec object, offset of the next data )
+        """
+        buffer = self._buffer
+        return_string = self.returnString
+
+        name_index, flags = struct.unpack_from('<IB', buffer, offset)
+        placement, offset = self.readPlacement(offset + 5)
+        (components_count,) = struct.unpack_from('<I', buffer, offset)
+        offset += 4
+
+        components = list()
+        for _ in range(components_count):
+            tag = buffer[offset]
+            offset += 1
+            if tag == BinaryConfigWriter.TAG_LAYOUT:
+                nested_spec, _ = self.readLayoutSpec(offset + 4)
+                components.append(nested_spec)
+                offset += 4 + struct.unpack_from('<I', buffer, offset)[0]
+            elif tag == BinaryConfigWriter.TAG_REPEAT:
+                (xml_index,) = struct.unpack_from('<I', buffer, offset)
+                offset += 4
+                components.append(RepeatSpec(ET.fromstring(return_string(xml_index)), self.modules_data,
+                                             self.classes_data))
+            else:
+                type_index, module_index, class_index = struct.unpack_from('<III', buffer, offset)
+                component_placement, offset = self.readPlacement(offset + 12)
+                constructor_args, offset = self.readArgsSpec(offset)
+                (features_count,) = struct.unpack_from('<H', buffer, offset)
+                offset += 2
+                features = list()
+                for _ in range(features_count):
+                    feature_args, offset = self.readArgsSpec(offset)
+                    attrs_count = buffer[offset]
+                    offset += 1
+                    setting_attrs = tuple(SettingAttrSpec(return_string(parent_index), return_string(name_index),
+                                                          return_string(attr_module_index))
+                                          for parent_index, name_index, attr_module_index in struct.iter_unpack(
+                                              '<III', buffer[offset:offset + 12 * attrs_count]))
+                    offset += 12 * attrs_count
+                    features.append(FeatureSpec(feature_args, setting_attrs))
+                components.append(ComponentSpec(return_string(type_index), return_string(module_index),
+                                                return_string(class_index), component_placement, constructor_args,
+                                                tuple(features)))
+
+        return LayoutSpec(return_string(name_index), placement, tuple(components),
+                          bool(flags & BinaryConfigWriter.FLAG_DEFERRED),
+                          bool(flags & BinaryConfigWriter.FLAG_VIRTUAL)), offset
+
+    def readPlacement(self, offset: int) -> tuple:
+        """
+        Decodes 'row' and 'column' values of a component or layout.
+
+        :param offset: Offset of the data in the file.
+        :return: Tuple - ( tuple of placement arguments, offset of the next data )
+        """
+        placement_count = self._buffer[offset]
+        placement = struct.unpack_from('<' + 'i' * placement_count, self._buffer, offset + 1)
+
+        return placement, offset + 1 + 4 * placement_count
+
+    def readArgsSpec(self, offset: int) -> tuple:
+        """
+        Decodes the records of arguments.
+
+        :param offset: Offset of the data in the file.
+        :return: Tuple - ( tuple of ArgSpec objects, offset of the next data )
         """
-        Test function to be connected to QPushButton generated automatically - based on XML config file.
-            :return: None
+        buffer = self._buffer
+        return_string = self.returnString
+
+        (args_count,) = struct.unpack_from('<H', buffer, offset)
+        offset += 2
+
+        args = list()
+        for _ in range(args_count):
+            value_tag, type_index, name_index, parent_index, module_index = struct.unpack_from('<BIIII', buffer,
+                                                                                               offset)
+            offset += 17
+            if value_tag == BinaryConfigWriter.VALUE_INTEGER:
+                (value,) = struct.unpack_from('<q', buffer, offset)
+                offset += 8
+            elif value_tag == BinaryConfigWriter.VALUE_STRING:
+                value = return_string(struct.unpack_from('<I', buffer, offset)[0])
+                offset += 4
+            else:
+                value = None
+            args.append(ArgSpec(return_string(type_index), value, return_string(name_index),
+                                return_string(parent_index), return_string(module_index)))
+
+        return tuple(args), offset
+
+    def close(self):
+        """
+        Unmaps the file. Layouts that were not decoded yet cannot be read anymore.
+
+        :return: None
         """
-        print("Text comes from method")
+        self._buffer.close()
 
 
 def print_msg_function():
@@ -497,5 +4571,5 @@ def print_msg_function():
 # Call the application
 if __name__ == '__main__':
     app = QtWidgets.QApplication([])
-    app_main_gui = MainWindow()
+    app_main_gui = Widgets.MainWindow()
     app.exec_()
@@ -0,0 +1,105 @@
+"""
+Command-line entry point of 'LayoutPrecompiler' - precompiles all XML config files found in given directories (or
+given directly) in parallel worker processes. Every layout is compiled, checked and written as precompiled artifact
+that 'PyQT5_GUI_Builder.returnGuiLayout' method uses instead of the XML file. With '--binary' option the whole file is
+also written in compact binary format. Timing and errors are reported per file - the script exits with code 1 if any
+file could not be precompiled.
+
+Usage:
+    python PyQT5_GUI_Builder_Precompile.py Resources/Settings
+    python PyQT5_GUI_Builder_Precompile.py Resources/Settings --jobs 8 --path . --strict
+    python PyQT5_GUI_Builder_Precompile.py Resources/Settings --binary
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import argparse
+import time
+import sys
+import os
+
+from PyQT5_GUI_Builder import LayoutPrecompiler, LayoutCodeGenerator
+
+
+def returnConfigFilepaths(paths: list, extension: str = '.xml') -> list:
+    """
+    Returns the paths of all XML config files in given directories (searched recursively) and files. Directories with
+    generated modules and precompiled artifacts are skipped.
+
+    :param paths: List of string paths of directories and files.
+    :param extension: Extension of XML config files.
+    :return: Sorted list of string paths of XML config files.
+    """
+    skipped_dirs = {LayoutPrecompiler.PRECOMPILED_DIR_NAME, LayoutCodeGenerator.GENERATED_DIR_NAME}
+    config_filepaths = set()
+
+    for path in paths:
+        if os.path.isfile(path):
+            config_filepaths.add(path)
+            continue
+        for dir_path, dir_names, file_names in os.walk(path):
+            dir_names[:] = [dir_name for dir_name in dir_names if dir_name not in skipped_dirs]
+            config_filepaths.update(os.path.join(dir_path, file_name) for file_name in file_names
+                                    if file_name.lower().endswith(extension))
+
+    return sorted(config_filepaths)
+
+
+def initWorker(import_paths: list):
+    """
+    Initializer of worker processes - makes the modules referenced by XML config files importable.
+
+    :param import_paths: List of string paths to be put at the beginning of 'sys.path'.
+    :return: None
+    """
+    for import_path in reversed(import_paths):
+        sys.path.insert(0, os.path.abspath(import_path))
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description='Precompiles layouts of PyQT5_GUI_Builder XML config files.')
+    parser.add_argument('paths', nargs='+', help='Directories (searched recursively) or XML config files.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                        help='Number of worker processes (default: number of CPUs).')
+    parser.add_argument('--path', action='append', default=list(),
+                        help='Directory added to the import path of workers - can be given many times.')
+    parser.add_argument('--extension', default='.xml', help='Extension of XML config files (default: .xml).')
+    parser.add_argument('--no-resolve', action='store_true',
+                        help='Do not import modules - check only the ids of modules and classes.')
+    parser.add_argument('--binary', action='store_true',
+                        help='Write also binary config file (read by BinaryConfigReader) next to every XML file.')
+    parser.add_argument('--strict', action='store_true', help='Treat warnings as failures.')
+    args = parser.parse_args(argv)
+
+    config_filepaths = returnConfigFilepaths(args.paths, args.extension)
+    if not config_filepaths:
+        print('No XML config files found')
+        return 1
+
+    start_ns = time.perf_counter_ns()
+    failed_count = 0
+    layouts_count = 0
+
+    precompile_function = partial(LayoutPrecompiler.precompileConfig, resolve_objects=not args.no_resolve,
+                                  write_binary=args.binary)
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs), initializer=initWorker,
+                             initargs=(args.path,)) as executor:
+        for result in executor.map(precompile_function, config_filepaths):
+            failed = bool(result['errors']) or (args.strict and bool(result['warnings']))
+            failed_count += failed
+            layouts_count += len(result['artifacts'])
+
+            print('{:<5} {:>10.1f} ms  {} ({} layouts)'.format('FAIL' if failed else 'OK', result['elapsed_ms'],
+                                                               result['config_filepath'], len(result['artifacts'])))
+            for error in result['errors']:
+                print('    error: ' + error)
+            for warning in result['warnings']:
+                print('    warning: ' + warning)
+
+    print('{} files, {} layouts precompiled, {} files failed in {:.1f} ms'.format(
+        len(config_filepaths), layouts_count, failed_count, (time.perf_counter_ns() - start_ns) / 1e6))
+
+    return 1 if failed_count else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
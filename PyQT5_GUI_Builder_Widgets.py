@@ -0,0 +1,938 @@
+"""
+Qt classes of PyQT5_GUI_Builder - widgets and objects derived from PyQt5 classes. They are kept in this module, so
+importing PyQT5_GUI_Builder does not import PyQt5 - this module is imported on the first use of any of its classes.
+All classes are available also as attributes of PyQT5_GUI_Builder module.
+"""
+from PyQt5 import QtWidgets as QtWidgets
+from PyQt5 import QtCore as QtCore
+from PyQt5 import sip
+import xml.etree.ElementTree as ET
+import os
+
+from PyQT5_GUI_Builder import (PyQT5_GUI_Builder, WidgetPool, XmlNodeNames, XmlAttrsNames,
+                               XmlCommonAttrValues)
+
+
+class DeferredLayoutWidget(QtWidgets.QWidget):
+    """
+    Placeholder widget for nested layout that is built lazily. The layout is built (and set as the layout of this
+    widget) when the widget becomes visible to the user for the first time or when 'materialize' method is called.
+    The widget must be visible and at least part of it must not be clipped by its parents - so placeholders on hidden
+    pages of QStackedLayout or QTabWidget and the ones scrolled out of QScrollArea's viewport are not built. The check
+    is made on the next pass of the event loop after the widget is shown or painted - so showing the window is not
+    slowed down by the build. The widget's object name is the name of the deferred layout - so it can be found with
+    'findChild' method.
+    """
+
+    materialized = QtCore.pyqtSignal(object)
+
+    def __init__(self, build_function, layout_name: str = None, parent: QtWidgets.QWidget = None):
+        """
+        :param build_function: Callable without arguments that returns built QLayout object.
+        :param layout_name: Name of the deferred layout - used as object name of the widget.
+        :param parent: Parent QWidget object.
+        """
+        super().__init__(parent)
+        if layout_name:
+            self.setObjectName(layout_name)
+        self._build_function = build_function
+        self._check_scheduled = False
+        self.built_layout = None
+
+    @property
+    def is_materialized(self) -> bool:
+        """
+        :return: True if the deferred layout is already built.
+        """
+        return self.built_layout is not None
+
+    def materialize(self) -> QtWidgets.QLayout:
+        """
+        Builds the deferred layout - if it is not built yet - and sets it as the layout of this widget.
+
+        :return: Built QLayout object.
+        """
+        if self.built_layout is None:
+            built_layout = self._build_function()
+            self.setLayout(built_layout)
+            self.built_layout = built_layout
+            self._build_function = None
+            self.materialized.emit(built_layout)
+
+        return self.built_layout
+
+    def isVisibleToUser(self) -> bool:
+        """
+        Checks if the widget can be seen - it is visible and it is not clipped by its parents. Placeholder often has
+        no size until its layout is built - then its position is checked against the rectangles of its parents.
+
+        :return: True if the widget is visible to the user.
+        """
+        if not self.isVisible():
+            return False
+        if not self.size().isEmpty():
+            return not self.visibleRegion().isEmpty()
+
+        position = QtCore.QPoint(0, 0)
+        widget = self
+        while not widget.isWindow() and widget.parentWidget() is not None:
+            position = widget.mapToParent(position)
+            widget = widget.parentWidget()
+            # Widget without size placed at the right or bottom edge of its parent is still visible.
+            if not widget.rect().adjusted(0, 0, 1, 1).contains(position):
+                return False
+
+        return True
+
+    def scheduleMaterialize(self):
+        """
+        Schedules the check of widget's visibility on the next pass of the event loop - the layout is built then if
+        the widget is still visible to the user.
+
+        :return: None
+        """
+        if self.built_layout is None and not self._check_scheduled:
+            self._check_scheduled = True
+            QtCore.QTimer.singleShot(0, self.materializeIfVisible)
+
+    def materializeIfVisible(self):
+        """
+        Builds the deferred layout if the widget is visible to the user.
+
+        :return: None
+        """
+        self._check_scheduled = False
+        if self.built_layout is None and self.isVisibleToUser():
+            self.materialize()
+
+    def sizeHint(self) -> QtCore.QSize:
+        # Placeholder takes at least one pixel - so it is painted when it is scrolled into view.
+        if self.built_layout is None:
+            return QtCore.QSize(1, 1)
+
+        return super().sizeHint()
+
+    def showEvent(self, event):
+        self.scheduleMaterialize()
+        super().showEvent(event)
+
+    def paintEvent(self, event):
+        # Painted placeholder is visible to the user - e.g. it was scrolled into QScrollArea's viewport.
+        self.scheduleMaterialize()
+        super().paintEvent(event)
+
+
+class VirtualGridModel(QtCore.QAbstractTableModel):
+    """
+    Table model of virtual grid layout - it provides only the size of the grid. The content of the cells is shown by
+    widgets set with 'QTableView.setIndexWidget' method.
+    """
+
+    def __init__(self, rows_count: int, columns_count: int, parent: QtCore.QObject = None):
+        """
+        :param rows_count: Number of rows of the grid.
+        :param columns_count: Number of columns of the grid.
+        :param parent: Parent QObject object.
+        """
+        super().__init__(parent)
+        self.rows_count = rows_count
+        self.columns_count = columns_count
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.rows_count
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.columns_count
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        return None
+
+
+class VirtualGridView(QtWidgets.QTableView):
+    """
+    View of virtual grid layout - it shows the cells of grid layout with many rows and columns. The widget of the cell
+    is built (with all its features) when the cell becomes visible for the first time, so the cells that are never
+    scrolled to cost no widgets. Built widgets are kept - so their state is not lost when they are scrolled away.
+    The view's object name is the name of the virtual layout - so it can be found with 'findChild' method.
+    """
+
+    cell_materialized = QtCore.pyqtSignal(int, int, object)
+
+    def __init__(self, cells: dict, layout_name: str = None, parent: QtWidgets.QWidget = None):
+        """
+        :param cells: Dictionary of ( row, column ) tuples and callables without arguments that return the widgets of
+            the cells.
+        :param layout_name: Name of the virtual layout - used as object name of the view.
+        :param parent: Parent QWidget object.
+        """
+        super().__init__(parent)
+        if layout_name:
+            self.setObjectName(layout_name)
+
+        rows_count = max((row for row, _ in cells), default=-1) + 1
+        columns_count = max((column for _, column in cells), default=-1) + 1
+        self.setModel(VirtualGridModel(rows_count, columns_count, self))
+
+        self.horizontalHeader().hide()
+        self.verticalHeader().hide()
+        self.setShowGrid(False)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+
+        # Cells whose widgets are not built yet.
+        self._pending_cells = dict(cells)
+        self.verticalScrollBar().valueChanged.connect(self.materializeVisibleCells)
+        self.horizontalScrollBar().valueChanged.connect(self.materializeVisibleCells)
+
+    @property
+    def pending_cells_count(self) -> int:
+        """
+        :return: Number of cells whose widgets are not built yet.
+        """
+        return len(self._pending_cells)
+
+    def materializeCell(self, row: int, column: int) -> QtWidgets.QWidget:
+        """
+        Builds the widget of given cell - if it is not built yet.
+
+        :param row: Row of the cell.
+        :param column: Column of the cell.
+        :return: QWidget object of the cell - None if there is no such cell.
+        """
+        index = self.model().index(row, column)
+        build_function = self._pending_cells.pop((row, column), None)
+        if build_function is None:
+            return self.indexWidget(index)
+
+        cell_widget = build_function()
+        self.setIndexWidget(index, cell_widget)
+        self.cell_materialized.emit(row, column, cell_widget)
+
+        return cell_widget
+
+    def materializeVisibleCells(self, *args):
+        """
+        Builds the widgets of all visible cells that are not built yet.
+
+        :return: None
+        """
+        if not self._pending_cells:
+            return
+
+        viewport_rect = self.viewport().rect()
+        first_row = max(self.rowAt(viewport_rect.top()), 0)
+        last_row = self.rowAt(viewport_rect.bottom())
+        last_row = self.model().rowCount() - 1 if last_row < 0 else last_row
+        first_column = max(self.columnAt(viewport_rect.left()), 0)
+        last_column = self.columnAt(viewport_rect.right())
+        last_column = self.model().columnCount() - 1 if last_column < 0 else last_column
+
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                if (row, column) in self._pending_cells:
+                    self.materializeCell(row, column)
+
+    @staticmethod
+    def returnLayoutWidget(gui_layout: QtWidgets.QLayout) -> QtWidgets.QWidget:
+        """
+        Returns QWidget object with given layout - used for nested layouts placed in the cells.
+
+        :param gui_layout: QLayout object.
+        :return: QWidget object.
+        """
+        layout_widget = QtWidgets.QWidget()
+        gui_layout.setContentsMargins(0, 0, 0, 0)
+        layout_widget.setLayout(gui_layout)
+
+        return layout_widget
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.materializeVisibleCells()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.materializeVisibleCells()
+
+
+class LiveComponent:
+    """
+    Component of the layout managed by LiveLayoutReloader - XML node it was built from and the built object. For
+    layouts it also stores the entries of their components.
+    """
+
+    def __init__(self, key: tuple, xml_node: ET.Element, component_object, placement: tuple):
+        """
+        :param key: Tuple that identifies the component among the components of its layout.
+        :param xml_node: xml.etree.ElementTree.Element object the component was built from.
+        :param component_object: Built QWidget or QLayout object.
+        :param placement: Placement args of the component in its layout.
+        """
+        self.key = key
+        self.xml_node = xml_node
+        self.node_xml = ET.tostring(xml_node)
+        self.component_object = component_object
+        self.placement = placement
+        # For components - serialized 'feature' nodes and signal connections made by them ( bound signal, slot ).
+        self.features = list()
+        # For layouts - the entry of 'self' component and the entries of the remaining components. Virtual layouts
+        # are not split into components (None).
+        self.self_entry = None
+        self.children = None
+
+    @property
+    def is_layout(self) -> bool:
+        """
+        :return: True if the entry represents 'layout' XML node.
+        """
+        return self.xml_node.tag == XmlNodeNames.LAYOUT_NODE.value
+
+
+class LiveLayoutReloader(QtCore.QObject):
+    """
+    Class to keep built layout in sync with its XML config file. After the file (or any file it includes) changes (see
+    'start' method) or after 'reload' method is called, the file is parsed again and the layout node is compared with
+    the one the live layout was built from. Components are matched by the value of 'objectName' constructor's argument
+    - or by their position among the components of the same class. Only changed components are patched:
+    - unchanged components (with their state) stay in place,
+    - components whose constructor's arguments changed are built again,
+    - components whose features were only added (or whose removed features were signal connections) get only the new
+      features applied,
+    - new components are built and removed ones are deleted.
+    If the main layout itself must be built again (e.g. its class changed or the lists of modules and classes changed),
+    the new layout replaces the old one in its parent and 'layout_replaced' signal is emitted.
+    """
+
+    reloaded = QtCore.pyqtSignal(object)
+    reload_failed = QtCore.pyqtSignal(object)
+    layout_replaced = QtCore.pyqtSignal(object)
+
+    # Delay between the file change and reloading (ms) - editors often write the file in a few steps.
+    RELOAD_DELAY_MS = 100
+
+    def __init__(self, config_filepath: str, layout_name: str, base_object, parent: QtCore.QObject = None):
+        """
+        :param config_filepath: String path to XML config file.
+        :param layout_name: Name of the desired layout described in the XML file.
+        :param base_object: Reference to the python object, that calls the build.
+        :param parent: Parent QObject object.
+        """
+        super().__init__(parent)
+        self.config_filepath = config_filepath
+        self.layout_name = layout_name
+        self.base_object = base_object
+
+        self._watcher = None
+        self._reload_timer = None
+        self._stats = None
+
+        parsed_config = PyQT5_GUI_Builder.returnParsedConfig(config_filepath)
+        # XML config file and all files it includes.
+        self.watched_filepaths = [config_filepath] + sorted(parsed_config.dependencies)
+        self.modules_data = parsed_config.modules_data
+        self.classes_data = parsed_config.classes_data
+        with PyQT5_GUI_Builder.symbol_resolver.buildScope():
+            self.root_entry = self.buildEntry((), parsed_config.returnLayoutNode(layout_name))
+
+    @property
+    def gui_layout(self) -> QtWidgets.QLayout:
+        """
+        :return: Live QLayout object.
+        """
+        return self.root_entry.component_object
+
+    def start(self):
+        """
+        Starts watching XML config file and files it includes - the layout is reloaded after every change of them.
+
+        :return: None
+        """
+        if self._watcher is None:
+            self._watcher = QtCore.QFileSystemWatcher(self)
+            self._watcher.fileChanged.connect(self.scheduleReload)
+            self._reload_timer = QtCore.QTimer(self)
+            self._reload_timer.setSingleShot(True)
+            self._reload_timer.timeout.connect(self.runScheduledReload)
+        self.watchFiles()
+
+    def watchFiles(self):
+        """
+        Adds the files to be watched to the watcher - also the ones that were removed from it (editors that replace the
+        file remove it from the watcher). Files that are not included anymore are not watched.
+
+        :return: None
+        """
+        watched_files = self._watcher.files()
+        unused_files = [watched_file for watched_file in watched_files if watched_file not in self.watched_filepaths]
+        if unused_files:
+            self._watcher.removePaths(unused_files)
+
+        for watched_filepath in self.watched_filepaths:
+            if watched_filepath not in watched_files and os.path.exists(watched_filepath):
+                self._watcher.addPath(watched_filepath)
+
+    def stop(self):
+        """
+        Stops watching XML config file and files it includes.
+
+        :return: None
+        """
+        if self._watcher is not None:
+            self._watcher.removePaths(self._watcher.files())
+            self._reload_timer.stop()
+
+    def scheduleReload(self, *args):
+        self._reload_timer.start(self.RELOAD_DELAY_MS)
+
+    def runScheduledReload(self):
+        try:
+            self.reload()
+        except Exception as reload_error:
+            self.reload_failed.emit(reload_error)
+        finally:
+            self.watchFiles()
+
+    def reload(self) -> dict:
+        """
+        Parses XML config file again and patches the live layout.
+
+        :return: Dictionary with the numbers of kept, created, removed, re-featured and re-inserted components and
+            with information whether the main layout was replaced.
+        """
+        parsed_config = PyQT5_GUI_Builder.returnParsedConfig(self.config_filepath)
+        self.watched_filepaths = [self.config_filepath] + sorted(parsed_config.dependencies)
+        layout_node = parsed_config.returnLayoutNode(self.layout_name)
+
+        self._stats = {'kept': 0, 'created': 0, 'removed': 0, 'refeatured': 0, 'reinserted': 0, 'replaced': False}
+        with PyQT5_GUI_Builder.symbol_resolver.buildScope():
+            # Ids of modules and classes are used in the nodes - if they mean something else now, nothing can be
+            # kept.
+            if (parsed_config.modules_data != self.modules_data or
+                    parsed_config.classes_data != self.classes_data):
+                self.modules_data = parsed_config.modules_data
+                self.classes_data = parsed_config.classes_data
+                new_entry = self.buildEntry((), layout_node)
+            else:
+                new_entry = self.patchLayout(self.root_entry, layout_node)
+
+            if new_entry is not self.root_entry:
+                self.replaceRootLayout(new_entry)
+
+        self.reloaded.emit(self._stats)
+
+        return self._stats
+
+    @staticmethod
+    def returnEntryKey(xml_node: ET.Element, occurrences: dict) -> tuple:
+        """
+        Returns the key that identifies the component among the components of its layout - the value of
+        'objectName' constructor's argument or the position among the nodes of the same kind.
+
+        :param xml_node: xml.etree.ElementTree.Element object that represents 'component' or 'layout' XML node.
+        :param occurrences: Dictionary with the numbers of nodes of given kind met so far - updated by this method.
+        :return: Tuple key.
+        """
+        if xml_node.tag == XmlNodeNames.COMPONENT_NODE.value:
+            constructor_args = xml_node.find(XmlNodeNames.CONSTRUCTOR_ARGS.value)
+            if constructor_args is not None:
+                for arg_node in constructor_args:
+                    if arg_node.attrib.get(XmlAttrsNames.ARG_NAME_ATTR.value) == 'objectName':
+                        return 'objectName', arg_node.attrib.get(XmlAttrsNames.ARG_VALUE_ATTR.value)
+            kind = (xml_node.tag, xml_node.attrib.get(XmlAttrsNames.COMPONENT_MODULE_ID.value),
+                    xml_node.attrib.get(XmlAttrsNames.COMPONENT_CLASS_ID.value))
+        else:
+            kind = (xml_node.tag, xml_node.attrib.get(XmlAttrsNames.LAYOUT_NAME.value))
+
+        occurrences[kind] = occurrences.get(kind, 0) + 1
+
+        return kind + (occurrences[kind],)
+
+    @staticmethod
+    def returnConstructionXml(component_node: ET.Element) -> bytes:
+        """
+        Returns serialized 'component' node without its features and placement - components with the same result can
+        be patched instead of being built again.
+
+        :param component_node: xml.etree.ElementTree.Element object that represents 'component' XML node.
+        :return: Serialized XML node.
+        """
+        attributes = {attr_name: attr_value for attr_name, attr_value in component_node.attrib.items()
+                      if attr_name not in (XmlAttrsNames.COMPONENT_ROW.value, XmlAttrsNames.COMPONENT_COLUMN.value)}
+        construction_node = ET.Element(component_node.tag, attributes)
+        construction_node.extend([child_node for child_node in component_node
+                                  if child_node.tag != XmlNodeNames.FEATURES_LIST.value])
+
+        return ET.tostring(construction_node)
+
+    def buildEntry(self, key: tuple, xml_node: ET.Element) -> LiveComponent:
+        """
+        Builds component or layout described by given XML node and returns its entry.
+
+        :param key: Key of the component.
+        :param xml_node: xml.etree.ElementTree.Element object that represents 'component' or 'layout' XML node.
+        :return: LiveComponent object.
+        """
+        placement = tuple(PyQT5_GUI_Builder.returnComponentPlacementArgs(xml_node))
+        if self._stats is not None:
+            self._stats['created'] += 1
+
+        if xml_node.tag == XmlNodeNames.COMPONENT_NODE.value:
+            component_object = PyQT5_GUI_Builder.constructComponentObject(xml_node, self.modules_data,
+                                                                          self.classes_data, self.base_object)
+            entry = LiveComponent(key, xml_node, component_object, placement)
+            component_features = xml_node.find(XmlNodeNames.FEATURES_LIST.value)
+            if component_features is not None:
+                for feature_node in component_features:
+                    self.applyFeature(entry, feature_node)
+            return entry
+
+        # Virtual grid layouts are not split into components - they are built again as a whole after any change.
+        if PyQT5_GUI_Builder.isVirtualLayout(xml_node):
+            return LiveComponent(key, xml_node, PyQT5_GUI_Builder.buildGuiLayout(xml_node, self.modules_data,
+                                                                                  self.classes_data,
+                                                                                  self.base_object),
+                                 placement)
+
+        entry = LiveComponent(key, xml_node, None, placement)
+        entry.children = list()
+        occurrences = dict()
+        for component_node in PyQT5_GUI_Builder.iterLayoutComponents(
+                xml_node.find(XmlNodeNames.COMPONENTS_LIST.value), self.modules_data, self.base_object):
+            if (component_node.tag == XmlNodeNames.COMPONENT_NODE.value and
+                    component_node.attrib[XmlAttrsNames.COMPONENT_TYPE.value] ==
+                    XmlCommonAttrValues.COMPONENT_TYPE_SELF.value):
+                entry.self_entry = self.buildEntry(('self',), component_node)
+                entry.component_object = entry.self_entry.component_object
+            elif component_node.tag in (XmlNodeNames.COMPONENT_NODE.value, XmlNodeNames.LAYOUT_NODE.value):
+                child_entry = self.buildEntry(self.returnEntryKey(component_node, occurrences), component_node)
+                entry.children.append(child_entry)
+                self.insertEntry(entry.component_object, child_entry)
+
+        return entry
+
+    def applyFeature(self, entry: LiveComponent, feature_node: ET.Element):
+        """
+        Implements the feature for the component - and records it (with its signal connection, if it makes one).
+
+        :param entry: LiveComponent object of the component.
+        :param feature_node: xml.etree.ElementTree.Element object that represents 'feature' XML node.
+        :return: None
+        """
+        args, kwargs = PyQT5_GUI_Builder.returnFunctionArguments(feature_node, XmlNodeNames.FEATURE_PARAMS.value,
+                                                                 self.modules_data, entry.component_object,
+                                                                 self.base_object)
+        setting_attr = PyQT5_GUI_Builder.returnSettingAttribute(feature_node, self.modules_data,
+                                                                entry.component_object, self.base_object)
+
+        connection = None
+        bound_signal = getattr(setting_attr, '__self__', None)
+        if (args and getattr(setting_attr, '__name__', None) == 'connect' and
+                isinstance(bound_signal, QtCore.pyqtBoundSignal)):
+            connection = (bound_signal, args[0])
+
+        setting_attr(*args, **kwargs)
+        entry.features.append((ET.tostring(feature_node), connection))
+
+    @staticmethod
+    def insertEntry(gui_layout: QtWidgets.QLayout, entry: LiveComponent):
+        """
+        Adds the object of the entry to the layout.
+
+        :param gui_layout: QLayout object.
+        :param entry: LiveComponent object.
+        :return: None
+        """
+        if entry.is_layout:
+            gui_layout.addLayout(entry.component_object, *entry.placement)
+        elif (entry.xml_node.attrib[XmlAttrsNames.COMPONENT_TYPE.value] ==
+              XmlCommonAttrValues.COMPONENT_TYPE_WIDGET.value):
+            gui_layout.addWidget(entry.component_object, *entry.placement)
+
+    def removeEntry(self, entry: LiveComponent):
+        """
+        Deletes the object of the entry.
+
+        :param entry: LiveComponent object.
+        :return: None
+        """
+        self._stats['removed'] += 1
+        component_object = entry.component_object
+        if isinstance(component_object, QtWidgets.QLayout):
+            WidgetPool(0).releaseLayout(component_object)
+            component_object.setParent(None)
+            component_object.deleteLater()
+        elif isinstance(component_object, QtWidgets.QWidget):
+            component_object.setParent(None)
+            component_object.deleteLater()
+
+    def patchLayout(self, entry: LiveComponent, layout_node: ET.Element) -> LiveComponent:
+        """
+        Patches live layout so it matches given 'layout' node.
+
+        :param entry: LiveComponent object of the live layout.
+        :param layout_node: xml.etree.ElementTree.Element object that represents new 'layout' XML node.
+        :return: The same LiveComponent object - or new one, if the layout had to be built again.
+        """
+        if ET.tostring(layout_node) == entry.node_xml:
+            self._stats['kept'] += 1
+            return entry
+
+        new_nodes = list()
+        new_self_node = None
+        for component_node in PyQT5_GUI_Builder.iterLayoutComponents(
+                layout_node.find(XmlNodeNames.COMPONENTS_LIST.value), self.modules_data, self.base_object):
+            if (component_node.tag == XmlNodeNames.COMPONENT_NODE.value and
+                    component_node.attrib[XmlAttrsNames.COMPONENT_TYPE.value] ==
+                    XmlCommonAttrValues.COMPONENT_TYPE_SELF.value):
+                new_self_node = component_node
+            elif component_node.tag in (XmlNodeNames.COMPONENT_NODE.value, XmlNodeNames.LAYOUT_NODE.value):
+                new_nodes.append(component_node)
+
+        # Layout object itself cannot be patched - the whole layout is built again.
+        if (entry.children is None or PyQT5_GUI_Builder.isVirtualLayout(layout_node) or new_self_node is None or
+                ET.tostring(new_self_node) != entry.self_entry.node_xml):
+            return self.buildEntry(entry.key, layout_node)
+
+        # Objects and placements of the children before patching - patched entries get new placement in place.
+        old_items = [(child.component_object, child.placement) for child in entry.children]
+        old_entries = dict()
+        for child_entry in entry.children:
+            old_entries.setdefault(child_entry.key, list()).append(child_entry)
+
+        new_children = list()
+        # Entries whose objects are not used any more - removed components and the ones built again.
+        removed_entries = list()
+        occurrences = dict()
+        for component_node in new_nodes:
+            key = self.returnEntryKey(component_node, occurrences)
+            matching_entries = old_entries.get(key)
+            if matching_entries:
+                old_entry = matching_entries.pop(0)
+                new_entry = self.patchEntry(old_entry, component_node)
+                if new_entry is not old_entry:
+                    removed_entries.append(old_entry)
+                new_children.append(new_entry)
+            else:
+                new_children.append(self.buildEntry(key, component_node))
+
+        removed_entries += [child_entry for matching_entries in old_entries.values()
+                            for child_entry in matching_entries]
+
+        # Components are inserted again only if their objects, order or placement changed.
+        if (removed_entries or
+                [(child.component_object, child.placement) for child in new_children] != old_items):
+            gui_layout = entry.component_object
+            while gui_layout.count():
+                gui_layout.takeAt(0)
+            for child_entry in removed_entries:
+                self.removeEntry(child_entry)
+            for child_entry in new_children:
+                self.insertEntry(gui_layout, child_entry)
+            self._stats['reinserted'] += 1
+
+        entry.children = new_children
+        entry.xml_node = layout_node
+        entry.node_xml = ET.tostring(layout_node)
+
+        return entry
+
+    def patchEntry(self, entry: LiveComponent, xml_node: ET.Element) -> LiveComponent:
+        """
+        Patches single component (or nested layout) so it matches given XML node.
+
+        :param entry: LiveComponent object of the live component.
+        :param xml_node: xml.etree.ElementTree.Element object that represents new 'component' or 'layout' XML node.
+        :return: The same LiveComponent object - or new one, if the component had to be built again.
+        """
+        if xml_node.tag == XmlNodeNames.LAYOUT_NODE.value:
+            new_entry = self.patchLayout(entry, xml_node)
+            new_entry.placement = tuple(PyQT5_GUI_Builder.returnComponentPlacementArgs(xml_node))
+            return new_entry
+
+        node_xml = ET.tostring(xml_node)
+        if node_xml == entry.node_xml:
+            self._stats['kept'] += 1
+            return entry
+
+        if self.returnConstructionXml(xml_node) != self.returnConstructionXml(entry.xml_node):
+            return self.buildEntry(entry.key, xml_node)
+
+        component_features = xml_node.find(XmlNodeNames.FEATURES_LIST.value)
+        new_features = list(component_features) if component_features is not None else list()
+
+        # Features that are already implemented stay - the remaining old ones must be undone, the remaining new ones
+        # are implemented.
+        kept_features = list()
+        unmatched_features = list(entry.features)
+        added_features = list()
+        for feature_node in new_features:
+            feature_xml = ET.tostring(feature_node)
+            matching_feature = next((feature for feature in unmatched_features if feature[0] == feature_xml), None)
+            if matching_feature is None:
+                added_features.append(feature_node)
+            else:
+                unmatched_features.remove(matching_feature)
+                kept_features.append(matching_feature)
+
+        # Only signal connections can be undone - other removed features require building the component again.
+        if any(connection is None for _, connection in unmatched_features):
+            return self.buildEntry(entry.key, xml_node)
+
+        for _, (bound_signal, slot) in unmatched_features:
+            try:
+                bound_signal.disconnect(slot)
+            except TypeError:
+                pass
+
+        entry.features = kept_features
+        for feature_node in added_features:
+            self.applyFeature(entry, feature_node)
+
+        entry.xml_node = xml_node
+        entry.node_xml = node_xml
+        entry.placement = tuple(PyQT5_GUI_Builder.returnComponentPlacementArgs(xml_node))
+        # Component whose only placement changed is kept as it is - it is only inserted again by its parent layout.
+        if added_features or unmatched_features:
+            self._stats['refeatured'] += 1
+        else:
+            self._stats['kept'] += 1
+
+        return entry
+
+    def replaceRootLayout(self, new_entry: LiveComponent):
+        """
+        Puts new main layout in place of the old one - in its parent layout or widget - and deletes the old one.
+
+        :param new_entry: LiveComponent object of the new main layout.
+        :return: None
+        """
+        old_layout = self.root_entry.component_object
+        new_layout = new_entry.component_object
+        parent_object = old_layout.parent()
+
+        if isinstance(parent_object, QtWidgets.QLayout):
+            for item_index in range(parent_object.count()):
+                if parent_object.itemAt(item_index).layout() is old_layout:
+                    if isinstance(parent_object, QtWidgets.QGridLayout):
+                        row, column, row_span, column_span = parent_object.getItemPosition(item_index)
+                        parent_object.takeAt(item_index)
+                        parent_object.addLayout(new_layout, row, column, row_span, column_span)
+                    else:
+                        parent_object.takeAt(item_index)
+                        parent_object.insertLayout(item_index, new_layout)
+                    break
+            WidgetPool(0).releaseLayout(old_layout)
+            old_layout.setParent(None)
+            old_layout.deleteLater()
+        elif isinstance(parent_object, QtWidgets.QWidget):
+            WidgetPool(0).releaseLayout(old_layout)
+            sip.delete(old_layout)
+            parent_object.setLayout(new_layout)
+        else:
+            WidgetPool(0).releaseLayout(old_layout)
+
+        self.root_entry = new_entry
+        self._stats['replaced'] = True
+        self.layout_replaced.emit(new_layout)
+
+
+class BuildTransaction(QtCore.QObject):
+    """
+    Context manager of transactional build - see 'PyQT5_GUI_Builder.buildTransaction' method. While the transaction is
+    open, signals of all objects created by the builder are blocked (so features like 'setText' do not emit anything),
+    updates of the target widget are disabled and layout requests and paint events sent to it are dropped. When the
+    transaction is committed, everything is re-enabled in one go - the signals are unblocked, the layout of the target
+    is activated once and the target is repainted once. It matters most when the event loop runs during the build
+    (e.g. many layouts are added one by one to visible widget) - requests posted within one pass of the event loop
+    are merged by Qt anyway.
+    """
+
+    # Events dropped while the transaction is open.
+    LAYOUT_EVENTS = (QtCore.QEvent.LayoutRequest,)
+    PAINT_EVENTS = (QtCore.QEvent.UpdateRequest, QtCore.QEvent.Paint)
+
+    def __init__(self, target_widget: QtWidgets.QWidget = None, parent: QtCore.QObject = None):
+        """
+        :param target_widget: QWidget object that receives built layout (e.g. with 'setLayout' method) inside the
+            transaction. If not used, pass 'None' - only the signals are blocked then.
+        :param parent: Parent QObject object.
+        """
+        super().__init__(parent)
+        self.target_widget = target_widget
+        self._blocked_objects = list()
+        self._previous_transaction = None
+        self._target_updates_enabled = True
+        self._stats = {'objects_blocked': 0, 'layout_requests_avoided': 0, 'visible_layout_requests_avoided': 0,
+                       'paints_avoided': 0, 'relayouts': 0}
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns the numbers of objects whose signals were blocked, layout requests and paint events that were dropped
+        and relayouts done when the transaction was committed. 'visible_layout_requests_avoided' counts the dropped
+        layout requests of visible target - each of them would also repaint it, but such repaints are discarded by Qt
+        (while updates are disabled) before they become events, so they are not part of 'paints_avoided'.
+
+        :return: Dictionary with the statistics.
+        """
+        return dict(self._stats)
+
+    def __enter__(self) -> 'BuildTransaction':
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.commit()
+        return False
+
+    def begin(self):
+        """
+        Opens the transaction in the current thread - objects created by the builder are passed to 'watchObject'
+        method from now on.
+
+        :return: None
+        """
+        self._previous_transaction = PyQT5_GUI_Builder.returnBuildTransaction()
+        PyQT5_GUI_Builder._build_transaction.value = self
+
+        if self.target_widget is not None:
+            self._target_updates_enabled = self.target_widget.updatesEnabled()
+            self.target_widget.setUpdatesEnabled(False)
+            self.target_widget.installEventFilter(self)
+
+    def watchObject(self, component_object):
+        """
+        Blocks the signals of object created inside the transaction - until the transaction is committed. Objects
+        whose signals are already blocked are left untouched.
+
+        :param component_object: Created GUI component object.
+        :return: None
+        """
+        if isinstance(component_object, QtCore.QObject) and not component_object.signalsBlocked():
+            component_object.blockSignals(True)
+            self._blocked_objects.append(component_object)
+            self._stats['objects_blocked'] += 1
+
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        event_type = event.type()
+        if event_type in self.LAYOUT_EVENTS:
+            self._stats['layout_requests_avoided'] += 1
+            if watched.isWidgetType() and watched.isVisible():
+                self._stats['visible_layout_requests_avoided'] += 1
+            return True
+        if event_type in self.PAINT_EVENTS:
+            self._stats['paints_avoided'] += 1
+            return True
+
+        return False
+
+    def commit(self) -> dict:
+        """
+        Closes the transaction - unblocks the signals, enables updates of the target widget, activates its layout
+        and repaints it.
+
+        :return: Dictionary with the statistics of the transaction.
+        """
+        PyQT5_GUI_Builder._build_transaction.value = self._previous_transaction
+        self._previous_transaction = None
+
+        for component_object in self._blocked_objects:
+            if not sip.isdeleted(component_object):
+                component_object.blockSignals(False)
+        self._blocked_objects.clear()
+
+        if self.target_widget is not None and not sip.isdeleted(self.target_widget):
+            # Layout requests posted during the build are dropped by the filter - the layout is activated once below.
+            QtCore.QCoreApplication.sendPostedEvents(self.target_widget, QtCore.QEvent.LayoutRequest)
+            self.target_widget.removeEventFilter(self)
+            self.target_widget.setUpdatesEnabled(self._target_updates_enabled)
+
+            target_layout = self.target_widget.layout()
+            if target_layout is not None:
+                target_layout.activate()
+                self._stats['relayouts'] += 1
+            self.target_widget.update()
+
+        return self.stats
+
+
+class GuiThreadInvoker(QtCore.QObject):
+    """
+    Helper QObject that calls given functions in the thread it lives in (the Qt main thread) - calls requested from
+    other threads are queued and run by the Qt event loop.
+    """
+
+    invoke_requested = QtCore.pyqtSignal(object, tuple)
+
+    def __init__(self):
+        super().__init__()
+        self.invoke_requested.connect(self.runFunction)
+
+    def invoke(self, function, *args):
+        """
+        Requests the call of given function in the thread of this object.
+
+        :param function: Callable to be called.
+        :param args: Arguments for the callable.
+        :return: None
+        """
+        self.invoke_requested.emit(function, args)
+
+    @staticmethod
+    def runFunction(function, args: tuple):
+        """
+        Calls given function - slot connected to 'invoke_requested' signal.
+
+        :param function: Callable to be called.
+        :param args: Arguments for the callable.
+        :return: None
+        """
+        function(*args)
+
+
+class MainWindow(QtWidgets.QMainWindow):
+    """
+    Sample class for presentation purposes. Contains attribute 'gui_layout' built by 'PyQT5_GUI_Builder.returnGuiLayout'
+    function - based on given XML config file. This attribute (of QLayout type) is a main layout of the app window.
+    """
+
+    # Items of 'repeat' node in 4th and 5th example files - one row of the form is built for every dictionary.
+    form_fields = [{'label': 'First name', 'field': 'first_name'},
+                   {'label': 'Last name', 'field': 'last_name'},
+                   {'label': 'E-mail', 'field': 'email'}]
+
+    def __init__(self):
+        super().__init__()
+        # Build the main layout attribute based on given XML config file.
+        # HERE THE PATH TO RELEVANT XML CONFIG FILE SHOULD BE SPECIFIED
+        # Path to 1st example file  - Resources/Settings/EX1_QLabel_And_QLineEdit.xml
+        #             layout name   - 1_QLabel_1_QLineEdit
+        # Path to 2nd example file  - Resources/Settings/EX2_2_Rows_Of_QLabel_And_QLineEdit.xml
+        #             layout name   - 2_Rows_Of_QLabel_QLineEdit
+        # Path to 3rd example file  - Resources/Settings/EX3_TwoButtonsWithDifferentMethods.xml
+        #             layout name   - Two_buttons_with_different_methods
+        # Path to 4th example file  - Resources/Settings/EX4_Repeated_Rows_Of_QLabel_And_QLineEdit.xml
+        #             layout name   - Repeated_Rows_Of_QLabel_QLineEdit
+        # Path to 5th example file  - Resources/Settings/EX5_Included_Common_Section.xml
+        #             layout name   - Form_From_Shared_Template
+        self.gui_layout = PyQT5_GUI_Builder.returnGuiLayout('Resources/Settings/EX3_TwoButtonsWithDifferentMethods.xml',
+                                                            'Two_buttons_with_different_methods',
+                                                            self)
+
+        self.setWindowTitle('PyQt5 GUI Builder - from XML')
+        self.setFixedSize(600, 400)
+
+        self.central_widget = QtWidgets.QWidget()
+        self.setCentralWidget(self.central_widget)
+        self.lay = QtWidgets.QGridLayout(self.central_widget)
+        self.lay.addLayout(self.gui_layout, 0, 0)
+
+        self.show()
+
+    @staticmethod
+    def print_msg_method():
+        """
+        Test function to be connected to QPushButton generated automatically - based on XML config file.
+            :return: None
+        """
+        print("Text comes from method")
@@ -0,0 +1,131 @@
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+SETTINGS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Resources', 'Settings')
+
+
+class ExampleBaseObject:
+    """
+    Base object of the example layouts - contains the attributes referenced by the example XML files.
+    """
+    form_fields = [{'label': 'Name', 'field': 'name'}, {'label': 'Email', 'field': 'email'}]
+
+    def print_msg_method(self):
+        pass
+
+
+@pytest.fixture(scope='session')
+def qt_app():
+    from PyQt5 import QtWidgets
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def base_object():
+    return ExampleBaseObject()
+
+
+@pytest.fixture
+def example_path():
+    return lambda file_name: os.path.join(SETTINGS_DIR, file_name)
+
+
+def processEventsUntil(qt_app, condition, timeout_s: float = 5.0):
+    """
+    Processes Qt events until given condition is met or the timeout expires.
+
+    :param qt_app: QApplication object.
+    :param condition: Callable without arguments that returns True when waiting should stop.
+    :param timeout_s: Timeout in seconds.
+    :return: Result of the last call of the condition.
+    """
+    import time
+    deadline = time.monotonic() + timeout_s
+    while not condition() and time.monotonic() < deadline:
+        qt_app.processEvents()
+        time.sleep(0.001)
+
+    return condition()
+
+
+def returnLayoutWidgets(gui_layout) -> list:
+    """
+    Returns the widgets of given layout and its nested layouts - as tuples of class name and object name.
+
+    :param gui_layout: QLayout object.
+    :return: List of tuples - ( class name, object name ).
+    """
+    widgets = list()
+    for item_index in range(gui_layout.count()):
+        layout_item = gui_layout.itemAt(item_index)
+        if layout_item.widget() is not None:
+            widgets.append((type(layout_item.widget()).__name__, layout_item.widget().objectName()))
+        elif layout_item.layout() is not None:
+            widgets.extend(returnLayoutWidgets(layout_item.layout()))
+
+    return widgets
+
+
+CONFIG_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<body>
+    <common>
+        <modules>
+            <module name="PyQt5.QtWidgets" id="0"/>
+        </modules>
+        <classes>
+            <class name="QLabel" id="0"/>
+            <class name="QLineEdit" id="1"/>
+            <class name="QPushButton" id="2"/>
+            <class name="QVBoxLayout" id="3"/>
+            <class name="QGridLayout" id="4"/>
+            <class name="QComboBox" id="5"/>
+        </classes>
+        <parent_object_types>
+            <parent desc="current object" id="0"/>
+            <parent desc="module" id="1"/>
+            <parent desc="base object" id="2"/>
+        </parent_object_types>
+    </common>
+    <layouts>
+        {layouts}
+    </layouts>
+</body>
+'''
+
+
+def writeConfig(config_filepath: str, layouts: str) -> str:
+    """
+    Writes XML config file with the common section of the tests and given 'layout' nodes. The modification time of
+    the file is always moved forward - so rewritten file is never taken for unchanged one.
+
+    :param config_filepath: String path of XML file to be written.
+    :param layouts: String with 'layout' XML nodes.
+    :return: String path of written file.
+    """
+    previous_mtime_ns = os.stat(config_filepath).st_mtime_ns if os.path.exists(config_filepath) else 0
+    with open(config_filepath, 'w', encoding='utf-8') as config_file:
+        config_file.write(CONFIG_TEMPLATE.format(layouts=layouts))
+    mtime_ns = max(os.stat(config_filepath).st_mtime_ns, previous_mtime_ns + 1000000)
+    os.utime(config_filepath, ns=(mtime_ns, mtime_ns))
+
+    return str(config_filepath)
+
+
+def returnLabelNode(name: str, text: str, placement: str = '') -> str:
+    """
+    Returns 'component' XML node of QLabel with given object name and text.
+
+    :param name: Object name of the label.
+    :param text: Text of the label.
+    :param placement: String with placement attributes - e.g. 'row="0" column="0"'.
+    :return: String with XML node.
+    """
+    return ('<component type="widget" module_id="0" class_id="0" {placement}><constructor_args>'
+            '<arg value="{text}" type="str" kind="unnamed"/>'
+            '<arg value="{name}" type="str" kind="named" arg_name="objectName"/>'
+            '</constructor_args></component>').format(name=name, text=text, placement=placement)
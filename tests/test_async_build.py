@@ -0,0 +1,40 @@
+import asyncio
+import sys
+
+import pytest
+
+from conftest import processEventsUntil, returnLayoutWidgets
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder, LayoutBuildError
+
+EX1 = ('EX1_QLabel_And_QLineEdit.xml', '1_QLabel_1_QLineEdit')
+
+
+def test_submit_gui_layout(qt_app, base_object, example_path):
+    layout_future = PyQT5_GUI_Builder.submitGuiLayout(example_path(EX1[0]), EX1[1], base_object)
+
+    assert processEventsUntil(qt_app, layout_future.done)
+    assert [class_name for class_name, _ in returnLayoutWidgets(layout_future.result())] == ['QLabel', 'QLineEdit']
+
+
+def test_gui_layout_async(qt_app, base_object, example_path):
+    # 'concurrent.futures' is already loaded by the previous builds - its lazy names must still be reachable.
+    assert 'concurrent.futures' in sys.modules
+
+    gui_layout = asyncio.run(PyQT5_GUI_Builder.returnGuiLayoutAsync(example_path(EX1[0]), EX1[1], base_object))
+
+    assert [class_name for class_name, _ in returnLayoutWidgets(gui_layout)] == ['QLabel', 'QLineEdit']
+
+
+def test_submit_gui_layout_reports_wrong_layout_name(qt_app, base_object, example_path):
+    layout_future = PyQT5_GUI_Builder.submitGuiLayout(example_path(EX1[0]), 'no_such_layout', base_object)
+
+    assert processEventsUntil(qt_app, layout_future.done)
+    assert isinstance(layout_future.exception(), LayoutBuildError)
+    assert isinstance(layout_future.exception().__cause__, ValueError)
+
+
+def test_gui_layout_async_reports_wrong_layout_name(qt_app, base_object, example_path):
+    with pytest.raises(LayoutBuildError) as error_info:
+        asyncio.run(PyQT5_GUI_Builder.returnGuiLayoutAsync(example_path(EX1[0]), 'no_such_layout', base_object))
+
+    assert error_info.value.layout_name == 'no_such_layout'
@@ -0,0 +1,25 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Benchmarks'))
+
+from benchmark_builder import BuilderBenchmark
+
+
+def returnResults(end_to_end_ms: float, resolution_ms: float) -> dict:
+    return {'scenarios': {'small': {'end_to_end_ms': {'cold': {'median': end_to_end_ms}},
+                                    'phases_ms': {'resolution': resolution_ms}}}}
+
+
+def test_compare_results_ignores_noise_of_short_times():
+    comparison = BuilderBenchmark.compareResults(returnResults(1.02, 0.020), returnResults(1.0, 0.014), 0.1,
+                                                 compare_phases=True)
+
+    assert [entry[0] for entry in comparison] == ['small.end_to_end.cold', 'small.phases.resolution']
+    assert not any(entry[4] for entry in comparison)
+
+
+def test_compare_results_reports_regression():
+    comparison = BuilderBenchmark.compareResults(returnResults(2.0, 0.5), returnResults(1.0, 0.1), 0.1)
+
+    assert [(entry[0], entry[4]) for entry in comparison] == [('small.end_to_end.cold', True)]
@@ -0,0 +1,28 @@
+from PyQt5 import QtWidgets
+
+from conftest import returnLayoutWidgets
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder
+
+EX1 = ('EX1_QLabel_And_QLineEdit.xml', '1_QLabel_1_QLineEdit')
+
+
+def test_build_transaction_blocks_signals_until_commit(qt_app, base_object, example_path):
+    target_widget = QtWidgets.QWidget()
+    target_layout = QtWidgets.QVBoxLayout(target_widget)
+    target_widget.show()
+
+    with PyQT5_GUI_Builder.buildTransaction(target_widget) as transaction:
+        for _ in range(3):
+            gui_layout = PyQT5_GUI_Builder.returnGuiLayout(example_path(EX1[0]), EX1[1], base_object)
+            target_layout.addLayout(gui_layout)
+            qt_app.processEvents()
+        assert gui_layout.itemAt(0).widget().signalsBlocked()
+        assert not target_widget.updatesEnabled()
+
+    stats = transaction.stats
+    assert stats['objects_blocked'] == 3 * (1 + len(returnLayoutWidgets(gui_layout)))
+    assert stats['visible_layout_requests_avoided'] <= stats['layout_requests_avoided']
+    assert stats['relayouts'] == 1
+    assert not gui_layout.itemAt(0).widget().signalsBlocked()
+    assert target_widget.updatesEnabled()
+    assert PyQT5_GUI_Builder.returnBuildTransaction() is None
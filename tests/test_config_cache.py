@@ -0,0 +1,84 @@
+import os
+
+from conftest import writeConfig, returnLabelNode
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder, ParsedConfigCache, LayoutCodeGenerator
+
+LAYOUT = ('<layout name="layout"><components><component type="self" module_id="0" class_id="3"/>{0}'
+          '</components></layout>').format(returnLabelNode('label', 'A'))
+
+
+def writeIncludingConfig(config_filepath: str, included_name: str) -> str:
+    """
+    Writes XML config file whose 'common' node only includes given file.
+
+    :param config_filepath: String path of XML file to be written.
+    :param included_name: Name of the included file - in the same directory.
+    :return: String path of written file.
+    """
+    with open(config_filepath, 'w', encoding='utf-8') as config_file:
+        config_file.write('<body><common><include file="' + included_name + '"/></common><layouts>' + LAYOUT +
+                          '</layouts></body>')
+
+    return str(config_filepath)
+
+
+def test_cache_hits_misses_and_evictions(qt_app, tmp_path):
+    config_cache = ParsedConfigCache(2)
+    config_filepaths = [writeConfig(tmp_path / (name + '.xml'), LAYOUT) for name in ('first', 'second', 'third')]
+
+    first_config = config_cache.returnParsedConfig(config_filepaths[0], PyQT5_GUI_Builder.loadParsedConfig)
+    config_cache.returnParsedConfig(config_filepaths[1], PyQT5_GUI_Builder.loadParsedConfig)
+    assert config_cache.returnParsedConfig(config_filepaths[0], PyQT5_GUI_Builder.loadParsedConfig) is first_config
+    assert (config_cache.stats['hits'], config_cache.stats['misses']) == (1, 2)
+
+    # The least recently used file (the second one) is evicted.
+    config_cache.returnParsedConfig(config_filepaths[2], PyQT5_GUI_Builder.loadParsedConfig)
+    assert (config_cache.stats['evictions'], config_cache.stats['size']) == (1, 2)
+    assert config_cache.returnParsedConfig(config_filepaths[0], PyQT5_GUI_Builder.loadParsedConfig) is first_config
+    config_cache.returnParsedConfig(config_filepaths[1], PyQT5_GUI_Builder.loadParsedConfig)
+    assert (config_cache.stats['hits'], config_cache.stats['misses']) == (2, 4)
+
+
+def test_cache_is_invalidated_by_mtime_and_size(qt_app, tmp_path):
+    config_cache = ParsedConfigCache()
+    config_filepath = writeConfig(tmp_path / 'changed.xml', LAYOUT)
+    parsed_config = config_cache.returnParsedConfig(config_filepath, PyQT5_GUI_Builder.loadParsedConfig)
+
+    # The same size - only modification time differs.
+    file_stat = os.stat(config_filepath)
+    os.utime(config_filepath, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000000))
+    mtime_config = config_cache.returnParsedConfig(config_filepath, PyQT5_GUI_Builder.loadParsedConfig)
+    assert mtime_config is not parsed_config
+
+    # The same modification time - only size differs.
+    file_stat = os.stat(config_filepath)
+    with open(config_filepath, 'a', encoding='utf-8') as config_file:
+        config_file.write('\n')
+    os.utime(config_filepath, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+    assert config_cache.returnParsedConfig(config_filepath, PyQT5_GUI_Builder.loadParsedConfig) is not mtime_config
+    assert config_cache.stats['misses'] == 3
+
+
+def test_evicted_file_is_removed_from_dependencies(qt_app, tmp_path):
+    config_cache = ParsedConfigCache(1)
+    shared_filepath = writeConfig(tmp_path / 'shared.xml', '')
+    config_filepath = writeIncludingConfig(str(tmp_path / 'including.xml'), 'shared.xml')
+
+    config_cache.returnParsedConfig(config_filepath, PyQT5_GUI_Builder.loadParsedConfig)
+    assert config_cache.returnDependents(shared_filepath) == {os.path.abspath(config_filepath)}
+
+    config_cache.returnParsedConfig(writeConfig(tmp_path / 'other.xml', LAYOUT), PyQT5_GUI_Builder.loadParsedConfig)
+    assert config_cache.returnDependents(shared_filepath) == set()
+
+
+def test_disabled_cache_skips_generated_module(qt_app, base_object, tmp_path, monkeypatch):
+    config_filepath = writeConfig(tmp_path / 'generated.xml', LAYOUT)
+    LayoutCodeGenerator.generateLayoutModule(config_filepath, 'layout')
+    assert LayoutCodeGenerator.returnGeneratedModule(config_filepath, 'layout') is not None
+
+    def failLookup(*args):
+        raise AssertionError('Generated module must not be looked up')
+
+    monkeypatch.setattr(LayoutCodeGenerator, 'returnGeneratedModule', failLookup)
+    gui_layout = PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'layout', base_object, use_cache=False)
+    assert gui_layout.itemAt(0).widget().objectName() == 'label'
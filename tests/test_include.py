@@ -0,0 +1,86 @@
+import os
+
+from conftest import returnLayoutWidgets, writeConfig
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder
+
+LAYOUT = ('<layout name="main"><components><component type="self" module_id="0" class_id="3"/>'
+          '<component type="widget" module_id="0" class_id="{0}"/></components></layout>')
+
+
+def writeIncludingConfig(config_filepath: str, included_names: list, common_data: str = '',
+                         layouts: str = '') -> str:
+    """
+    Writes XML config file whose 'common' node includes given files.
+
+    :param config_filepath: String path of XML file to be written.
+    :param included_names: List of names of the included files - in the same directory.
+    :param common_data: String with own nodes of 'common' node - e.g. 'classes' node.
+    :param layouts: String with 'layout' XML nodes.
+    :return: String path of written file.
+    """
+    previous_mtime_ns = os.stat(config_filepath).st_mtime_ns if os.path.exists(config_filepath) else 0
+    with open(config_filepath, 'w', encoding='utf-8') as config_file:
+        config_file.write('<body><common>' + ''.join('<include file="' + included_name + '"/>'
+                                                     for included_name in included_names) +
+                          common_data + '</common><layouts>' + layouts + '</layouts></body>')
+    mtime_ns = max(os.stat(config_filepath).st_mtime_ns, previous_mtime_ns + 1000000)
+    os.utime(config_filepath, ns=(mtime_ns, mtime_ns))
+
+    return str(config_filepath)
+
+
+def test_included_data_is_shared(qt_app, tmp_path):
+    shared_filepath = writeConfig(tmp_path / 'shared.xml', '')
+    config_filepath = writeIncludingConfig(str(tmp_path / 'including.xml'), ['shared.xml'])
+
+    parsed_config = PyQT5_GUI_Builder.returnParsedConfig(config_filepath)
+    shared_config = PyQT5_GUI_Builder.returnParsedConfig(shared_filepath)
+    assert parsed_config.included_configs == (shared_config,)
+    assert parsed_config.modules_data is shared_config.modules_data
+    assert parsed_config.classes_data is shared_config.classes_data
+
+
+def test_own_data_takes_precedence(qt_app, base_object, tmp_path):
+    writeConfig(tmp_path / 'shared.xml', '')
+    writeIncludingConfig(str(tmp_path / 'buttons.xml'), list(),
+                         '<classes><class name="QPushButton" id="0"/><class name="QComboBox" id="7"/></classes>')
+    config_filepath = writeIncludingConfig(str(tmp_path / 'including.xml'), ['shared.xml', 'buttons.xml'],
+                                           '<classes><class name="QLineEdit" id="7"/></classes>',
+                                           LAYOUT.format(0) + LAYOUT.format(7).replace('"main"', '"own"'))
+
+    parsed_config = PyQT5_GUI_Builder.returnParsedConfig(config_filepath)
+    # Later included files override the earlier ones, own entries override all of them.
+    assert (parsed_config.classes_data['0'], parsed_config.classes_data['7'], parsed_config.classes_data['3']) == \
+        ('QPushButton', 'QLineEdit', 'QVBoxLayout')
+    assert parsed_config.modules_data == {'0': 'PyQt5.QtWidgets'}
+    assert returnLayoutWidgets(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'main', base_object)) == \
+        [('QPushButton', '')]
+    assert returnLayoutWidgets(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'own', base_object)) == \
+        [('QLineEdit', '')]
+
+
+def test_changed_included_file_invalidates_dependents(qt_app, base_object, tmp_path):
+    shared_filepath = writeConfig(tmp_path / 'shared.xml', '')
+    middle_filepath = writeIncludingConfig(str(tmp_path / 'middle.xml'), ['shared.xml'])
+    config_filepath = writeIncludingConfig(str(tmp_path / 'including.xml'), ['middle.xml'], '', LAYOUT.format(0))
+
+    parsed_config = PyQT5_GUI_Builder.returnParsedConfig(config_filepath)
+    middle_config = PyQT5_GUI_Builder.returnParsedConfig(middle_filepath)
+    assert set(parsed_config.dependencies) == {os.path.abspath(shared_filepath), os.path.abspath(middle_filepath)}
+    assert PyQT5_GUI_Builder.config_cache.returnDependents(shared_filepath) == \
+        {os.path.abspath(middle_filepath), os.path.abspath(config_filepath)}
+    assert returnLayoutWidgets(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'main', base_object)) == \
+        [('QLabel', '')]
+
+    # Class of id 0 is changed in the file included indirectly - both files that include it are parsed again.
+    with open(shared_filepath, 'r', encoding='utf-8') as shared_file:
+        shared_content = shared_file.read()
+    writeIncludingConfig(shared_filepath, list(), shared_content[shared_content.index('<modules>'):
+                                                                 shared_content.index('</common>')]
+                         .replace('name="QLabel"', 'name="QPushButton"'))
+
+    new_config = PyQT5_GUI_Builder.returnParsedConfig(config_filepath)
+    assert new_config is not parsed_config
+    assert new_config.included_configs[0] is not middle_config
+    assert returnLayoutWidgets(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'main', base_object)) == \
+        [('QPushButton', '')]
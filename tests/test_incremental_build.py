@@ -0,0 +1,84 @@
+import sys
+
+from conftest import processEventsUntil, returnLayoutWidgets
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder
+
+EX4 = ('EX4_Repeated_Rows_Of_QLabel_And_QLineEdit.xml', 'Repeated_Rows_Of_QLabel_QLineEdit')
+
+
+FORM_FIELDS = [{'label': 'Name', 'field': 'name'}, {'label': 'Email', 'field': 'email'},
+               {'label': 'Phone', 'field': 'phone'}]
+
+
+class OneShotItemsObject:
+    """
+    Base object whose 'form_fields' iterable can be read only once - like generator.
+    """
+
+    def __init__(self):
+        self.form_fields = iter(FORM_FIELDS)
+
+
+def buildIncremental(config_filepath: str, layout_name: str, base_object, **callbacks):
+    incremental_build = PyQT5_GUI_Builder.returnGuiLayoutIncremental(config_filepath, layout_name, base_object,
+                                                                     **callbacks)
+    while not incremental_build.pump(0.0):
+        pass
+
+    return incremental_build
+
+
+def test_incremental_build_matches_sync_build(qt_app, base_object, example_path):
+    sync_layout = PyQT5_GUI_Builder.returnGuiLayout(example_path(EX4[0]), EX4[1], base_object, use_generated=False)
+    incremental_build = buildIncremental(example_path(EX4[0]), EX4[1], base_object)
+
+    assert incremental_build.done_steps == incremental_build.steps_count
+    assert returnLayoutWidgets(incremental_build.future.result()) == returnLayoutWidgets(sync_layout)
+
+
+def test_incremental_build_reads_one_shot_items_once(qt_app, example_path):
+    sync_layout = PyQT5_GUI_Builder.returnGuiLayout(example_path(EX4[0]), EX4[1], OneShotItemsObject(),
+                                                    use_generated=False)
+    incremental_build = buildIncremental(example_path(EX4[0]), EX4[1], OneShotItemsObject())
+
+    sync_widgets = returnLayoutWidgets(sync_layout)
+    assert len([widget for widget in sync_widgets if widget[0] == 'QLineEdit']) == 5 + len(FORM_FIELDS)
+    assert returnLayoutWidgets(incremental_build.future.result()) == sync_widgets
+    assert incremental_build.done_steps == incremental_build.steps_count
+
+
+def test_incremental_build_finishes_when_callback_raises(qt_app, base_object, example_path):
+    def raiseError(*args):
+        raise RuntimeError('callback error')
+
+    incremental_build = PyQT5_GUI_Builder.returnGuiLayoutIncremental(example_path(EX4[0]), EX4[1], base_object,
+                                                                     finished_callback=raiseError)
+    callback_errors = 0
+    for _ in range(1000):
+        try:
+            if incremental_build.pump(0.0):
+                break
+        except RuntimeError:
+            callback_errors += 1
+
+    assert callback_errors == 1
+    assert incremental_build.done and incremental_build.future.result() is not None
+    assert incremental_build.pump() is True
+
+
+def test_incremental_build_timer_stops_when_callback_raises(qt_app, base_object, example_path, monkeypatch):
+    reported_errors = list()
+    monkeypatch.setattr(sys, 'excepthook', lambda *exc_info: reported_errors.append(exc_info[1]))
+
+    def raiseError(*args):
+        raise RuntimeError('callback error')
+
+    incremental_build = PyQT5_GUI_Builder.returnGuiLayoutIncremental(example_path(EX4[0]), EX4[1], base_object,
+                                                                     progress_callback=raiseError)
+    incremental_build.start(0.0)
+
+    assert processEventsUntil(qt_app, lambda: incremental_build.done)
+    qt_app.processEvents()
+    assert not incremental_build._timer.isActive()
+    assert incremental_build.future.exception() is None
+    assert reported_errors and all(isinstance(error, RuntimeError) for error in reported_errors)
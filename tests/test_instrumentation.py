@@ -0,0 +1,33 @@
+from collections import Counter
+
+import pytest
+
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder, BuildTraceRecorder
+
+EX3 = ('EX3_TwoButtonsWithDifferentMethods.xml', 'Two_buttons_with_different_methods')
+
+
+@pytest.fixture
+def trace_recorder():
+    PyQT5_GUI_Builder.instrumentation = BuildTraceRecorder()
+    yield PyQT5_GUI_Builder.instrumentation
+    PyQT5_GUI_Builder.instrumentation = None
+
+
+def returnEventCounts(trace_recorder: BuildTraceRecorder) -> Counter:
+    return Counter(build_event.category for build_event in trace_recorder.events)
+
+
+def test_xml_and_plan_builds_record_the_same_events(qt_app, base_object, example_path, trace_recorder):
+    PyQT5_GUI_Builder.returnGuiLayout(example_path(EX3[0]), EX3[1], base_object, use_generated=False,
+                                      use_precompiled=False)
+    xml_counts = returnEventCounts(trace_recorder)
+
+    layout_plan = PyQT5_GUI_Builder.compileLayout(example_path(EX3[0]), EX3[1])
+    trace_recorder.clear()
+    layout_plan.build(base_object)
+    plan_counts = returnEventCounts(trace_recorder)
+
+    for category in ('layout', 'component', 'construct', 'feature', 'insert'):
+        assert plan_counts[category] == xml_counts[category] > 0
+    assert plan_counts['plan_build'] == 1
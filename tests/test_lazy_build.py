@@ -0,0 +1,79 @@
+from PyQt5 import QtWidgets
+
+from conftest import writeConfig, returnLabelNode
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder
+
+
+def returnDeferredLayoutNode(layout_name: str) -> str:
+    return ('<layout name="{name}" deferred="true"><components><component type="self" module_id="0" class_id="3"/>'
+            '{label}</components></layout>').format(name=layout_name,
+                                                    label=returnLabelNode(layout_name + '_label', 'X'))
+
+
+def writeLazyConfig(config_filepath) -> str:
+    return writeConfig(config_filepath, (
+        '<layout name="main"><components><component type="self" module_id="0" class_id="3"/>{label}{nested}'
+        '</components></layout>'
+        '<layout name="long"><components><component type="self" module_id="0" class_id="3"/>{labels}{nested_far}'
+        '</components></layout>').format(label=returnLabelNode('label', 'A'), nested=returnDeferredLayoutNode('near'),
+                                         labels=''.join(returnLabelNode('label_' + str(index), 'B')
+                                                        for index in range(60)),
+                                         nested_far=returnDeferredLayoutNode('far')))
+
+
+def processEvents(qt_app, times: int = 5):
+    for _ in range(times):
+        qt_app.processEvents()
+
+
+def test_deferred_layout_built_after_window_is_shown(qt_app, base_object, tmp_path):
+    config_filepath = writeLazyConfig(tmp_path / 'lazy.xml')
+    window = QtWidgets.QWidget()
+    window.setLayout(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'main', base_object, lazy=True))
+    placeholder = window.findChild(QtWidgets.QWidget, 'near')
+
+    window.show()
+    assert not placeholder.is_materialized
+
+    processEvents(qt_app)
+    assert placeholder.is_materialized
+    assert window.findChild(QtWidgets.QLabel, 'near_label') is not None
+
+
+def test_deferred_layout_built_when_scrolled_into_view(qt_app, base_object, tmp_path):
+    config_filepath = writeLazyConfig(tmp_path / 'lazy.xml')
+    content_widget = QtWidgets.QWidget()
+    content_widget.setLayout(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'long', base_object, lazy=True))
+    scroll_area = QtWidgets.QScrollArea()
+    scroll_area.setWidget(content_widget)
+    scroll_area.resize(200, 200)
+    placeholder = content_widget.findChild(QtWidgets.QWidget, 'far')
+
+    scroll_area.show()
+    processEvents(qt_app)
+    assert not placeholder.is_materialized
+
+    scroll_area.verticalScrollBar().setValue(scroll_area.verticalScrollBar().maximum())
+    processEvents(qt_app)
+    assert placeholder.is_materialized
+
+
+def test_deferred_layout_on_hidden_stacked_page(qt_app, base_object, tmp_path):
+    config_filepath = writeLazyConfig(tmp_path / 'lazy.xml')
+    layout_plan = PyQT5_GUI_Builder.compileLayout(config_filepath, 'main')
+    stacked_widget = QtWidgets.QStackedWidget()
+    pages = list()
+    for _ in range(2):
+        page = QtWidgets.QWidget()
+        page.setLayout(layout_plan.build(base_object, True))
+        stacked_widget.addWidget(page)
+        pages.append(page.findChild(QtWidgets.QWidget, 'near'))
+
+    stacked_widget.show()
+    processEvents(qt_app)
+    assert [placeholder.is_materialized for placeholder in pages] == [True, False]
+
+    stacked_widget.setCurrentIndex(1)
+    processEvents(qt_app)
+    assert pages[1].is_materialized
+    assert pages[1].materialize() is pages[1].built_layout
@@ -0,0 +1,66 @@
+from conftest import processEventsUntil, writeConfig, returnLabelNode
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder
+
+GRID_LAYOUT = ('<layout name="grid" id="0"><components>'
+               '<component type="self" module_id="0" class_id="4"/>{labels}</components></layout>')
+
+
+def test_live_reload_patches_changed_text(qt_app, base_object, tmp_path):
+    first_node = returnLabelNode('first', 'A', 'row="0" column="0"')
+    config_filepath = writeConfig(tmp_path / 'live.xml', GRID_LAYOUT.format(
+        labels=first_node + returnLabelNode('second', 'B', 'row="1" column="0"')))
+    live_reloader = PyQT5_GUI_Builder.returnLiveGuiLayout(config_filepath, 'grid', base_object, watch=False)
+    first_label = live_reloader.gui_layout.itemAt(0).widget()
+
+    writeConfig(config_filepath, GRID_LAYOUT.format(
+        labels=first_node + returnLabelNode('second', 'C', 'row="1" column="0"')))
+    stats = live_reloader.reload()
+
+    assert stats['created'] == 1 and stats['kept'] == 1
+    assert live_reloader.gui_layout.itemAt(0).widget() is first_label
+    assert live_reloader.gui_layout.itemAt(1).widget().text() == 'C'
+
+
+def test_live_reload_moves_component(qt_app, base_object, tmp_path):
+    config_filepath = writeConfig(tmp_path / 'live.xml', GRID_LAYOUT.format(
+        labels=returnLabelNode('moved', 'A', 'row="0" column="0"')))
+    live_reloader = PyQT5_GUI_Builder.returnLiveGuiLayout(config_filepath, 'grid', base_object, watch=False)
+    label = live_reloader.gui_layout.itemAt(0).widget()
+
+    writeConfig(config_filepath, GRID_LAYOUT.format(labels=returnLabelNode('moved', 'A', 'row="2" column="0"')))
+    stats = live_reloader.reload()
+
+    assert (stats['reinserted'], stats['kept'], stats['refeatured'], stats['created']) == (1, 1, 0, 0)
+    gui_layout = live_reloader.gui_layout
+    assert gui_layout.itemAt(0).widget() is label
+    assert gui_layout.getItemPosition(0)[:2] == (2, 0)
+
+
+def test_live_reload_watches_file(qt_app, base_object, tmp_path):
+    config_filepath = writeConfig(tmp_path / 'live.xml', GRID_LAYOUT.format(
+        labels=returnLabelNode('watched', 'A', 'row="0" column="0"')))
+    live_reloader = PyQT5_GUI_Builder.returnLiveGuiLayout(config_filepath, 'grid', base_object)
+    reloads = list()
+    live_reloader.reloaded.connect(reloads.append)
+
+    writeConfig(config_filepath, GRID_LAYOUT.format(labels=returnLabelNode('watched', 'B', 'row="0" column="0"')))
+
+    assert processEventsUntil(qt_app, lambda: bool(reloads))
+    assert live_reloader.gui_layout.itemAt(0).widget().text() == 'B'
+
+
+def test_live_reload_adds_feature(qt_app, base_object, tmp_path):
+    label_node = returnLabelNode('featured', 'A', 'row="0" column="0"')
+    config_filepath = writeConfig(tmp_path / 'live.xml', GRID_LAYOUT.format(labels=label_node))
+    live_reloader = PyQT5_GUI_Builder.returnLiveGuiLayout(config_filepath, 'grid', base_object, watch=False)
+    label = live_reloader.gui_layout.itemAt(0).widget()
+
+    writeConfig(config_filepath, GRID_LAYOUT.format(labels=label_node.replace('</component>', (
+        '<features><feature><feature_args><arg value="Tip" type="str" kind="unnamed"/></feature_args>'
+        '<setting_attributes><component_attr parent_type_id="0" name="setToolTip"/></setting_attributes>'
+        '</feature></features></component>'))))
+    stats = live_reloader.reload()
+
+    assert (stats['refeatured'], stats['kept'], stats['created'], stats['reinserted']) == (1, 0, 0, 0)
+    assert live_reloader.gui_layout.itemAt(0).widget() is label
+    assert label.toolTip() == 'Tip'
@@ -0,0 +1,70 @@
+from PyQt5 import QtWidgets
+
+from conftest import ExampleBaseObject
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder
+
+EXAMPLES = (('EX1_QLabel_And_QLineEdit.xml', '1_QLabel_1_QLineEdit'),
+            ('EX2_2_Rows_Of_QLabel_And_QLineEdit.xml', '2_Rows_Of_QLabel_QLineEdit'),
+            ('EX3_TwoButtonsWithDifferentMethods.xml', 'Two_buttons_with_different_methods'),
+            ('EX4_Repeated_Rows_Of_QLabel_And_QLineEdit.xml', 'Repeated_Rows_Of_QLabel_QLineEdit'),
+            ('EX5_Included_Common_Section.xml', 'Form_From_Shared_Template'))
+
+
+class RecordingBaseObject(ExampleBaseObject):
+    """
+    Base object that records the calls of its connected method.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def print_msg_method(self):
+        self.calls += 1
+
+
+def returnLayoutTree(gui_layout) -> tuple:
+    """
+    Returns comparable description of given layout - its class and the class, object name, text, placement and
+    number of 'clicked' receivers of every widget (nested layouts are described recursively).
+
+    :param gui_layout: QLayout object.
+    :return: Tuple - ( class name, list of descriptions of layout's items ).
+    """
+    items = list()
+    for item_index in range(gui_layout.count()):
+        layout_item = gui_layout.itemAt(item_index)
+        placement = (gui_layout.getItemPosition(item_index) if isinstance(gui_layout, QtWidgets.QGridLayout)
+                     else None)
+        widget = layout_item.widget()
+        if widget is not None:
+            items.append((type(widget).__name__, widget.objectName(),
+                          widget.text() if hasattr(widget, 'text') else None, placement,
+                          widget.receivers(widget.clicked) if isinstance(widget, QtWidgets.QAbstractButton) else 0))
+        elif layout_item.layout() is not None:
+            items.append((returnLayoutTree(layout_item.layout()), placement))
+
+    return type(gui_layout).__name__, items
+
+
+def test_plan_build_matches_xml_build(qt_app, example_path):
+    for file_name, layout_name in EXAMPLES:
+        config_filepath = example_path(file_name)
+        parsed_config = PyQT5_GUI_Builder.returnParsedConfig(config_filepath)
+        xml_base_object, plan_base_object = RecordingBaseObject(), RecordingBaseObject()
+
+        xml_layout = PyQT5_GUI_Builder.buildGuiLayout(parsed_config.returnLayoutNode(layout_name),
+                                                      parsed_config.modules_data, parsed_config.classes_data,
+                                                      xml_base_object)
+        plan_layout = PyQT5_GUI_Builder.compileLayout(config_filepath, layout_name).build(plan_base_object)
+
+        assert returnLayoutTree(plan_layout) == returnLayoutTree(xml_layout)
+
+
+def test_plan_build_connects_base_object(qt_app, example_path):
+    config_filepath = example_path(EXAMPLES[2][0])
+    base_object = RecordingBaseObject()
+    plan_layout = PyQT5_GUI_Builder.compileLayout(config_filepath, EXAMPLES[2][1]).build(base_object)
+
+    plan_layout.itemAt(1).widget().click()
+    assert plan_layout.itemAt(1).widget().objectName() == 'myButton_2'
+    assert base_object.calls == 1
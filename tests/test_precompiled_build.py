@@ -0,0 +1,181 @@
+import json
+import os
+import shutil
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from conftest import returnLayoutWidgets, writeConfig, returnLabelNode, SETTINGS_DIR
+from PyQT5_GUI_Builder import (PyQT5_GUI_Builder, LayoutPrecompiler, BinaryConfigWriter, BinaryConfigReader,
+                               LayoutCodeGenerator)
+
+EXAMPLES = (('EX1_QLabel_And_QLineEdit.xml', '1_QLabel_1_QLineEdit'),
+            ('EX2_2_Rows_Of_QLabel_And_QLineEdit.xml', '2_Rows_Of_QLabel_QLineEdit'),
+            ('EX3_TwoButtonsWithDifferentMethods.xml', 'Two_buttons_with_different_methods'),
+            ('EX4_Repeated_Rows_Of_QLabel_And_QLineEdit.xml', 'Repeated_Rows_Of_QLabel_QLineEdit'),
+            ('EX5_Included_Common_Section.xml', 'Form_From_Shared_Template'))
+LAYOUT = ('<layout name="layout"><components><component type="self" module_id="0" class_id="3"/>{0}'
+          '</components></layout>')
+
+
+def copyExamples(target_dir) -> str:
+    settings_dir = os.path.join(str(target_dir), 'Settings')
+    shutil.copytree(SETTINGS_DIR, settings_dir)
+    return settings_dir
+
+
+def test_precompiled_artifacts_match_xml_build(qt_app, base_object, tmp_path):
+    settings_dir = copyExamples(tmp_path)
+    for file_name, layout_name in EXAMPLES:
+        config_filepath = os.path.join(settings_dir, file_name)
+        result = LayoutPrecompiler.precompileConfig(config_filepath)
+        assert not result['errors']
+
+        layout_plan = LayoutPrecompiler.returnPrecompiledPlan(config_filepath, layout_name)
+        assert layout_plan is not None
+        # 'repeat' nodes are XML elements - so the specs are compared through their data.
+        spec_data = LayoutPrecompiler.returnLayoutSpecData(layout_plan.layout_spec)
+        assert LayoutPrecompiler.returnLayoutSpecData(LayoutPrecompiler.returnLayoutSpecFromData(spec_data)) == \
+            spec_data
+        assert returnLayoutWidgets(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, layout_name, base_object)) == \
+            returnLayoutWidgets(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, layout_name, base_object,
+                                                                  use_generated=False, use_precompiled=False))
+
+
+def test_precompiled_artifact_holds_data_only(qt_app, tmp_path):
+    settings_dir = copyExamples(tmp_path)
+    config_filepath = os.path.join(settings_dir, EXAMPLES[3][0])
+    LayoutPrecompiler.precompileConfig(config_filepath)
+    artifact_path = LayoutPrecompiler.returnArtifactPath(config_filepath, EXAMPLES[3][1])
+
+    with open(artifact_path, 'r', encoding='utf-8') as artifact_file:
+        header, spec_data = [json.loads(line) for line in artifact_file]
+    assert header[2] == EXAMPLES[3][1]
+    assert spec_data[0] == LayoutPrecompiler.TAG_LAYOUT
+
+    # Damaged artifact is ignored - the layout is built from XML file.
+    LayoutPrecompiler.clear()
+    with open(artifact_path, 'w', encoding='utf-8') as artifact_file:
+        artifact_file.write('not an artifact')
+    assert LayoutPrecompiler.returnPrecompiledPlan(config_filepath, EXAMPLES[3][1]) is None
+
+
+def test_binary_config_matches_xml_build(qt_app, base_object, tmp_path):
+    settings_dir = copyExamples(tmp_path)
+    for file_name, layout_name in EXAMPLES:
+        config_filepath = os.path.join(settings_dir, file_name)
+        binary_path = BinaryConfigWriter.writeConfig(config_filepath)
+
+        assert returnLayoutWidgets(PyQT5_GUI_Builder.returnGuiLayout(binary_path, layout_name, base_object)) == \
+            returnLayoutWidgets(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, layout_name, base_object,
+                                                                  use_generated=False, use_precompiled=False))
+
+
+def test_generated_module_matches_xml_build(qt_app, base_object, tmp_path):
+    settings_dir = copyExamples(tmp_path)
+    for file_name, layout_name in EXAMPLES[:3]:
+        config_filepath = os.path.join(settings_dir, file_name)
+        LayoutCodeGenerator.generateLayoutModule(config_filepath, layout_name)
+        generated_module = LayoutCodeGenerator.returnGeneratedModule(config_filepath, layout_name)
+
+        assert returnLayoutWidgets(generated_module.buildLayout(base_object)) == \
+            returnLayoutWidgets(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, layout_name, base_object,
+                                                                  use_generated=False, use_precompiled=False))
+
+
+def test_stale_generated_module_is_not_used(qt_app, base_object, tmp_path):
+    config_filepath = writeConfig(tmp_path / 'stale.xml', LAYOUT.format(returnLabelNode('label', 'A')))
+    LayoutCodeGenerator.generateLayoutModule(config_filepath, 'layout')
+    assert LayoutCodeGenerator.returnGeneratedModule(config_filepath, 'layout') is not None
+
+    # Changed XML file - the module generated from its previous version is not used.
+    writeConfig(config_filepath, LAYOUT.format(returnLabelNode('changed_label', 'B')))
+    assert LayoutCodeGenerator.returnGeneratedModule(config_filepath, 'layout') is None
+    gui_layout = PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'layout', base_object, use_precompiled=False)
+    assert returnLayoutWidgets(gui_layout) == [('QLabel', 'changed_label')]
+
+    LayoutCodeGenerator.generateLayoutModule(config_filepath, 'layout')
+    generated_module = LayoutCodeGenerator.returnGeneratedModule(config_filepath, 'layout')
+    assert returnLayoutWidgets(generated_module.buildLayout(base_object)) == [('QLabel', 'changed_label')]
+
+
+def test_missing_generated_module_is_remembered(qt_app, tmp_path, monkeypatch):
+    config_filepath = writeConfig(tmp_path / 'missing.xml', LAYOUT.format(returnLabelNode('label', 'A')))
+    assert LayoutCodeGenerator.returnGeneratedModule(config_filepath, 'layout') is None
+
+    def failHashing(*args):
+        raise AssertionError('XML file must not be hashed again')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(LayoutCodeGenerator, 'returnSourceHash', failHashing)
+        assert LayoutCodeGenerator.returnGeneratedModule(config_filepath, 'layout') is None
+
+    # Changed XML file is looked for again.
+    writeConfig(config_filepath, LAYOUT.format(returnLabelNode('label', 'B')))
+    with monkeypatch.context() as patch:
+        patch.setattr(LayoutCodeGenerator, 'returnSourceHash', failHashing)
+        with pytest.raises(AssertionError, match='hashed again'):
+            LayoutCodeGenerator.returnGeneratedModule(config_filepath, 'layout')
+
+
+def test_missing_artifact_is_remembered(qt_app, base_object, tmp_path, monkeypatch):
+    config_filepath = writeConfig(tmp_path / 'missing.xml', LAYOUT.format(returnLabelNode('label', 'A')))
+    assert LayoutPrecompiler.returnPrecompiledPlan(config_filepath, 'layout') is None
+
+    def failLookup(*args):
+        raise AssertionError('Artifact must not be looked for again')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(LayoutPrecompiler, 'returnArtifactPath', failLookup)
+        assert LayoutPrecompiler.returnPrecompiledPlan(config_filepath, 'layout') is None
+
+    # Artifact written by this process is found at once.
+    LayoutPrecompiler.precompileConfig(config_filepath)
+    layout_plan = LayoutPrecompiler.returnPrecompiledPlan(config_filepath, 'layout')
+    assert returnLayoutWidgets(layout_plan.build(base_object)) == [('QLabel', 'label')]
+
+
+def test_binary_reader_of_changed_file_is_replaced(qt_app, tmp_path):
+    settings_dir = copyExamples(tmp_path)
+    config_filepath = os.path.join(settings_dir, EXAMPLES[0][0])
+    binary_path = BinaryConfigWriter.writeConfig(config_filepath)
+    old_reader = BinaryConfigReader.returnReader(binary_path)
+    assert BinaryConfigReader.returnReader(binary_path) is old_reader
+
+    BinaryConfigWriter.writeConfig(config_filepath)
+    mtime_ns = os.stat(binary_path).st_mtime_ns + 1000000
+    os.utime(binary_path, ns=(mtime_ns, mtime_ns))
+    new_reader = BinaryConfigReader.returnReader(binary_path)
+
+    # Replaced reader is not closed - other threads may still decode its layouts.
+    assert new_reader is not old_reader
+    assert old_reader.returnLayoutSpec(EXAMPLES[0][1]) == new_reader.returnLayoutSpec(EXAMPLES[0][1])
+
+
+def returnSpecData(layout_spec) -> list:
+    """
+    Returns comparable data of given LayoutSpec object - XML of 'repeat' nodes is normalized (without the whitespace
+    that follows the node in its file).
+
+    :param layout_spec: LayoutSpec object.
+    :return: List returned by 'LayoutPrecompiler.returnLayoutSpecData' method.
+    """
+    def normalizeData(layout_data):
+        for component_data in layout_data[3]:
+            if component_data[0] == LayoutPrecompiler.TAG_LAYOUT:
+                normalizeData(component_data)
+            elif component_data[0] == LayoutPrecompiler.TAG_REPEAT:
+                component_data[1] = ET.tostring(ET.fromstring(component_data[1]), encoding='unicode')
+        return layout_data
+
+    return normalizeData(LayoutPrecompiler.returnLayoutSpecData(layout_spec))
+
+
+def test_binary_config_round_trip(qt_app, tmp_path):
+    settings_dir = copyExamples(tmp_path)
+    for file_name, layout_name in EXAMPLES:
+        config_filepath = os.path.join(settings_dir, file_name)
+        binary_path = BinaryConfigWriter.writeConfig(config_filepath)
+
+        assert returnSpecData(BinaryConfigReader.returnReader(binary_path).returnLayoutSpec(layout_name)) == \
+            returnSpecData(PyQT5_GUI_Builder.compileLayout(config_filepath, layout_name).layout_spec)
@@ -0,0 +1,105 @@
+import pytest
+
+from conftest import returnLayoutWidgets, writeConfig, returnLabelNode
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder, LayoutBuildError
+
+
+def writeRepeatConfig(config_filepath: str, components: str, templates: str = '') -> str:
+    """
+    Writes XML config file with layout named 'main' and given templates.
+
+    :param config_filepath: String path of XML file to be written.
+    :param components: String with the components of the layout - e.g. 'repeat' XML nodes.
+    :param templates: String with 'template' XML nodes.
+    :return: String path of written file.
+    """
+    writeConfig(config_filepath, '<layout name="main"><components><component type="self" module_id="0" class_id="3"/>'
+                                 + components + '</components></layout>')
+    with open(config_filepath, 'r', encoding='utf-8') as config_file:
+        config_content = config_file.read()
+    with open(config_filepath, 'w', encoding='utf-8') as config_file:
+        config_file.write(config_content.replace('</classes>', '</classes><templates>' + templates + '</templates>'))
+
+    return str(config_filepath)
+
+
+def returnBuiltNames(config_filepath: str, base_object) -> list:
+    """
+    Builds layout 'main' from XML nodes and by compiled plan - both builds must give the same widgets.
+
+    :param config_filepath: String path of XML config file.
+    :param base_object: Reference to the base object of the build.
+    :return: List of object names of the widgets.
+    """
+    xml_widgets = returnLayoutWidgets(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'main', base_object,
+                                                                        use_generated=False, use_precompiled=False))
+    plan_widgets = returnLayoutWidgets(PyQT5_GUI_Builder.compileLayout(config_filepath, 'main').build(base_object))
+    assert plan_widgets == xml_widgets
+
+    return [object_name for _, object_name in xml_widgets]
+
+
+def test_repeat_count_and_start(qt_app, base_object, tmp_path):
+    config_filepath = writeRepeatConfig(str(tmp_path / 'count.xml'), (
+        '<repeat count="3" start="2">' + returnLabelNode('label_$index', '$index') + '</repeat>'
+        '<repeat count="2" index_name="row">' + returnLabelNode('row_$row', '$row') + '</repeat>'))
+
+    assert returnBuiltNames(config_filepath, base_object) == ['label_2', 'label_3', 'label_4', 'row_0', 'row_1']
+
+
+def test_repeat_items_of_base_object(qt_app, base_object, tmp_path):
+    config_filepath = writeRepeatConfig(str(tmp_path / 'items.xml'), (
+        '<repeat items="form_fields" parent_type_id="2" start="1">' +
+        returnLabelNode('label_${field}_$index', '$label') + '</repeat>'
+        '<repeat items="form_fields" parent_type_id="2" item_name="field_data">' +
+        returnLabelNode('whole_$index', '$field_data') + '</repeat>'))
+
+    assert returnBuiltNames(config_filepath, base_object) == ['label_name_1', 'label_email_2', 'whole_0', 'whole_1']
+
+    base_object.form_fields = [{'label': 'Phone', 'field': 'phone'}]
+    assert returnBuiltNames(config_filepath, base_object) == ['label_phone_1', 'whole_0']
+
+
+def test_nested_templates_are_inlined_once(qt_app, base_object, tmp_path):
+    config_filepath = writeRepeatConfig(
+        str(tmp_path / 'nested.xml'),
+        '<repeat template="outer" count="2"/><repeat template="outer" count="1" start="5"/>',
+        '<template name="inner">' + returnLabelNode('label_$index', 'A') + '</template>'
+        '<template name="outer"><repeat template="inner" count="1"/></template>')
+
+    # Placeholders of the inner template are filled by the outer 'repeat' node first.
+    assert returnBuiltNames(config_filepath, base_object) == ['label_0', 'label_1', 'label_5']
+
+
+def test_nested_templates_of_included_file_are_inlined_once(qt_app, base_object, tmp_path):
+    writeRepeatConfig(str(tmp_path / 'shared.xml'), '<repeat template="outer" count="1"/>',
+                      '<template name="inner">' + returnLabelNode('label_$index', 'A') + '</template>'
+                      '<template name="outer"><repeat template="inner" count="1"/></template>')
+    config_filepath = str(tmp_path / 'including.xml')
+    with open(config_filepath, 'w', encoding='utf-8') as config_file:
+        config_file.write('<body><common><include file="shared.xml"/></common><layouts><layout name="main"><components>'
+                          '<component type="self" module_id="0" class_id="3"/><repeat template="outer" count="2"/>'
+                          '</components></layout></layouts></body>')
+
+    assert returnBuiltNames(config_filepath, base_object) == ['label_0', 'label_1']
+
+
+@pytest.mark.parametrize('templates', [
+    '<template name="self"><repeat template="self" count="1"/></template>',
+    '<template name="first"><repeat template="second" count="1"/></template>'
+    '<template name="second"><repeat template="first" count="1"/></template>'])
+def test_circular_templates(qt_app, tmp_path, templates):
+    template_name = 'self' if 'name="self"' in templates else 'first'
+    config_filepath = writeRepeatConfig(str(tmp_path / 'circular.xml'),
+                                        '<repeat template="' + template_name + '" count="1"/>', templates)
+
+    with pytest.raises(LayoutBuildError, match='Circular template reference'):
+        PyQT5_GUI_Builder.returnParsedConfig(config_filepath)
+
+
+def test_unknown_template(qt_app, tmp_path):
+    config_filepath = writeRepeatConfig(str(tmp_path / 'unknown.xml'), '<repeat template="missing" count="1"/>',
+                                        '<template name="known">' + returnLabelNode('label', 'A') + '</template>')
+
+    with pytest.raises(LayoutBuildError, match='Unknown template "missing"'):
+        PyQT5_GUI_Builder.returnParsedConfig(config_filepath)
@@ -0,0 +1,117 @@
+import sys
+import types
+
+import pytest
+
+from conftest import returnLayoutWidgets, writeConfig
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder, SymbolResolver
+
+MODULE_NAME = 'symbol_resolver_test_module'
+CONFIG_MODULE_NAME = 'symbol_resolver_config_module'
+EX5 = ('EX5_Included_Common_Section.xml', 'Form_From_Shared_Template')
+
+
+@pytest.fixture
+def test_module():
+    module = types.ModuleType(MODULE_NAME)
+    module.resolved_object = object()
+    sys.modules[MODULE_NAME] = module
+    yield module
+    sys.modules.pop(MODULE_NAME, None)
+
+
+def test_objects_are_memoized(test_module, monkeypatch):
+    symbol_resolver = SymbolResolver()
+    imported_objects = list()
+    import_object = SymbolResolver.importObject
+
+    def recordImport(module_name, object_name):
+        imported_objects.append(object_name)
+        return import_object(module_name, object_name)
+
+    monkeypatch.setattr(SymbolResolver, 'importObject', staticmethod(recordImport))
+    for _ in range(3):
+        assert symbol_resolver.returnObject(MODULE_NAME, 'resolved_object') is test_module.resolved_object
+    assert imported_objects == ['resolved_object']
+
+    # Non-persistent resolver caches the objects only inside the build scope.
+    scoped_resolver = SymbolResolver(persistent=False)
+    with scoped_resolver.buildScope():
+        scoped_resolver.returnObject(MODULE_NAME, 'resolved_object')
+        scoped_resolver.returnObject(MODULE_NAME, 'resolved_object')
+    scoped_resolver.returnObject(MODULE_NAME, 'resolved_object')
+    assert imported_objects == ['resolved_object'] * 3
+
+
+def test_changed_module_is_resolved_again(test_module):
+    symbol_resolver = SymbolResolver()
+    old_object = test_module.resolved_object
+    assert symbol_resolver.returnObject(MODULE_NAME, 'resolved_object') is old_object
+
+    # Memoized object is returned until the module is invalidated.
+    test_module.resolved_object = object()
+    assert symbol_resolver.returnObject(MODULE_NAME, 'resolved_object') is old_object
+    generation = symbol_resolver.generation
+    symbol_resolver.invalidate(MODULE_NAME)
+    assert symbol_resolver.generation == generation + 1
+    assert symbol_resolver.returnObject(MODULE_NAME, 'resolved_object') is test_module.resolved_object
+
+    # Module imported again (a new module object in 'sys.modules') is detected without invalidation.
+    new_module = types.ModuleType(MODULE_NAME)
+    new_module.resolved_object = object()
+    sys.modules[MODULE_NAME] = new_module
+    assert symbol_resolver.returnObject(MODULE_NAME, 'resolved_object') is new_module.resolved_object
+
+
+def test_reloaded_module_is_resolved_again(tmp_path, monkeypatch):
+    module_filepath = tmp_path / (MODULE_NAME + '.py')
+    module_filepath.write_text('VALUE = 1\n', encoding='utf-8')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, MODULE_NAME, raising=False)
+    symbol_resolver = SymbolResolver()
+    assert symbol_resolver.returnObject(MODULE_NAME, 'VALUE') == 1
+
+    # The source has different size - so cached bytecode of the first version is not used.
+    module_filepath.write_text('VALUE = 20\n', encoding='utf-8')
+    symbol_resolver.reloadModule(MODULE_NAME)
+    assert symbol_resolver.returnObject(MODULE_NAME, 'VALUE') == 20
+
+
+def test_base_object_attributes_are_read_once_per_build(qt_app, base_object, example_path):
+    symbol_resolver = SymbolResolver()
+    with symbol_resolver.buildScope():
+        form_fields = symbol_resolver.returnBaseObjectAttribute(base_object, 'form_fields')
+        base_object.form_fields = list()
+        assert symbol_resolver.returnBaseObjectAttribute(base_object, 'form_fields') is form_fields
+    assert symbol_resolver.returnBaseObjectAttribute(base_object, 'form_fields') == list()
+
+    # Changed attribute of base object is used by the next build - also by the cached plan.
+    layout_plan = PyQT5_GUI_Builder.compileLayout(example_path(EX5[0]), EX5[1])
+    base_object.form_fields = [{'label': 'Name', 'field': 'name'}]
+    assert len(returnLayoutWidgets(layout_plan.build(base_object))) == 2
+    base_object.form_fields = [{'label': 'Name', 'field': 'name'}, {'label': 'Phone', 'field': 'phone'}]
+    assert returnLayoutWidgets(layout_plan.build(base_object))[-1] == ('QLineEdit', 'edit_phone')
+
+
+def test_config_modules_are_imported_on_first_resolution(qt_app, base_object, tmp_path, monkeypatch):
+    (tmp_path / (CONFIG_MODULE_NAME + '.py')).write_text('from PyQt5.QtWidgets import QLabel as LazyLabel\n',
+                                                  encoding='utf-8')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, CONFIG_MODULE_NAME, raising=False)
+    config_filepath = writeConfig(tmp_path / 'lazy_module.xml', (
+        '<layout name="main"><components><component type="self" module_id="0" class_id="3"/>'
+        '<component type="widget" module_id="1" class_id="9"/></components></layout>'))
+    with open(config_filepath, 'r', encoding='utf-8') as config_file:
+        config_content = config_file.read()
+    with open(config_filepath, 'w', encoding='utf-8') as config_file:
+        config_file.write(config_content
+                          .replace('</modules>', '<module name="' + CONFIG_MODULE_NAME + '" id="1"/></modules>')
+                          .replace('</classes>', '<class name="LazyLabel" id="9"/></classes>'))
+
+    # Parsing the file does not import its modules.
+    PyQT5_GUI_Builder.returnParsedConfig(config_filepath)
+    assert CONFIG_MODULE_NAME not in sys.modules
+
+    gui_layout = PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'main', base_object)
+    assert returnLayoutWidgets(gui_layout) == [('QLabel', '')]
+    assert CONFIG_MODULE_NAME in dict(PyQT5_GUI_Builder.symbol_resolver.returnImportCosts())
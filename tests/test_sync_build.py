@@ -0,0 +1,143 @@
+import os
+import shutil
+import xml.etree.ElementTree as ET
+
+import pytest
+from PyQt5 import QtWidgets
+
+from conftest import returnLayoutWidgets, writeConfig, returnLabelNode, SETTINGS_DIR, CONFIG_TEMPLATE
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder, LayoutBuildError
+
+EXAMPLES = (('EX1_QLabel_And_QLineEdit.xml', '1_QLabel_1_QLineEdit', ['QLabel', 'QLineEdit']),
+            ('EX2_2_Rows_Of_QLabel_And_QLineEdit.xml', '2_Rows_Of_QLabel_QLineEdit',
+             ['QLabel', 'QLineEdit', 'QLabel', 'QLineEdit']),
+            ('EX3_TwoButtonsWithDifferentMethods.xml', 'Two_buttons_with_different_methods',
+             ['QPushButton', 'QPushButton']))
+
+
+def test_examples_build(qt_app, base_object, example_path):
+    for file_name, layout_name, widget_classes in EXAMPLES:
+        for options in (dict(), dict(use_cache=False, use_generated=False, use_precompiled=False),
+                        dict(streaming=True, use_generated=False)):
+            gui_layout = PyQT5_GUI_Builder.returnGuiLayout(example_path(file_name), layout_name, base_object,
+                                                           **options)
+            assert [class_name for class_name, _ in returnLayoutWidgets(gui_layout)] == widget_classes
+
+
+def test_many_layouts_of_one_file(qt_app, base_object, tmp_path):
+    config_filepath = writeConfig(tmp_path / 'many.xml', ''.join(
+        '<layout name="layout_{0}"><components><component type="self" module_id="0" class_id="3"/>{1}'
+        '</components></layout>'.format(index, returnLabelNode('label_' + str(index), 'A')) for index in range(3)))
+
+    gui_layouts = PyQT5_GUI_Builder.returnGuiLayouts(config_filepath, ['layout_2', 'layout_0'], base_object)
+
+    assert list(gui_layouts) == ['layout_2', 'layout_0']
+    assert returnLayoutWidgets(gui_layouts['layout_0']) == [('QLabel', 'label_0')]
+
+
+def test_wrong_layout_name(qt_app, base_object, example_path):
+    with pytest.raises(ValueError, match='Wrong layout name'):
+        PyQT5_GUI_Builder.returnGuiLayout(example_path(EXAMPLES[0][0]), 'no_such_layout', base_object)
+
+
+def test_included_common_section_is_tracked(qt_app, base_object, tmp_path):
+    settings_dir = str(tmp_path / 'Settings')
+    shutil.copytree(SETTINGS_DIR, settings_dir)
+    config_filepath = os.path.join(settings_dir, 'EX5_Included_Common_Section.xml')
+    shared_filepath = os.path.join(settings_dir, 'Common', 'Shared_Common.xml')
+
+    gui_layout = PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'Form_From_Shared_Template', base_object)
+    assert [class_name for class_name, _ in returnLayoutWidgets(gui_layout)] == ['QLabel', 'QLineEdit'] * 2
+    parsed_config = PyQT5_GUI_Builder.returnParsedConfig(config_filepath)
+    assert PyQT5_GUI_Builder.config_cache.returnDependents(shared_filepath) == {os.path.abspath(config_filepath)}
+
+    # Changed shared file invalidates the file that includes it.
+    with open(shared_filepath, 'a', encoding='utf-8') as shared_file:
+        shared_file.write('\n')
+    assert PyQT5_GUI_Builder.returnParsedConfig(config_filepath) is not parsed_config
+
+
+def test_circular_include(qt_app, tmp_path):
+    for file_name, included_name in (('first.xml', 'second.xml'), ('second.xml', 'first.xml')):
+        with open(str(tmp_path / file_name), 'w', encoding='utf-8') as config_file:
+            config_file.write('<body><common><include file="' + included_name + '"/></common><layouts/></body>')
+
+    with pytest.raises(LayoutBuildError, match='Circular include'):
+        PyQT5_GUI_Builder.returnParsedConfig(str(tmp_path / 'first.xml'))
+
+
+def test_virtual_grid_builds_visible_cells(qt_app, base_object, tmp_path):
+    config_filepath = writeConfig(tmp_path / 'grid.xml', (
+        '<layout name="grid" virtual="true"><components><component type="self" module_id="0" class_id="4"/>{0}'
+        '</components></layout>').format(''.join(
+            returnLabelNode('cell_' + str(row), str(row), 'row="{0}" column="0"'.format(row)) for row in range(500))))
+
+    window = QtWidgets.QWidget()
+    window.setLayout(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'grid', base_object))
+    window.resize(200, 200)
+    window.show()
+    qt_app.processEvents()
+
+    grid_view = window.findChild(QtWidgets.QTableView, 'grid')
+    assert 0 < 500 - grid_view.pending_cells_count < 500
+    assert grid_view.materializeCell(499, 0).objectName() == 'cell_499'
+
+
+def returnLabelLayoutNode(layout_name: str, label_name: str) -> str:
+    """
+    Returns main-level 'layout' XML node with single QLabel.
+
+    :param layout_name: Name of the layout.
+    :param label_name: Object name of the label.
+    :return: String with XML node.
+    """
+    return ('<layout name="{0}"><components><component type="self" module_id="0" class_id="3"/>{1}'
+            '</components></layout>').format(layout_name, returnLabelNode(label_name, 'A'))
+
+
+def test_streaming_stops_after_desired_layout(qt_app, base_object, tmp_path):
+    config_filepath = writeConfig(tmp_path / 'stream.xml', returnLabelLayoutNode('first', 'first_label'))
+    # Damaged end of the file is never read.
+    with open(config_filepath, 'a', encoding='utf-8') as config_file:
+        config_file.write('<not closed node')
+
+    gui_layout = PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'first', base_object, streaming=True,
+                                                   use_generated=False)
+    assert returnLayoutWidgets(gui_layout) == [('QLabel', 'first_label')]
+    with pytest.raises(ET.ParseError):
+        PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'first', base_object, use_cache=False)
+
+
+def test_streaming_uses_first_of_duplicate_layouts(qt_app, base_object, tmp_path):
+    # 'common' node placed after the layouts - reading does not stop before it.
+    config_content = CONFIG_TEMPLATE.format(layouts=''.join([returnLabelLayoutNode('duplicate', 'first_label'),
+                                                             returnLabelLayoutNode('duplicate', 'second_label')]))
+    common_start, common_end = config_content.index('<common>'), config_content.index('</common>') + len('</common>')
+    config_filepath = str(tmp_path / 'duplicate.xml')
+    with open(config_filepath, 'w', encoding='utf-8') as config_file:
+        config_file.write(config_content[:common_start] + config_content[common_end:].replace(
+            '</body>', config_content[common_start:common_end] + '</body>'))
+
+    gui_layout = PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'duplicate', base_object, streaming=True,
+                                                   use_generated=False)
+    assert returnLayoutWidgets(gui_layout) == [('QLabel', 'first_label')]
+
+
+def test_duplicate_layout_names_and_ids(qt_app, base_object, tmp_path):
+    config_filepath = writeConfig(tmp_path / 'duplicates.xml', ''.join([
+        returnLabelLayoutNode('duplicate', 'first_label').replace('<layout ', '<layout id="1" '),
+        returnLabelLayoutNode('duplicate', 'second_label').replace('<layout ', '<layout id="1" '),
+        returnLabelLayoutNode('unique', 'unique_label').replace('<layout ', '<layout id="2" ')]))
+    parsed_config = PyQT5_GUI_Builder.returnParsedConfig(config_filepath)
+
+    with pytest.raises(ValueError, match='Ambiguous layout name'):
+        PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'duplicate', base_object)
+    with pytest.raises(ValueError, match='Ambiguous layout name'):
+        PyQT5_GUI_Builder.returnGuiLayouts(config_filepath, ['unique', 'duplicate'], base_object)
+    with pytest.raises(ValueError, match='Ambiguous layout id'):
+        parsed_config.returnLayoutNodeById('1')
+
+    # Unique layouts of the same file are not affected.
+    assert parsed_config.returnLayoutNodeById('2') is parsed_config.returnLayoutNode('unique')
+    assert returnLayoutWidgets(PyQT5_GUI_Builder.returnGuiLayout(config_filepath, 'unique', base_object)) == \
+        [('QLabel', 'unique_label')]
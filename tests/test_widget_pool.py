@@ -0,0 +1,130 @@
+import pytest
+
+from conftest import returnLayoutWidgets, writeConfig
+from PyQT5_GUI_Builder import PyQT5_GUI_Builder, LayoutCodeGenerator, WidgetPool
+
+EX2 = ('EX2_2_Rows_Of_QLabel_And_QLineEdit.xml', '2_Rows_Of_QLabel_QLineEdit')
+
+
+@pytest.fixture
+def widget_pool():
+    PyQT5_GUI_Builder.widget_pool = WidgetPool(16)
+    yield PyQT5_GUI_Builder.widget_pool
+    PyQT5_GUI_Builder.widget_pool = None
+
+
+def test_widget_pool_recycles_widgets(qt_app, base_object, example_path, widget_pool):
+    first_layout = PyQT5_GUI_Builder.returnGuiLayout(example_path(EX2[0]), EX2[1], base_object)
+    widgets_count = len(returnLayoutWidgets(first_layout))
+    PyQT5_GUI_Builder.releaseGuiLayout(first_layout)
+
+    assert widget_pool.stats['releases'] == widgets_count
+
+    second_layout = PyQT5_GUI_Builder.returnGuiLayout(example_path(EX2[0]), EX2[1], base_object)
+    assert widget_pool.stats['hits'] == widgets_count
+    assert returnLayoutWidgets(second_layout) == returnLayoutWidgets(
+        PyQT5_GUI_Builder.returnGuiLayout(example_path(EX2[0]), EX2[1], base_object))
+
+
+def test_widget_pool_skips_generated_module(qt_app, base_object, example_path, tmp_path, widget_pool):
+    config_filepath = str(tmp_path / 'pooled.xml')
+    with open(example_path(EX2[0]), 'r', encoding='utf-8') as example_file:
+        config_content = example_file.read()
+    with open(config_filepath, 'w', encoding='utf-8') as config_file:
+        config_file.write(config_content)
+    LayoutCodeGenerator.generateLayoutModule(config_filepath, EX2[1])
+    assert LayoutCodeGenerator.returnGeneratedModule(config_filepath, EX2[1]) is not None
+
+    gui_layout = PyQT5_GUI_Builder.returnGuiLayout(config_filepath, EX2[1], base_object)
+    widgets_count = len(returnLayoutWidgets(gui_layout))
+    PyQT5_GUI_Builder.releaseGuiLayout(gui_layout)
+
+    assert widget_pool.stats['releases'] == widgets_count
+
+
+def returnFeatureNode(setting_attr_name: str, arg_node: str) -> str:
+    """
+    Returns 'feature' XML node calling given method of the current object with given argument.
+
+    :param setting_attr_name: Name of the method of the current object.
+    :param arg_node: String with 'arg' XML node.
+    :return: String with XML node.
+    """
+    return ('<feature><feature_args>{arg}</feature_args><setting_attributes>'
+            '<component_attr parent_type_id="0" name="{name}"/>'
+            '</setting_attributes></feature>').format(arg=arg_node, name=setting_attr_name)
+
+
+def writeFeaturesConfig(config_filepath: str) -> str:
+    """
+    Writes XML config file with three layouts - QLineEdit with and without 'setReadOnly' feature and QComboBox with
+    'addItem' feature.
+
+    :param config_filepath: String path of XML file to be written.
+    :return: String path of written file.
+    """
+    layout_node = ('<layout name="{name}" id="0"><components>'
+                   '<component type="self" module_id="0" class_id="3"/>'
+                   '<component type="widget" module_id="0" class_id="{class_id}"><constructor_args>'
+                   '<arg value="widget" type="str" kind="named" arg_name="objectName"/>'
+                   '</constructor_args><features>{features}</features></component>'
+                   '</components></layout>')
+    return writeConfig(config_filepath, ''.join([
+        layout_node.format(name='read_only', class_id=1,
+                           features=returnFeatureNode('setReadOnly', '<arg value="1" type="int" kind="unnamed"/>')),
+        layout_node.format(name='editable', class_id=1, features=''),
+        layout_node.format(name='combo', class_id=5,
+                           features=returnFeatureNode('addItem', '<arg value="item" type="str" kind="unnamed"/>'))]))
+
+
+def buildLayoutWidget(config_filepath: str, layout_name: str, base_object, use_plan: bool):
+    """
+    Builds given layout from XML nodes or by compiled plan.
+
+    :param config_filepath: String path of XML config file.
+    :param layout_name: Name of the layout with single widget.
+    :param base_object: Reference to the base object of the build.
+    :param use_plan: If True, the layout is built by the plan returned by 'compileLayout' method.
+    :return: Tuple - ( built QLayout object, its widget ).
+    """
+    if use_plan:
+        gui_layout = PyQT5_GUI_Builder.compileLayout(config_filepath, layout_name).build(base_object)
+    else:
+        gui_layout = PyQT5_GUI_Builder.returnGuiLayout(config_filepath, layout_name, base_object,
+                                                       use_generated=False, use_precompiled=False)
+
+    return gui_layout, gui_layout.itemAt(0).widget()
+
+
+@pytest.mark.parametrize('use_plan', [False, True])
+def test_widget_pool_does_not_leak_feature_state(qt_app, base_object, tmp_path, widget_pool, use_plan):
+    config_filepath = writeFeaturesConfig(str(tmp_path / 'features.xml'))
+
+    read_only_layout, read_only_edit = buildLayoutWidget(config_filepath, 'read_only', base_object, use_plan)
+    assert read_only_edit.isReadOnly()
+    PyQT5_GUI_Builder.releaseGuiLayout(read_only_layout)
+
+    # Widget with other features is not reused - fresh QLineEdit is editable.
+    _, editable_edit = buildLayoutWidget(config_filepath, 'editable', base_object, use_plan)
+    assert editable_edit is not read_only_edit
+    assert not editable_edit.isReadOnly()
+    assert widget_pool.stats['hits'] == 0
+
+    # Widget with the same features is reused and looks like freshly built one.
+    _, reused_edit = buildLayoutWidget(config_filepath, 'read_only', base_object, use_plan)
+    assert reused_edit is read_only_edit
+    assert widget_pool.stats['hits'] == 1
+    assert (reused_edit.isReadOnly(), reused_edit.objectName(), reused_edit.text()) == (True, 'widget', '')
+
+
+@pytest.mark.parametrize('use_plan', [False, True])
+def test_widget_pool_skips_widgets_with_non_setter_features(qt_app, base_object, tmp_path, widget_pool, use_plan):
+    config_filepath = writeFeaturesConfig(str(tmp_path / 'features.xml'))
+
+    for _ in range(3):
+        combo_layout, combo_box = buildLayoutWidget(config_filepath, 'combo', base_object, use_plan)
+        assert combo_box.count() == 1
+        PyQT5_GUI_Builder.releaseGuiLayout(combo_layout)
+
+    assert widget_pool.stats['hits'] == 0
+    assert widget_pool.stats['size'] == 0